@@ -0,0 +1,169 @@
+import json
+import os
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+WORKDIR = tempfile.mkdtemp(prefix="golf-bench-")
+os.environ["GOLF_PICKS_BACKUP"] = os.path.join(WORKDIR, "picks_backup.json")
+# Background revalidation opens the app database by path.
+os.environ["GOLF_DB_PATH"] = os.path.join(WORKDIR, "cold.db")
+os.environ["GOLF_SHEETS_CACHE_FILE"] = os.path.join(WORKDIR, "sheets_cache.json")
+
+import streamlit_app as app
+
+
+def arg(name: str, default: float) -> float:
+    if name in sys.argv[1:]:
+        return float(sys.argv[sys.argv.index(name) + 1])
+    return default
+
+
+LATENCY = arg("--latency", 0.15)
+OUTAGE_ATTEMPTS = int(arg("--outage-attempts", 6))
+
+
+def fresh_db(name: str):
+    conn = app.open_connection(os.path.join(WORKDIR, name))
+    app.init_db(conn)
+    return conn
+
+
+def requests_since(backend, before: dict) -> dict:
+    return {key: backend.stats[key] - before[key] for key in ("requests", "failures", "bytes_written", "cells_written")}
+
+
+app.set_storage_backend(None)
+source = fresh_db("source.db")
+app.seed_if_needed(source)
+source.commit()
+
+backend = app.FakeSheetsBackend(latency=LATENCY)
+app.set_storage_backend(backend)
+app.reset_sheets_guard()
+before = dict(backend.stats)
+app.write_sheet_deltas(source, list(app.SHEET_EXPORTS))
+full_push = requests_since(backend, before)
+# Record the synced baseline the two-way engine compares against; the cold
+# start below must not find its records on disk.
+app.sync_sheet_tables(source, list(app.ROW_SYNC_TABLES))
+os.remove(os.environ["GOLF_SHEETS_CACHE_FILE"])
+backend.ensure_tabs([app.PICK_EVENTS_SHEET])
+
+# Cold start: a freshly seeded database hydrating every table, with the
+# process-level record cache dropped.
+app.set_storage_backend(backend)
+target = fresh_db("cold.db")
+app.seed_if_needed(target)
+before = dict(backend.stats)
+started = time.perf_counter()
+for hydrate in (app.hydrate_users, app.hydrate_golfers, app.hydrate_picks, app.hydrate_results):
+    hydrate(target)
+cold_start = {
+    "seconds": round(time.perf_counter() - started, 3),
+    **requests_since(backend, before),
+    "picks": target.execute("SELECT COUNT(*) FROM picks").fetchone()[0],
+    "golfers": target.execute("SELECT COUNT(*) FROM golfers").fetchone()[0],
+}
+
+# Warm restart: same database, empty process memory, records served from the
+# disk cache while a background check confirms the revision.
+app.set_storage_backend(backend)
+before = dict(backend.stats)
+started = time.perf_counter()
+for hydrate in (app.hydrate_users, app.hydrate_golfers, app.hydrate_picks, app.hydrate_results):
+    hydrate(target)
+warm_restart = {"seconds": round(time.perf_counter() - started, 3), **requests_since(backend, before)}
+app.SHEETS_CACHE["disk"]["thread"].join()
+warm_restart["revalidation"] = app.SHEETS_CACHE["disk"]["last_result"]
+warm_restart["revalidation_requests"] = backend.stats["requests"] - before["requests"]
+
+# Row sync: one local edit through the two-way engine, then (after the pass
+# that re-reads the tab it just wrote) one with nothing changed on either side.
+golfer = source.execute("SELECT id, fedex_rank FROM golfers ORDER BY id LIMIT 1").fetchone()
+source.execute("UPDATE golfers SET fedex_points = COALESCE(fedex_points, 0) + 1 WHERE id = ?", (golfer["id"],))
+source.commit()
+before = dict(backend.stats)
+app.sync_sheet_tables(source, ["golfers"])
+row_sync = requests_since(backend, before)
+app.sync_sheet_tables(source, list(app.ROW_SYNC_TABLES))
+before = dict(backend.stats)
+app.sync_sheet_tables(source, list(app.ROW_SYNC_TABLES))
+steady_sync = requests_since(backend, before)
+
+# Diff write: one changed golfer against the already-pushed sheet.
+source.execute("UPDATE golfers SET fedex_rank = ? WHERE id = ?", ((golfer["fedex_rank"] or 0) + 1, golfer["id"]))
+source.commit()
+before = dict(backend.stats)
+app.write_sheet_deltas(source, ["golfers"])
+diff_write = requests_since(backend, before)
+
+# Outage: every request fails; the outbox keeps the edit and the breaker
+# stops further calls until the cooldown ends.
+backend.failure_rate = 1.0
+app.reset_sheets_guard()
+source.execute("UPDATE golfers SET fedex_rank = ? WHERE id = ?", (golfer["fedex_rank"], golfer["id"]))
+app.enqueue_sheet_sync(source, ["golfers"])
+source.commit()
+attempts = []
+for _ in range(OUTAGE_ATTEMPTS):
+    source.execute("UPDATE sheets_outbox SET next_attempt_at = NULL")
+    source.commit()
+    started = time.perf_counter()
+    app.flush_outbox(source)
+    attempts.append(round(time.perf_counter() - started, 3))
+guard = app.get_sheets_guard_status()
+outage = {
+    "attempt_seconds": attempts,
+    "breaker_state": guard["state"],
+    "rejected": guard["rejected"],
+    "pending": app.get_outbox_status(source)["pending"],
+    "failed_requests": backend.stats["failures"],
+}
+backend.failure_rate = 0.0
+app.reset_sheets_guard()
+source.execute("UPDATE sheets_outbox SET next_attempt_at = NULL")
+source.commit()
+app.flush_outbox(source)
+outage["pending_after_recovery"] = app.get_outbox_status(source)["pending"]
+
+report = {
+    "recorded_at": datetime.utcnow().isoformat(),
+    "latency_seconds": LATENCY,
+    "full_push": full_push,
+    "cold_start": cold_start,
+    "warm_restart": warm_restart,
+    "diff_write": diff_write,
+    "row_sync": row_sync,
+    "steady_sync": steady_sync,
+    "outage": outage,
+}
+print(f"Simulated request latency: {LATENCY * 1000:.0f} ms")
+print(
+    f"Cold start hydration: {cold_start['seconds']:.2f}s, {cold_start['requests']} request(s), "
+    f"{cold_start['picks']} picks / {cold_start['golfers']} golfers"
+)
+print(
+    f"Warm restart hydration: {warm_restart['seconds']:.2f}s, {warm_restart['requests']} request(s); "
+    f"background revalidation {warm_restart['revalidation']} with {warm_restart['revalidation_requests']} request(s)"
+)
+print(f"Full push: {full_push['cells_written']} cells, {full_push['bytes_written']} bytes")
+print(f"One-row diff write: {diff_write['cells_written']} cells, {diff_write['bytes_written']} bytes")
+print(
+    f"One-row two-way sync: {row_sync['requests']} request(s), {row_sync['cells_written']} cells written; "
+    f"steady state: {steady_sync['requests']} request(s)"
+)
+print(
+    f"Outage: attempts took {', '.join(f'{s:.2f}s' for s in attempts)}; breaker {outage['breaker_state']}, "
+    f"{outage['rejected']} call(s) rejected locally, {outage['pending']} outbox row(s) kept, "
+    f"{outage['pending_after_recovery']} left after recovery"
+)
+
+if "--output" in sys.argv[1:]:
+    output = sys.argv[sys.argv.index("--output") + 1]
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Wrote {output}")
@@ -0,0 +1,63 @@
+import ast
+import os
+import re
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import streamlit_app as app
+
+VERBOSE = "-v" in sys.argv[1:]
+SQL_START = re.compile(r"\s*(SELECT|WITH|UPDATE \w+ SET|DELETE FROM|INSERT (OR \w+ )?INTO|REPLACE INTO)\b")
+
+
+def collect_app_queries(path: str) -> tuple[list[tuple[str, str]], list[tuple[str, str]]]:
+    # Every SQL literal in the app, as (location, sql); f-strings come back as
+    # templates with {} for each placeholder. Migration steps run once per
+    # database, so their dynamic DDL/trigger bodies are not query paths.
+    with open(path, encoding="utf-8") as handle:
+        tree = ast.parse(handle.read())
+    statements, templates = [], []
+
+    def visit(node, function: str) -> None:
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            function = node.name
+        if isinstance(node, ast.Constant) and isinstance(node.value, str) and SQL_START.match(node.value):
+            statements.append((f"line {node.lineno}", node.value))
+        elif isinstance(node, ast.JoinedStr):
+            text = "".join(part.value if isinstance(part, ast.Constant) else "{}" for part in node.values)
+            if SQL_START.match(text) and not function.startswith("migrate_"):
+                templates.append((f"line {node.lineno}", text))
+            return
+        for child in ast.iter_child_nodes(node):
+            visit(child, function)
+
+    visit(tree, "")
+    return statements, templates
+
+
+statements, templates = collect_app_queries(os.path.join(ROOT, "streamlit_app.py"))
+
+with tempfile.TemporaryDirectory() as tmp_dir:
+    conn = app.open_connection(os.path.join(tmp_dir, "golf.db"))
+    app.migrate_db(conn)
+    app.seed_if_needed(conn)
+
+    if VERBOSE:
+        for name, sql, params, _ in app.QUERY_PLAN_CHECKS:
+            print(f"{name}:")
+            for detail in app.explain_query_plan(conn, sql, params):
+                print(f"  {detail}")
+
+    problems = app.check_query_plans(conn, statements, templates)
+    conn.close()
+
+if problems:
+    print("Query plan problems:")
+    for problem in problems:
+        print(f"  {problem}")
+    sys.exit(1)
+
+print(f"All {len(statements)} SQL literals and {len(templates)} SQL templates in the app are index-driven.")
@@ -0,0 +1,63 @@
+import json
+import os
+import subprocess
+import sys
+from datetime import datetime
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SHEETS_MODULES = ("gspread", "google.oauth2", "google.auth")
+RUNS = 3
+
+
+def measure(statement: str) -> dict:
+    env = dict(os.environ)
+    env.pop("GOOGLE_SHEETS_ID", None)
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        cwd=ROOT,
+        env=env,
+        capture_output=True,
+        text=True,
+    )
+    if proc.returncode != 0:
+        raise SystemExit(f"`{statement}` failed:\n{proc.stderr[-2000:]}")
+    modules = {}
+    for line in proc.stderr.splitlines():
+        # import time: self [us] | cumulative | imported package
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        parts = line[len("import time:"):].split("|")
+        try:
+            cumulative = int(parts[1])
+        except ValueError:
+            continue
+        modules[parts[2].strip()] = cumulative
+    return modules
+
+
+def summarize(statement: str, module: str) -> dict:
+    samples = [measure(statement) for _ in range(RUNS)]
+    totals = sorted(sample.get(module, 0) for sample in samples)
+    loaded = sorted(name for name in samples[-1] if name.startswith(SHEETS_MODULES))
+    return {"statement": statement, "median_ms": totals[len(totals) // 2] / 1000, "sheets_modules": loaded}
+
+
+report = {
+    "recorded_at": datetime.utcnow().isoformat(),
+    "python": sys.version.split()[0],
+    "app": summarize("import streamlit_app", "streamlit_app"),
+    "sheets_stack": summarize("import gspread, google.oauth2.service_account", "gspread"),
+}
+print(f"import streamlit_app: {report['app']['median_ms']:.1f} ms (median of {RUNS})")
+print(f"  Sheets modules loaded: {len(report['app']['sheets_modules'])}")
+print(f"import gspread + google auth: {report['sheets_stack']['median_ms']:.1f} ms (median of {RUNS})")
+
+if "--output" in sys.argv[1:]:
+    output = sys.argv[sys.argv.index("--output") + 1]
+    with open(output, "w", encoding="utf-8") as handle:
+        json.dump(report, handle, indent=2)
+    print(f"Wrote {output}")
+
+if "--strict" in sys.argv[1:] and report["app"]["sheets_modules"]:
+    print("Sheets stack is imported eagerly:", ", ".join(report["app"]["sheets_modules"][:5]))
+    sys.exit(1)
@@ -0,0 +1,25 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import streamlit_app as app
+
+app.load_env_file()
+DRY_RUN = "--dry-run" in sys.argv[1:]
+
+conn = app.open_connection(app.get_db_path())
+current = app.get_schema_version(conn)
+pending = app.migrate_db(conn, dry_run=DRY_RUN)
+
+if not pending:
+    print(f"Schema is up to date (version {current}).")
+    sys.exit(0)
+
+for version, description in pending:
+    prefix = "Would apply" if DRY_RUN else "Applied"
+    print(f"{prefix} migration {version}: {description}")
+
+if not DRY_RUN:
+    print(f"Schema migrated from version {current} to {app.get_schema_version(conn)}.")
+conn.close()
@@ -0,0 +1,24 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import streamlit_app as app
+
+app.load_env_file()
+CHECK_ONLY = "--check" in sys.argv[1:]
+
+conn = app.open_connection(app.get_db_path())
+app.migrate_db(conn)
+problems = app.check_standings(conn)
+
+if CHECK_ONLY:
+    for problem in problems:
+        print(problem)
+    print(f"{len(problems)} standings row(s) out of sync.")
+    sys.exit(1 if problems else 0)
+
+app.rebuild_standings(conn)
+conn.commit()
+print(f"Standings rebuilt ({len(problems)} row(s) were out of sync).")
+conn.close()
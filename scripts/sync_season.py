@@ -0,0 +1,32 @@
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import streamlit_app as app
+
+app.load_env_file()
+SEASON = int(sys.argv[sys.argv.index("--season") + 1]) if "--season" in sys.argv[1:] else 2026
+PROVIDER = sys.argv[sys.argv.index("--provider") + 1] if "--provider" in sys.argv[1:] else None
+
+conn = app.open_connection(app.get_db_path())
+app.migrate_db(conn)
+started = time.perf_counter()
+report = app.sync_season_results(conn, SEASON, provider=PROVIDER)
+elapsed = time.perf_counter() - started
+
+width = max((len(row["tournament"]) for row in report), default=10)
+for row in report:
+    status = row["error"] or f"{row['updated']} updated, {row['skipped']} skipped"
+    print(f"{row['tournament']:<{width}}  {row['provider']:<8}  {row['ms']:>8.0f} ms  {status}")
+failed = sum(1 for row in report if row["error"])
+print(
+    f"{len(report)} tournament(s), {sum(row['updated'] for row in report)} results, "
+    f"{failed} failed, {elapsed:.1f}s"
+)
+# Let the outbox push the new results before exiting.
+if app.get_storage_backend() is not None:
+    app.flush_outbox(conn)
+conn.close()
+sys.exit(1 if failed else 0)
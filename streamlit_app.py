@@ -1,37 +1,71 @@
 import os
+import abc
+import atexit
+import queue
 import json
 import hashlib
 import re
+import random
 import sqlite3
 import textwrap
 import time as time_mod
 import base64
+import email.utils
+import functools
+import importlib
+import importlib.util
+import threading
 import unicodedata
+import urllib.parse
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import date, datetime, time, timedelta
 from zoneinfo import ZoneInfo
-from typing import Optional
+from typing import Iterator, Optional
 
 import requests
 from difflib import SequenceMatcher
 
-try:
-    import gspread
-    from google.oauth2 import service_account
-    from gspread.exceptions import APIError
-    SHEETS_AVAILABLE = True
-    SHEETS_LAST_ERROR = None
-except ImportError:
-    gspread = None
-    service_account = None
-    APIError = Exception
-    SHEETS_AVAILABLE = False
-    SHEETS_LAST_ERROR = "gspread not installed"
-SHEETS_CACHE = {
-    "client": None,
-    "client_at": 0.0,
-    "records": {},
-}
+# The Google Sheets stack (gspread, google-auth, their HTTP deps) is only
+# imported by load_sheets_backend() the first time Sheets is actually used.
+gspread = None
+service_account = None
+APIError = Exception
+SHEETS_BACKEND_LOADED = False
+SHEETS_AVAILABLE = importlib.util.find_spec("gspread") is not None
+SHEETS_LAST_ERROR = None if SHEETS_AVAILABLE else "gspread not installed"
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
+
+
+@st.cache_resource(show_spinner=False)
+def get_sheets_cache() -> dict:
+    # Process-wide, so the authorized client, spreadsheet/worksheet handles
+    # and fetched records survive reruns and are shared by all sessions.
+    return {
+        "lock": threading.RLock(),
+        "client": None,
+        "client_at": 0.0,
+        "spreadsheet": None,
+        "worksheets": {},
+        "records": {},
+        "layouts": {},
+        "backend": None,
+        "backend_configured": False,
+        "disk": {
+            "loaded": False,
+            "thread": None,
+            "saved_at": None,
+            "bytes": 0,
+            "tabs": 0,
+            "revalidated_at": None,
+            "last_result": None,
+        },
+    }
+
+
+SHEETS_CACHE = get_sheets_cache()
 
 BDL_BASE = "https://api.balldontlie.io/pga/v1"
 
@@ -192,6 +226,13 @@ def get_picks_backup_path() -> str:
 def get_sheets_id() -> str:
     return os.getenv("GOOGLE_SHEETS_ID", "").strip()
 
+def get_sheets_disk_cache_path() -> str:
+    return os.getenv("GOLF_SHEETS_CACHE_FILE", os.path.join("data", "sheets_cache.json"))
+
+
+def get_http_cache_dir() -> str:
+    return os.getenv("GOLF_HTTP_CACHE_DIR", os.path.join("data", "http_cache"))
+
 
 def normalize_lookup_name(value: str) -> str:
     value = unicodedata.normalize("NFKD", value or "")
@@ -201,7 +242,12 @@ def normalize_lookup_name(value: str) -> str:
     return value
 
 def get_sheets_scopes() -> list:
-    return ["https://www.googleapis.com/auth/spreadsheets"]
+    # Drive metadata is only read for the spreadsheet's modifiedTime, which
+    # lets cached records be revalidated without re-reading every tab.
+    return [
+        "https://www.googleapis.com/auth/spreadsheets",
+        "https://www.googleapis.com/auth/drive.metadata.readonly",
+    ]
 
 
 def get_free_double_pick_tournaments() -> set[str]:
@@ -210,13 +256,32 @@ def get_free_double_pick_tournaments() -> set[str]:
         return set(FREE_DOUBLE_PICK_TOURNAMENTS)
     return {name.strip() for name in configured.split(",") if name.strip()}
 
+def load_sheets_backend() -> bool:
+    global gspread, service_account, APIError, SHEETS_AVAILABLE, SHEETS_LAST_ERROR, SHEETS_BACKEND_LOADED
+    if SHEETS_BACKEND_LOADED or not SHEETS_AVAILABLE:
+        return SHEETS_AVAILABLE
+    try:
+        gspread = importlib.import_module("gspread")
+        service_account = importlib.import_module("google.oauth2.service_account")
+        APIError = importlib.import_module("gspread.exceptions").APIError
+    except ImportError as exc:
+        gspread = None
+        service_account = None
+        APIError = Exception
+        SHEETS_AVAILABLE = False
+        SHEETS_LAST_ERROR = f"gspread not installed ({exc})"
+        return False
+    SHEETS_BACKEND_LOADED = True
+    return True
+
+
 def get_sheets_client():
     global SHEETS_LAST_ERROR
-    if not SHEETS_AVAILABLE:
-        return None
     sheet_id = get_sheets_id()
     if not sheet_id:
         return None
+    if not load_sheets_backend():
+        return None
     info_json = os.getenv("GOOGLE_SERVICE_ACCOUNT_JSON", "").strip()
     info_file = os.getenv("GOOGLE_SERVICE_ACCOUNT_FILE", "").strip()
     info = None
@@ -237,123 +302,819 @@ def get_sheets_client():
         SHEETS_LAST_ERROR = f"{type(exc).__name__}: {exc}"
         return None
 
-def get_cached_sheets_client(ttl_seconds: int = 300):
-    cached = SHEETS_CACHE.get("client")
-    cached_at = SHEETS_CACHE.get("client_at", 0.0)
-    if cached and (time_mod.time() - cached_at) < ttl_seconds:
-        return cached
-    client = get_sheets_client()
-    SHEETS_CACHE["client"] = client
-    SHEETS_CACHE["client_at"] = time_mod.time()
-    return client
+SHEETS_RATE_PER_MINUTE = 60
+SHEETS_RATE_MAX_WAIT_SECONDS = 2.0
+SHEETS_BREAKER_THRESHOLD = 3
+SHEETS_BREAKER_COOLDOWN_SECONDS = 30
+SHEETS_BREAKER_MAX_COOLDOWN_SECONDS = 600
+
+
+class SheetsUnavailableError(RuntimeError):
+    pass
+
+
+@st.cache_resource(show_spinner=False)
+def get_sheets_guard() -> dict:
+    # Token bucket sized to the per-minute Sheets quota, plus a circuit
+    # breaker shared by every session and the outbox worker.
+    per_minute = int(os.getenv("SHEETS_RATE_PER_MINUTE", "") or SHEETS_RATE_PER_MINUTE)
+    return {
+        "lock": threading.Lock(),
+        "capacity": float(per_minute),
+        "refill_per_second": per_minute / 60,
+        "tokens": float(per_minute),
+        "refilled_at": time_mod.monotonic(),
+        "state": "closed",
+        "failures": 0,
+        "opened_at": 0.0,
+        "cooldown": SHEETS_BREAKER_COOLDOWN_SECONDS,
+        "probe_in_flight": False,
+        "calls": 0,
+        "rejected": 0,
+        "throttled": 0,
+        "last_failure": None,
+    }
 
-def clear_sheet_records_cache(sheet_name: str) -> None:
-    records = SHEETS_CACHE.get("records", {})
-    if sheet_name in records:
-        del records[sheet_name]
 
-def get_cached_sheet_records(sheet_name: str, ttl_seconds: int = 120):
-    cached = SHEETS_CACHE.get("records", {}).get(sheet_name)
-    now = time_mod.time()
-    if cached and (now - cached["at"]) < ttl_seconds:
-        return cached["rows"]
-    worksheet = None
-    if sheet_name == "picks":
-        worksheet = get_picks_worksheet()
-    elif sheet_name == "golfers":
-        worksheet = get_golfers_worksheet()
-    elif sheet_name == "results":
-        worksheet = get_results_worksheet()
-    elif sheet_name == "users":
-        worksheet = get_users_worksheet()
-    if not worksheet:
-        return None
+def refill_sheets_tokens(guard: dict) -> None:
+    now = time_mod.monotonic()
+    guard["tokens"] = min(
+        guard["capacity"], guard["tokens"] + (now - guard["refilled_at"]) * guard["refill_per_second"]
+    )
+    guard["refilled_at"] = now
+
+
+def take_sheets_token(guard: dict) -> float:
+    refill_sheets_tokens(guard)
+    if guard["tokens"] >= 1:
+        guard["tokens"] -= 1
+        return 0.0
+    return (1 - guard["tokens"]) / guard["refill_per_second"]
+
+
+def admit_sheets_call(guard: dict) -> None:
+    with guard["lock"]:
+        if guard["state"] == "open":
+            remaining = guard["cooldown"] - (time_mod.monotonic() - guard["opened_at"])
+            if remaining > 0:
+                guard["rejected"] += 1
+                raise SheetsUnavailableError(f"Sheets circuit open, retrying in {remaining:.0f}s")
+            guard["state"] = "half_open"
+        if guard["state"] == "half_open":
+            if guard["probe_in_flight"]:
+                guard["rejected"] += 1
+                raise SheetsUnavailableError("Sheets circuit half-open, probe in progress")
+            guard["probe_in_flight"] = True
+    deadline = time_mod.monotonic() + SHEETS_RATE_MAX_WAIT_SECONDS
+    while True:
+        with guard["lock"]:
+            wait = take_sheets_token(guard)
+            if wait and time_mod.monotonic() + wait > deadline:
+                guard["throttled"] += 1
+                guard["probe_in_flight"] = False
+                raise SheetsUnavailableError("Sheets request budget exhausted for this minute")
+        if not wait:
+            return
+        time_mod.sleep(wait)
+
+
+def record_sheets_outcome(guard: dict, exc: Optional[BaseException]) -> None:
+    with guard["lock"]:
+        guard["probe_in_flight"] = False
+        if exc is None:
+            guard["state"] = "closed"
+            guard["failures"] = 0
+            guard["cooldown"] = SHEETS_BREAKER_COOLDOWN_SECONDS
+            return
+        guard["failures"] += 1
+        guard["last_failure"] = f"{type(exc).__name__}: {exc}"
+        if getattr(getattr(exc, "response", None), "status_code", None) == 429:
+            # Google is already throttling us; stop spending tokens.
+            guard["tokens"] = 0.0
+        if guard["state"] == "half_open":
+            guard["cooldown"] = min(SHEETS_BREAKER_MAX_COOLDOWN_SECONDS, guard["cooldown"] * 2)
+            guard["state"] = "open"
+            guard["opened_at"] = time_mod.monotonic()
+        elif guard["failures"] >= SHEETS_BREAKER_THRESHOLD:
+            guard["state"] = "open"
+            guard["opened_at"] = time_mod.monotonic()
+
+
+def call_sheets(func, *args, **kwargs):
+    guard = get_sheets_guard()
+    admit_sheets_call(guard)
+    record_network_call()
+    guard["calls"] += 1
     try:
-        rows = worksheet.get_all_records()
-    except APIError as exc:
-        global SHEETS_LAST_ERROR
-        SHEETS_LAST_ERROR = f"{type(exc).__name__}: {exc}"
-        return None
-    SHEETS_CACHE.setdefault("records", {})[sheet_name] = {"rows": rows, "at": now}
-    return rows
+        result = func(*args, **kwargs)
+    except Exception as exc:
+        record_sheets_outcome(guard, exc)
+        if isinstance(exc, APIError):
+            raise
+        # Auth refresh and transport failures surface like any other outage.
+        raise SheetsUnavailableError(f"{type(exc).__name__}: {exc}") from exc
+    record_sheets_outcome(guard, None)
+    return result
+
+
+def get_sheets_guard_status() -> dict:
+    guard = get_sheets_guard()
+    with guard["lock"]:
+        refill_sheets_tokens(guard)
+        retry_in = guard["cooldown"] - (time_mod.monotonic() - guard["opened_at"])
+        return {
+            "state": guard["state"],
+            "failures": guard["failures"],
+            "retry_in": max(0.0, retry_in) if guard["state"] == "open" else 0.0,
+            "tokens": int(guard["tokens"]),
+            "capacity": int(guard["capacity"]),
+            "calls": guard["calls"],
+            "rejected": guard["rejected"],
+            "throttled": guard["throttled"],
+            "last_failure": guard["last_failure"],
+        }
+
 
-def get_picks_worksheet():
+def reset_sheets_guard() -> None:
+    guard = get_sheets_guard()
+    with guard["lock"]:
+        guard["state"] = "closed"
+        guard["failures"] = 0
+        guard["cooldown"] = SHEETS_BREAKER_COOLDOWN_SECONDS
+        guard["probe_in_flight"] = False
+
+
+def get_cached_sheets_client(ttl_seconds: int = 300):
+    if not get_sheets_id() or not load_sheets_backend():
+        return None
+    with SHEETS_CACHE["lock"]:
+        cached = SHEETS_CACHE["client"]
+        if cached and (time_mod.time() - SHEETS_CACHE["client_at"]) < ttl_seconds:
+            return cached
+        client = get_sheets_client()
+        SHEETS_CACHE["client"] = client
+        SHEETS_CACHE["client_at"] = time_mod.time()
+        # Handles are bound to the client that opened them.
+        SHEETS_CACHE["spreadsheet"] = None
+        SHEETS_CACHE["worksheets"] = {}
+        return client
+
+
+def get_spreadsheet():
     global SHEETS_LAST_ERROR
     client = get_cached_sheets_client()
-    sheet_id = get_sheets_id()
-    if not client or not sheet_id:
-        return None
-    try:
-        sheet = client.open_by_key(sheet_id)
-        try:
-            worksheet = sheet.worksheet("picks")
-        except gspread.WorksheetNotFound:
-            worksheet = sheet.add_worksheet(title="picks", rows=200, cols=4)
-            worksheet.update(values=[["user", "tournament", "golfer", "created_at"]], range_name="A1:D1")
-        return worksheet
-    except APIError as exc:
-        SHEETS_LAST_ERROR = f"{type(exc).__name__}: {exc}"
+    if not client:
         return None
+    with SHEETS_CACHE["lock"]:
+        if SHEETS_CACHE["spreadsheet"] is None:
+            try:
+                SHEETS_CACHE["spreadsheet"] = call_sheets(client.open_by_key, get_sheets_id())
+            except (APIError, SheetsUnavailableError) as exc:
+                SHEETS_LAST_ERROR = f"{type(exc).__name__}: {exc}"
+                return None
+        return SHEETS_CACHE["spreadsheet"]
 
 
-def get_results_worksheet():
+def get_sheet_worksheet(sheet_name: str):
     global SHEETS_LAST_ERROR
-    client = get_cached_sheets_client()
-    sheet_id = get_sheets_id()
-    if not client or not sheet_id:
+    spreadsheet = get_spreadsheet()
+    if not spreadsheet:
         return None
-    try:
-        sheet = client.open_by_key(sheet_id)
+    with SHEETS_CACHE["lock"]:
+        worksheets = SHEETS_CACHE["worksheets"]
+        try:
+            if not worksheets:
+                worksheets.update({worksheet.title: worksheet for worksheet in call_sheets(spreadsheet.worksheets)})
+            if sheet_name not in worksheets:
+                spec = get_sheet_tab_spec(sheet_name)
+                worksheet = call_sheets(
+                    spreadsheet.add_worksheet, title=sheet_name, rows=spec["rows"], cols=len(spec["header"])
+                )
+                call_sheets(worksheet.update, values=[spec["header"]], range_name="A1")
+                worksheets[sheet_name] = worksheet
+        except (APIError, SheetsUnavailableError) as exc:
+            SHEETS_LAST_ERROR = f"{type(exc).__name__}: {exc}"
+            return None
+        return worksheets[sheet_name]
+
+
+# Everything that syncs with Sheets goes through a storage backend: a set of
+# named tabs, each a header row plus rows of cell text, addressed by 1-based
+# row number like a worksheet. Backends raise APIError/SheetsUnavailableError
+# on failure and leave error reporting to the caller.
+class SheetsBackend(abc.ABC):
+    name = "none"
+
+    def describe(self) -> str:
+        return self.name
+
+    def revision(self) -> Optional[str]:
+        # Cheap marker that changes whenever any tab changes, or None when the
+        # backend can't provide one.
+        return None
+
+    @abc.abstractmethod
+    def ensure_tabs(self, sheet_names: list[str]) -> None:
+        ...
+
+    @abc.abstractmethod
+    def read_tabs(self, sheet_names: list[str]) -> dict[str, list[list]]:
+        ...
+
+    @abc.abstractmethod
+    def write_rows(self, writes: dict[str, dict[int, list]]) -> None:
+        ...
+
+    @abc.abstractmethod
+    def append_rows(self, sheet_name: str, rows: list[list]) -> int:
+        # Adds rows after the last non-empty row; returns the last row number.
+        ...
+
+    @abc.abstractmethod
+    def read_row_spans(self, sheet_name: str, spans: list[tuple[int, Optional[int]]]) -> list[list[list]]:
+        # Inclusive (first_row, last_row) spans; last_row None reads to the end.
+        ...
+
+    @abc.abstractmethod
+    def delete_rows(self, sheet_name: str, start_row: int, end_row: int) -> None:
+        ...
+
+
+def apply_tab_writes(tab: list[list[str]], rows: dict[int, list]) -> None:
+    for row_number, values in rows.items():
+        while len(tab) < row_number:
+            tab.append([])
+        tab[row_number - 1] = [sheet_cell_text(value) for value in values]
+    # Like the Sheets API, reads don't return trailing blank rows.
+    while tab and not any(tab[-1]):
+        tab.pop()
+
+
+class GoogleSheetsBackend(SheetsBackend):
+    name = "google_sheets"
+    revision_supported = True
+
+    def describe(self) -> str:
+        return f"{self.name} ({get_sheets_id()})"
+
+    def revision(self) -> Optional[str]:
+        if not self.revision_supported:
+            return None
+        spreadsheet = get_spreadsheet()
+        if not spreadsheet:
+            raise SheetsUnavailableError(SHEETS_LAST_ERROR or "spreadsheet unavailable")
         try:
-            worksheet = sheet.worksheet("results")
-        except gspread.WorksheetNotFound:
-            worksheet = sheet.add_worksheet(title="results", rows=500, cols=5)
-            worksheet.update(values=[["tournament", "golfer", "purse", "position", "updated_at"]], range_name="A1:E1")
+            return call_sheets(spreadsheet.get_lastUpdateTime)
+        except APIError as exc:
+            if getattr(getattr(exc, "response", None), "status_code", None) not in (403, 404):
+                raise
+            # Drive API disabled or the metadata scope not granted.
+            self.revision_supported = False
+            return None
+
+    def worksheet(self, sheet_name: str):
+        worksheet = get_sheet_worksheet(sheet_name)
+        if not worksheet:
+            raise SheetsUnavailableError(SHEETS_LAST_ERROR or f"worksheet {sheet_name!r} unavailable")
         return worksheet
-    except APIError as exc:
+
+    def ensure_tabs(self, sheet_names: list[str]) -> None:
+        for sheet_name in sheet_names:
+            self.worksheet(sheet_name)
+
+    def read_tabs(self, sheet_names: list[str]) -> dict[str, list[list]]:
+        self.ensure_tabs(sheet_names)
+        response = call_sheets(
+            get_spreadsheet().values_batch_get, [f"'{sheet_name}'" for sheet_name in sheet_names]
+        )
+        value_ranges = response.get("valueRanges", [])
+        return {
+            sheet_name: value_range.get("values", [])
+            for sheet_name, value_range in zip(sheet_names, value_ranges)
+        }
+
+    def write_rows(self, writes: dict[str, dict[int, list]]) -> None:
+        data = []
+        worksheet = None
+        for sheet_name, rows in writes.items():
+            worksheet = self.worksheet(sheet_name)
+            needed_rows = max(rows)
+            if needed_rows > worksheet.row_count:
+                call_sheets(worksheet.add_rows, needed_rows - worksheet.row_count)
+            data.extend(sheet_write_ranges(worksheet.title, rows))
+        if data:
+            # One request for every changed range across all worksheets.
+            call_sheets(
+                worksheet.client.values_batch_update,
+                worksheet.spreadsheet_id,
+                {"valueInputOption": "RAW", "data": data},
+            )
+
+    def append_rows(self, sheet_name: str, rows: list[list]) -> int:
+        worksheet = self.worksheet(sheet_name)
+        response = call_sheets(
+            worksheet.append_rows, rows, value_input_option="RAW", insert_data_option="INSERT_ROWS", table_range="A1"
+        )
+        # e.g. "'pick_events'!A120:F124"
+        match = re.search(r"(\d+)$", response.get("updates", {}).get("updatedRange", ""))
+        return int(match.group(1)) if match else 0
+
+    def read_row_spans(self, sheet_name: str, spans: list[tuple[int, Optional[int]]]) -> list[list[list]]:
+        self.ensure_tabs([sheet_name])
+        response = call_sheets(
+            get_spreadsheet().values_batch_get,
+            [f"'{sheet_name}'!A{start}:Z{end or ''}" for start, end in spans],
+        )
+        return [value_range.get("values", []) for value_range in response.get("valueRanges", [])]
+
+    def delete_rows(self, sheet_name: str, start_row: int, end_row: int) -> None:
+        call_sheets(self.worksheet(sheet_name).delete_rows, start_row, end_row)
+
+
+class LocalFileBackend(SheetsBackend):
+    # Tabs kept in a JSON file next to the database, for running without a
+    # Google account. Writes replace the file atomically.
+    name = "local_file"
+
+    def __init__(self, path: str):
+        self.path = path
+        self.lock = threading.Lock()
+
+    def describe(self) -> str:
+        return f"{self.name} ({self.path})"
+
+    def revision(self) -> Optional[str]:
+        try:
+            return str(os.stat(self.path).st_mtime_ns)
+        except OSError:
+            return None
+
+    def load(self) -> dict[str, list[list[str]]]:
+        if not os.path.exists(self.path):
+            return {}
+        try:
+            with open(self.path, "r", encoding="utf-8") as handle:
+                return json.load(handle)
+        except (OSError, ValueError) as exc:
+            raise SheetsUnavailableError(f"{type(exc).__name__}: {exc}") from exc
+
+    def save(self, tabs: dict[str, list[list[str]]]) -> None:
+        directory = os.path.dirname(self.path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{self.path}.tmp"
+        try:
+            with open(tmp_path, "w", encoding="utf-8") as handle:
+                json.dump(tabs, handle)
+            os.replace(tmp_path, self.path)
+        except OSError as exc:
+            raise SheetsUnavailableError(f"{type(exc).__name__}: {exc}") from exc
+
+    def ensure_tabs(self, sheet_names: list[str]) -> None:
+        with self.lock:
+            tabs = self.load()
+            missing = [sheet_name for sheet_name in sheet_names if sheet_name not in tabs]
+            if missing:
+                for sheet_name in missing:
+                    tabs[sheet_name] = [list(get_sheet_tab_spec(sheet_name)["header"])]
+                self.save(tabs)
+
+    def read_tabs(self, sheet_names: list[str]) -> dict[str, list[list]]:
+        self.ensure_tabs(sheet_names)
+        with self.lock:
+            tabs = self.load()
+        return {sheet_name: tabs[sheet_name] for sheet_name in sheet_names}
+
+    def write_rows(self, writes: dict[str, dict[int, list]]) -> None:
+        with self.lock:
+            tabs = self.load()
+            for sheet_name, rows in writes.items():
+                apply_tab_writes(tabs.setdefault(sheet_name, []), rows)
+            self.save(tabs)
+
+    def append_rows(self, sheet_name: str, rows: list[list]) -> int:
+        self.ensure_tabs([sheet_name])
+        with self.lock:
+            tabs = self.load()
+            tabs[sheet_name].extend([sheet_cell_text(value) for value in row] for row in rows)
+            self.save(tabs)
+            return len(tabs[sheet_name])
+
+    def read_row_spans(self, sheet_name: str, spans: list[tuple[int, Optional[int]]]) -> list[list[list]]:
+        tab = self.read_tabs([sheet_name])[sheet_name]
+        return [tab[start - 1 : end] for start, end in spans]
+
+    def delete_rows(self, sheet_name: str, start_row: int, end_row: int) -> None:
+        with self.lock:
+            tabs = self.load()
+            del tabs.get(sheet_name, [])[start_row - 1 : end_row]
+            self.save(tabs)
+
+
+class FakeSheetsError(SheetsUnavailableError):
+    def __init__(self, message: str, status_code: int):
+        super().__init__(message)
+        # Same shape as gspread's APIError, so the breaker treats a fake 429
+        # like a real one.
+        self.response = requests.Response()
+        self.response.status_code = status_code
+
+
+class FakeSheetsBackend(SheetsBackend):
+    # In-memory tabs for benchmarks and outage drills. Every operation is one
+    # simulated request with optional latency, a per-minute quota (429s) and
+    # random or scheduled failures (503s).
+    name = "fake"
+
+    def __init__(
+        self,
+        tabs: Optional[dict[str, list[list]]] = None,
+        latency: float = 0.0,
+        quota_per_minute: Optional[int] = None,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        self.tabs = {name: [[sheet_cell_text(v) for v in row] for row in values] for name, values in (tabs or {}).items()}
+        self.latency = latency
+        self.quota_per_minute = quota_per_minute
+        self.failure_rate = failure_rate
+        self.fail_next = 0
+        self.revision_counter = 0
+        self.random = random.Random(seed)
+        self.lock = threading.Lock()
+        self.request_times: deque = deque()
+        self.stats = {
+            "requests": 0,
+            "failures": 0,
+            "cells_read": 0,
+            "cells_written": 0,
+            "bytes_written": 0,
+        }
+
+    def describe(self) -> str:
+        return f"{self.name} (latency={self.latency}s, quota={self.quota_per_minute}, failure_rate={self.failure_rate})"
+
+    def request(self) -> None:
+        if self.latency:
+            time_mod.sleep(self.latency)
+        with self.lock:
+            self.stats["requests"] += 1
+            now = time_mod.monotonic()
+            while self.request_times and now - self.request_times[0] >= 60:
+                self.request_times.popleft()
+            if self.quota_per_minute is not None and len(self.request_times) >= self.quota_per_minute:
+                self.stats["failures"] += 1
+                raise FakeSheetsError("Quota exceeded for read/write requests per minute", 429)
+            self.request_times.append(now)
+            if self.fail_next > 0 or self.random.random() < self.failure_rate:
+                self.fail_next = max(self.fail_next - 1, 0)
+                self.stats["failures"] += 1
+                raise FakeSheetsError("The service is currently unavailable", 503)
+
+    def revision(self) -> Optional[str]:
+        call_sheets(self.request)
+        return str(self.revision_counter)
+
+    def ensure_tabs(self, sheet_names: list[str]) -> None:
+        missing = [sheet_name for sheet_name in sheet_names if sheet_name not in self.tabs]
+        if missing:
+            call_sheets(self.request)
+            for sheet_name in missing:
+                self.tabs[sheet_name] = [list(get_sheet_tab_spec(sheet_name)["header"])]
+            self.revision_counter += 1
+
+    def read_tabs(self, sheet_names: list[str]) -> dict[str, list[list]]:
+        self.ensure_tabs(sheet_names)
+        call_sheets(self.request)
+        tabs = {sheet_name: [list(row) for row in self.tabs[sheet_name]] for sheet_name in sheet_names}
+        self.stats["cells_read"] += sum(len(row) for values in tabs.values() for row in values)
+        return tabs
+
+    def write_rows(self, writes: dict[str, dict[int, list]]) -> None:
+        if not writes:
+            return
+        call_sheets(self.request)
+        self.stats["cells_written"] += sum(len(values) for rows in writes.values() for values in rows.values())
+        self.stats["bytes_written"] += len(json.dumps(writes, default=str).encode("utf-8"))
+        for sheet_name, rows in writes.items():
+            apply_tab_writes(self.tabs.setdefault(sheet_name, []), rows)
+        self.revision_counter += 1
+
+    def append_rows(self, sheet_name: str, rows: list[list]) -> int:
+        self.ensure_tabs([sheet_name])
+        call_sheets(self.request)
+        self.stats["cells_written"] += sum(len(row) for row in rows)
+        self.stats["bytes_written"] += len(json.dumps(rows, default=str).encode("utf-8"))
+        self.tabs[sheet_name].extend([sheet_cell_text(value) for value in row] for row in rows)
+        self.revision_counter += 1
+        return len(self.tabs[sheet_name])
+
+    def read_row_spans(self, sheet_name: str, spans: list[tuple[int, Optional[int]]]) -> list[list[list]]:
+        self.ensure_tabs([sheet_name])
+        call_sheets(self.request)
+        tab = self.tabs[sheet_name]
+        result = [[list(row) for row in tab[start - 1 : end]] for start, end in spans]
+        self.stats["cells_read"] += sum(len(row) for rows in result for row in rows)
+        return result
+
+    def delete_rows(self, sheet_name: str, start_row: int, end_row: int) -> None:
+        call_sheets(self.request)
+        del self.tabs.get(sheet_name, [])[start_row - 1 : end_row]
+        self.revision_counter += 1
+
+
+def create_storage_backend() -> Optional[SheetsBackend]:
+    kind = os.getenv("GOLF_STORAGE_BACKEND", "").strip().lower()
+    if not kind:
+        kind = "google_sheets" if get_sheets_id() else "none"
+    if kind == "google_sheets":
+        return GoogleSheetsBackend() if get_sheets_id() else None
+    if kind == "local_file":
+        return LocalFileBackend(os.getenv("GOLF_STORAGE_FILE", os.path.join("data", "sheets_store.json")))
+    if kind == "fake":
+        return FakeSheetsBackend(
+            latency=float(os.getenv("GOLF_FAKE_SHEETS_LATENCY", "") or 0),
+            failure_rate=float(os.getenv("GOLF_FAKE_SHEETS_FAILURE_RATE", "") or 0),
+        )
+    return None
+
+
+def get_storage_backend() -> Optional[SheetsBackend]:
+    with SHEETS_CACHE["lock"]:
+        if not SHEETS_CACHE["backend_configured"]:
+            SHEETS_CACHE["backend"] = create_storage_backend()
+            SHEETS_CACHE["backend_configured"] = True
+        return SHEETS_CACHE["backend"]
+
+
+def set_storage_backend(backend: Optional[SheetsBackend]) -> None:
+    with SHEETS_CACHE["lock"]:
+        SHEETS_CACHE["backend"] = backend
+        SHEETS_CACHE["backend_configured"] = True
+        SHEETS_CACHE["records"].clear()
+        SHEETS_CACHE["layouts"].clear()
+        SHEETS_CACHE["disk"]["loaded"] = False
+
+
+def storage_tab_ready(sheet_name: str) -> bool:
+    global SHEETS_LAST_ERROR
+    backend = get_storage_backend()
+    if backend is None:
+        return False
+    try:
+        backend.ensure_tabs([sheet_name])
+    except (APIError, SheetsUnavailableError) as exc:
         SHEETS_LAST_ERROR = f"{type(exc).__name__}: {exc}"
-        return None
+        return False
+    return True
+
+
+def clear_sheet_records_cache(sheet_name: str) -> None:
+    SHEETS_CACHE["records"].pop(sheet_name, None)
+    # The on-disk copy is just as stale.
+    save_sheets_disk_cache()
+
+
+def mark_sheet_records_current(conn: sqlite3.Connection, sheet_name: str) -> None:
+    # Local writes that came *from* the sheet don't make the cached copy stale.
+    cached = SHEETS_CACHE["records"].get(sheet_name)
+    if cached:
+        cached["version"] = get_data_version(conn, (sheet_name,))
+
+
+def pad_sheet_values(values: list[list]) -> list[list[str]]:
+    width = max((len(row) for row in values), default=0)
+    return [list(row) + [""] * (width - len(row)) for row in values]
 
 
-def get_golfers_worksheet():
+def numericise_cell(value):
+    # Same conversion as gspread's numericise(), so every backend yields the
+    # records Worksheet.get_all_records() would.
+    if not isinstance(value, str) or value == "" or "_" in value:
+        return value
+    cleaned = value.replace(",", "")
+    try:
+        return int(cleaned)
+    except ValueError:
+        pass
+    try:
+        return float(cleaned)
+    except ValueError:
+        return value
+
+
+def parse_sheet_records(values: list[list[str]]) -> list[dict]:
+    if not values or not any(values[0]):
+        return []
+    header = values[0]
+    return [dict(zip(header, [numericise_cell(value) for value in row])) for row in values[1:]]
+
+
+def fetch_sheet_tabs(sheet_names: list[str]) -> Optional[dict[str, list[list[str]]]]:
     global SHEETS_LAST_ERROR
-    client = get_cached_sheets_client()
-    sheet_id = get_sheets_id()
-    if not client or not sheet_id:
+    backend = get_storage_backend()
+    if backend is None:
         return None
     try:
-        sheet = client.open_by_key(sheet_id)
-        try:
-            worksheet = sheet.worksheet("golfers")
-        except gspread.WorksheetNotFound:
-            worksheet = sheet.add_worksheet(title="golfers", rows=500, cols=5)
-            worksheet.update(
-                values=[["name", "fedex_rank", "fedex_points", "active", "bdl_id"]],
-                range_name="A1:E1",
-            )
-        return worksheet
-    except APIError as exc:
+        tabs = backend.read_tabs(sheet_names)
+    except (APIError, SheetsUnavailableError) as exc:
         SHEETS_LAST_ERROR = f"{type(exc).__name__}: {exc}"
         return None
+    return {sheet_name: pad_sheet_values(tabs.get(sheet_name, [])) for sheet_name in sheet_names}
+
+
+SHEETS_DISK_CACHE_MAX_BYTES = 4 * 1024 * 1024
+SHEETS_DISK_CACHE_MAX_AGE_SECONDS = 7 * 24 * 3600
+
 
-def get_users_worksheet():
+def read_storage_revision() -> Optional[str]:
     global SHEETS_LAST_ERROR
-    client = get_cached_sheets_client()
-    sheet_id = get_sheets_id()
-    if not client or not sheet_id:
+    backend = get_storage_backend()
+    if backend is None:
         return None
     try:
-        sheet = client.open_by_key(sheet_id)
-        try:
-            worksheet = sheet.worksheet("users")
-        except gspread.WorksheetNotFound:
-            worksheet = sheet.add_worksheet(title="users", rows=200, cols=5)
-            worksheet.update(values=[["name", "pin_hash", "is_admin", "double_pick_used", "updated_at"]], range_name="A1:E1")
-        return worksheet
-    except APIError as exc:
+        return backend.revision()
+    except (APIError, SheetsUnavailableError) as exc:
         SHEETS_LAST_ERROR = f"{type(exc).__name__}: {exc}"
         return None
 
+
+def load_sheets_disk_cache(conn: Optional[sqlite3.Connection] = None) -> None:
+    # Once per process: seed the record cache from the previous process's copy
+    # so the first page load after a restart doesn't wait on the backend.
+    with SHEETS_CACHE["lock"]:
+        disk = SHEETS_CACHE["disk"]
+        if disk["loaded"]:
+            return
+        disk["loaded"] = True
+        backend = get_storage_backend()
+        path = get_sheets_disk_cache_path()
+        if backend is None or not os.path.exists(path):
+            return
+        try:
+            with open(path, "r", encoding="utf-8") as handle:
+                payload = json.load(handle)
+        except (OSError, ValueError):
+            return
+        if payload.get("backend") != backend.describe():
+            return
+        now = time_mod.time()
+        for name, entry in payload.get("tabs", {}).items():
+            if name not in SHEET_EXPORTS or name in SHEETS_CACHE["records"]:
+                continue
+            if now - entry["at"] > SHEETS_DISK_CACHE_MAX_AGE_SECONDS:
+                continue
+            SHEETS_CACHE["records"][name] = {
+                "rows": parse_sheet_records(entry["values"]),
+                "values": entry["values"],
+                "at": entry["at"],
+                "used": entry.get("used", entry["at"]),
+                "version": get_data_version(conn, (name,)) if conn else None,
+                "revision": entry.get("revision"),
+                "from_disk": True,
+            }
+
+
+def save_sheets_disk_cache() -> None:
+    backend = get_storage_backend()
+    if backend is None:
+        return
+    load_sheets_disk_cache()
+    now = time_mod.time()
+    with SHEETS_CACHE["lock"]:
+        tabs = {
+            name: {"values": entry["values"], "at": entry["at"], "used": entry["used"], "revision": entry["revision"]}
+            for name, entry in SHEETS_CACHE["records"].items()
+            if now - entry["at"] <= SHEETS_DISK_CACHE_MAX_AGE_SECONDS
+        }
+        payload = {"backend": backend.describe(), "saved_at": now, "tabs": tabs}
+        encoded = json.dumps(payload)
+        budget = int(os.getenv("GOLF_SHEETS_CACHE_MAX_BYTES", "") or SHEETS_DISK_CACHE_MAX_BYTES)
+        # Least recently used tabs go first when the file is over budget.
+        for name in sorted(tabs, key=lambda n: tabs[n]["used"]):
+            if len(encoded) <= budget:
+                break
+            del tabs[name]
+            encoded = json.dumps(payload)
+        path = get_sheets_disk_cache_path()
+        try:
+            directory = os.path.dirname(path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(f"{path}.tmp", "w", encoding="utf-8") as handle:
+                handle.write(encoded)
+            os.replace(f"{path}.tmp", path)
+        except OSError:
+            return
+        SHEETS_CACHE["disk"].update({"saved_at": now, "bytes": len(encoded), "tabs": len(tabs)})
+
+
+def revalidate_sheets_disk_cache(db_path: str) -> None:
+    disk = SHEETS_CACHE["disk"]
+    records = SHEETS_CACHE["records"]
+    conn = open_connection(db_path)
+    try:
+        revision = read_storage_revision()
+        from_disk = [name for name, entry in list(records.items()) if entry.get("from_disk")]
+        if revision is not None and all(records[name]["revision"] == revision for name in from_disk):
+            for name in from_disk:
+                records[name]["from_disk"] = False
+            disk["last_result"] = "unchanged"
+        else:
+            for name in from_disk:
+                records.pop(name, None)
+            # Re-read in one batch and merge whatever changed while we were down.
+            hydrate_golfers(conn)
+            hydrate_results(conn)
+            disk["last_result"] = "refreshed"
+    except Exception as exc:
+        if conn.in_transaction:
+            conn.rollback()
+        disk["last_result"] = f"failed ({type(exc).__name__}: {exc})"
+    finally:
+        conn.close()
+        disk["revalidated_at"] = datetime.utcnow().isoformat()
+
+
+def start_sheets_disk_cache_revalidation() -> None:
+    disk = SHEETS_CACHE["disk"]
+    with SHEETS_CACHE["lock"]:
+        if disk["thread"] and disk["thread"].is_alive():
+            return
+        thread = threading.Thread(
+            target=revalidate_sheets_disk_cache,
+            args=(os.path.abspath(get_db_path()),),
+            name="sheets-cache-revalidate",
+            daemon=True,
+        )
+        add_script_run_ctx(thread)
+        disk["thread"] = thread
+        thread.start()
+
+
+def get_cached_sheet_records(
+    sheet_name: str,
+    conn: Optional[sqlite3.Connection] = None,
+    ttl_seconds: Optional[int] = None,
+):
+    now = time_mod.time()
+    records = SHEETS_CACHE["records"]
+
+    def current_version(name: str):
+        return get_data_version(conn, (name,)) if conn else None
+
+    def is_fresh(name: str) -> bool:
+        # Cached records stay valid until the matching local table is written
+        # to (by any process), instead of expiring on a fixed timer.
+        cached = records.get(name)
+        return bool(
+            cached
+            and cached["version"] == current_version(name)
+            and (ttl_seconds is None or (now - cached["at"]) < ttl_seconds)
+        )
+
+    def serve(name: str) -> list[dict]:
+        records[name]["used"] = now
+        return records[name]["rows"]
+
+    if is_fresh(sheet_name):
+        return serve(sheet_name)
+    if not SHEETS_CACHE["disk"]["loaded"]:
+        load_sheets_disk_cache(conn)
+        if is_fresh(sheet_name):
+            # Render from the last process's copy; a background check against
+            # the backend's revision confirms or refreshes it.
+            start_sheets_disk_cache_revalidation()
+            return serve(sheet_name)
+    # Refresh every stale tab in the same request so the other hydrate steps
+    # hit the cache.
+    stale = [sheet_name] + [name for name in SHEET_EXPORTS if name != sheet_name and not is_fresh(name)]
+    # Read before the tabs, so an edit racing the read shows up as a newer
+    # revision next time rather than being masked.
+    revision = read_storage_revision()
+    if revision is not None and records.get(sheet_name, {}).get("revision") == revision:
+        # Nothing changed in the backend since these copies were fetched.
+        for name in stale:
+            if name in records and records[name]["revision"] == revision:
+                records[name].update({"at": now, "version": current_version(name)})
+        return serve(sheet_name)
+    tabs = fetch_sheet_tabs(stale)
+    if tabs is None:
+        return None
+    for name, values in tabs.items():
+        records[name] = {
+            "rows": parse_sheet_records(values),
+            "values": values,
+            "at": now,
+            "used": now,
+            "version": current_version(name),
+            "revision": revision,
+        }
+        SHEETS_CACHE["layouts"][name] = values
+    save_sheets_disk_cache()
+    return serve(sheet_name)
+
+
 def load_env_file(path: str = ".env") -> None:
     if not os.path.exists(path):
         return
@@ -368,94 +1129,286 @@ def load_env_file(path: str = ".env") -> None:
             if key and key not in os.environ:
                 os.environ[key] = value
 
-def img_to_base64(path: str) -> str:
-    if not os.path.exists(path):
-        return ""
+APP_DIR = os.path.dirname(os.path.abspath(__file__))
+ASSETS_DIR = os.path.join(APP_DIR, "assets")
+# Files here are served by Streamlit at app/static/<name> when
+# server.enableStaticServing is on (see .streamlit/config.toml).
+STATIC_DIR = os.path.join(APP_DIR, "static")
+ASSET_MIME_TYPES = {".png": "image/png", ".jpg": "image/jpeg", ".svg": "image/svg+xml", ".css": "text/css"}
+
+
+@st.cache_resource(show_spinner=False)
+def get_asset_cache() -> dict:
+    return {"lock": threading.Lock(), "entries": {}}
+
+
+def load_asset(path: str, kind: str, build) -> Optional[dict]:
+    # Assets are rebuilt only when the file on disk changes.
+    try:
+        mtime = os.stat(path).st_mtime_ns
+    except OSError:
+        return None
+    cache = get_asset_cache()
+    key = (path, kind)
+    entry = cache["entries"].get(key)
+    if entry and entry["mtime"] == mtime:
+        return entry
     with open(path, "rb") as handle:
-        return base64.b64encode(handle.read()).decode("utf-8")
+        data = handle.read()
+    entry = {"mtime": mtime, "hash": hashlib.sha256(data).hexdigest()[:12], **build(data)}
+    with cache["lock"]:
+        cache["entries"][key] = entry
+    return entry
+
+
+def minify_css(css: str) -> str:
+    css = re.sub(r"/\*.*?\*/", "", css, flags=re.S)
+    css = re.sub(r"\s+", " ", css)
+    css = re.sub(r"\s*([{};,])\s*", r"\1", css)
+    return css.replace(";}", "}").strip()
+
+
+def get_text_asset(name: str, minify=None) -> dict:
+    def build(data: bytes) -> dict:
+        text = data.decode("utf-8")
+        return {"text": minify(text) if minify else text}
+
+    kind = f"text:{minify.__name__}" if minify else "text"
+    entry = load_asset(os.path.join(ASSETS_DIR, name), kind, build)
+    return entry or {"hash": "", "text": ""}
+
+
+def get_asset_url(name: str) -> str:
+    path = os.path.join(STATIC_DIR, name)
+    if st.get_option("server.enableStaticServing"):
+        # A short hashed URL instead of the encoded file; the browser caches
+        # it across reruns and sessions.
+        entry = load_asset(path, "hash", lambda data: {})
+        if entry:
+            return f"app/static/{name}?v={entry['hash']}"
+    mime = ASSET_MIME_TYPES.get(os.path.splitext(name)[1].lower(), "application/octet-stream")
+    entry = load_asset(
+        path,
+        "data_uri",
+        lambda data: {"data_uri": f"data:{mime};base64,{base64.b64encode(data).decode('utf-8')}"},
+    )
+    return entry["data_uri"] if entry else ""
 
 
-def get_conn() -> sqlite3.Connection:
-    db_path = get_db_path()
-    os.makedirs(os.path.dirname(db_path), exist_ok=True)
-    conn = sqlite3.connect(db_path, check_same_thread=False)
+SQLITE_BUSY_TIMEOUT_MS = 5000
+SQLITE_CACHE_SIZE_KIB = 8192
+SQLITE_MMAP_SIZE = 64 * 1024 * 1024
+SQLITE_CACHED_STATEMENTS = 256
+SQLITE_POOL_MAX_IDLE = 8
+
+
+def open_connection(db_path: str, read_only: bool = False) -> sqlite3.Connection:
+    db_dir = os.path.dirname(db_path)
+    if db_dir:
+        os.makedirs(db_dir, exist_ok=True)
+    conn = sqlite3.connect(
+        db_path,
+        timeout=SQLITE_BUSY_TIMEOUT_MS / 1000,
+        check_same_thread=False,
+        cached_statements=SQLITE_CACHED_STATEMENTS,
+    )
     conn.row_factory = sqlite3.Row
+    profile_local = get_profile_store()["local"]
+    conn.set_trace_callback(lambda statement: count_sql_statement(profile_local, statement))
+    conn.execute(f"PRAGMA busy_timeout = {SQLITE_BUSY_TIMEOUT_MS}")
+    if not read_only:
+        conn.execute("PRAGMA journal_mode = WAL")
+    conn.execute("PRAGMA synchronous = NORMAL")
+    conn.execute("PRAGMA foreign_keys = ON")
+    conn.execute(f"PRAGMA cache_size = -{SQLITE_CACHE_SIZE_KIB}")
+    conn.execute(f"PRAGMA mmap_size = {SQLITE_MMAP_SIZE}")
+    conn.execute("PRAGMA temp_store = MEMORY")
+    if read_only:
+        conn.execute("PRAGMA query_only = ON")
     return conn
 
 
-def init_db(conn: sqlite3.Connection) -> None:
-    conn.executescript(
-        """
-        PRAGMA journal_mode=WAL;
-        PRAGMA foreign_keys=ON;
+def close_connection_pool(pool: dict) -> None:
+    with pool["lock"]:
+        entries = list(pool["active"].values()) + pool["idle"]
+        pool["active"].clear()
+        pool["idle"] = []
+    for entry in entries:
+        try:
+            if not entry["read_only"]:
+                entry["conn"].execute("PRAGMA optimize")
+            entry["conn"].close()
+        except sqlite3.Error:
+            pass
 
-        CREATE TABLE IF NOT EXISTS users (
-          id INTEGER PRIMARY KEY AUTOINCREMENT,
-          name TEXT NOT NULL UNIQUE,
-          double_pick_used INTEGER NOT NULL DEFAULT 0,
-          pin_hash TEXT,
-          is_admin INTEGER NOT NULL DEFAULT 0
-        );
 
-        CREATE TABLE IF NOT EXISTS golfers (
-          id INTEGER PRIMARY KEY AUTOINCREMENT,
-          name TEXT NOT NULL UNIQUE,
-          fedex_rank INTEGER,
-          fedex_points INTEGER,
-          active INTEGER NOT NULL DEFAULT 1,
-          bdl_id INTEGER
-        );
+@st.cache_resource(show_spinner=False)
+def get_connection_pool() -> dict:
+    pool = {"lock": threading.Lock(), "active": {}, "idle": []}
+    atexit.register(close_connection_pool, pool)
+    return pool
 
-        CREATE TABLE IF NOT EXISTS tournaments (
-          id INTEGER PRIMARY KEY AUTOINCREMENT,
-          name TEXT NOT NULL,
-          start_date TEXT NOT NULL,
-          end_date TEXT NOT NULL,
-          is_major INTEGER NOT NULL DEFAULT 0,
-          is_signature INTEGER NOT NULL DEFAULT 0,
-          season INTEGER NOT NULL DEFAULT 2026,
-          bdl_id INTEGER,
-          purse INTEGER,
-          rapid_tourn_id TEXT
-        );
 
-        CREATE TABLE IF NOT EXISTS picks (
-          id INTEGER PRIMARY KEY AUTOINCREMENT,
-          user_id INTEGER NOT NULL,
-          tournament_id INTEGER NOT NULL,
-          golfer_id INTEGER NOT NULL,
-          created_at TEXT NOT NULL,
-          FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE,
-          FOREIGN KEY(tournament_id) REFERENCES tournaments(id) ON DELETE CASCADE,
-          FOREIGN KEY(golfer_id) REFERENCES golfers(id) ON DELETE CASCADE,
-          UNIQUE(user_id, golfer_id)
-        );
+def _park_connection(pool: dict, entry: dict) -> None:
+    conn = entry["conn"]
+    try:
+        # Never hand a half-finished write from an aborted rerun to the next one.
+        if conn.in_transaction:
+            conn.rollback()
+    except sqlite3.Error:
+        conn.close()
+        return
+    if len(pool["idle"]) < SQLITE_POOL_MAX_IDLE:
+        pool["idle"].append(entry)
+    else:
+        conn.close()
 
-        CREATE TABLE IF NOT EXISTS results (
-          id INTEGER PRIMARY KEY AUTOINCREMENT,
-          tournament_id INTEGER NOT NULL,
-          golfer_id INTEGER NOT NULL,
-          purse INTEGER NOT NULL,
-          position INTEGER,
-          FOREIGN KEY(tournament_id) REFERENCES tournaments(id) ON DELETE CASCADE,
-          FOREIGN KEY(golfer_id) REFERENCES golfers(id) ON DELETE CASCADE,
-          UNIQUE(tournament_id, golfer_id)
-        );
 
-        CREATE TABLE IF NOT EXISTS sync_meta (
-          key TEXT PRIMARY KEY,
-          value TEXT
-        );
+def _reap_dead_threads(pool: dict) -> None:
+    for key, entry in list(pool["active"].items()):
+        if not entry["thread"].is_alive():
+            del pool["active"][key]
+            _park_connection(pool, entry)
+
+
+def acquire_connection(read_only: bool = False) -> sqlite3.Connection:
+    pool = get_connection_pool()
+    db_path = get_db_path()
+    thread = threading.current_thread()
+    key = (thread.ident, read_only)
+    with pool["lock"]:
+        entry = pool["active"].get(key)
+        if entry and entry["thread"] is thread and entry["db_path"] == db_path:
+            return entry["conn"]
+        if entry:
+            del pool["active"][key]
+            _park_connection(pool, entry)
+        _reap_dead_threads(pool)
+        entry = next(
+            (
+                idle
+                for idle in pool["idle"]
+                if idle["db_path"] == db_path and idle["read_only"] == read_only
+            ),
+            None,
+        )
+        if entry:
+            pool["idle"].remove(entry)
+    if entry is None:
+        entry = {
+            "conn": open_connection(db_path, read_only=read_only),
+            "db_path": db_path,
+            "read_only": read_only,
+        }
+    entry["thread"] = thread
+    with pool["lock"]:
+        pool["active"][key] = entry
+    return entry["conn"]
 
-        CREATE TABLE IF NOT EXISTS leaderboard_overrides (
-          user_id INTEGER PRIMARY KEY,
-          total_override INTEGER,
-          FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE
-        );
-        """
-    )
 
-    # Add new columns if database already exists
+def release_thread_connections() -> None:
+    pool = get_connection_pool()
+    ident = threading.get_ident()
+    with pool["lock"]:
+        for read_only in (False, True):
+            entry = pool["active"].pop((ident, read_only), None)
+            if entry:
+                _park_connection(pool, entry)
+
+
+def get_conn() -> sqlite3.Connection:
+    return acquire_connection(read_only=False)
+
+
+def get_read_conn() -> sqlite3.Connection:
+    return acquire_connection(read_only=True)
+
+
+BASELINE_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS users (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  name TEXT NOT NULL UNIQUE,
+  double_pick_used INTEGER NOT NULL DEFAULT 0,
+  pin_hash TEXT,
+  is_admin INTEGER NOT NULL DEFAULT 0
+);
+
+CREATE TABLE IF NOT EXISTS golfers (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  name TEXT NOT NULL UNIQUE,
+  fedex_rank INTEGER,
+  fedex_points INTEGER,
+  active INTEGER NOT NULL DEFAULT 1,
+  bdl_id INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS tournaments (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  name TEXT NOT NULL,
+  start_date TEXT NOT NULL,
+  end_date TEXT NOT NULL,
+  is_major INTEGER NOT NULL DEFAULT 0,
+  is_signature INTEGER NOT NULL DEFAULT 0,
+  season INTEGER NOT NULL DEFAULT 2026,
+  bdl_id INTEGER,
+  purse INTEGER,
+  rapid_tourn_id TEXT
+);
+
+CREATE TABLE IF NOT EXISTS picks (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  user_id INTEGER NOT NULL,
+  tournament_id INTEGER NOT NULL,
+  golfer_id INTEGER NOT NULL,
+  created_at TEXT NOT NULL,
+  FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE,
+  FOREIGN KEY(tournament_id) REFERENCES tournaments(id) ON DELETE CASCADE,
+  FOREIGN KEY(golfer_id) REFERENCES golfers(id) ON DELETE CASCADE,
+  UNIQUE(user_id, golfer_id)
+);
+
+CREATE TABLE IF NOT EXISTS results (
+  id INTEGER PRIMARY KEY AUTOINCREMENT,
+  tournament_id INTEGER NOT NULL,
+  golfer_id INTEGER NOT NULL,
+  purse INTEGER NOT NULL,
+  position INTEGER,
+  FOREIGN KEY(tournament_id) REFERENCES tournaments(id) ON DELETE CASCADE,
+  FOREIGN KEY(golfer_id) REFERENCES golfers(id) ON DELETE CASCADE,
+  UNIQUE(tournament_id, golfer_id)
+);
+
+CREATE TABLE IF NOT EXISTS sync_meta (
+  key TEXT PRIMARY KEY,
+  value TEXT
+);
+
+CREATE TABLE IF NOT EXISTS leaderboard_overrides (
+  user_id INTEGER PRIMARY KEY,
+  total_override INTEGER,
+  FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+"""
+
+
+def iter_sql_statements(script: str):
+    buffer = ""
+    for line in script.splitlines(keepends=True):
+        buffer += line
+        if sqlite3.complete_statement(buffer):
+            statement = buffer.strip()
+            buffer = ""
+            if statement:
+                yield statement
+    if buffer.strip():
+        yield buffer.strip()
+
+
+def migrate_baseline_schema(conn: sqlite3.Connection) -> None:
+    for statement in iter_sql_statements(BASELINE_SCHEMA_SQL):
+        conn.execute(statement)
+
+    # Databases created before versioned migrations may be missing columns.
     columns = [row[1] for row in conn.execute("PRAGMA table_info(tournaments)").fetchall()]
     if "purse" not in columns:
         conn.execute("ALTER TABLE tournaments ADD COLUMN purse INTEGER")
@@ -468,24 +1421,19 @@ def init_db(conn: sqlite3.Connection) -> None:
         conn.execute("ALTER TABLE users ADD COLUMN pin_hash TEXT")
     if "is_admin" not in user_columns:
         conn.execute("ALTER TABLE users ADD COLUMN is_admin INTEGER NOT NULL DEFAULT 0")
-    conn.commit()
 
-    # Migrate picks table if it still has the UNIQUE(user_id, tournament_id) constraint.
-    index_list = conn.execute("PRAGMA index_list(picks)").fetchall()
+    # Rebuild picks if it still has the UNIQUE(user_id, tournament_id) constraint.
     has_unique_user_tourn = False
-    for idx in index_list:
+    for idx in conn.execute("PRAGMA index_list(picks)").fetchall():
         if not idx[2]:
             continue
-        index_name = idx[1]
-        cols = [row[2] for row in conn.execute(f"PRAGMA index_info({index_name})").fetchall()]
+        cols = [row[2] for row in conn.execute(f"PRAGMA index_info({idx[1]})").fetchall()]
         if cols == ["user_id", "tournament_id"]:
             has_unique_user_tourn = True
             break
-
     if has_unique_user_tourn:
-        conn.executescript(
+        for statement in iter_sql_statements(
             """
-            BEGIN TRANSACTION;
             CREATE TABLE picks_new (
               id INTEGER PRIMARY KEY AUTOINCREMENT,
               user_id INTEGER NOT NULL,
@@ -501,57 +1449,431 @@ def init_db(conn: sqlite3.Connection) -> None:
             SELECT id, user_id, tournament_id, golfer_id, created_at FROM picks;
             DROP TABLE picks;
             ALTER TABLE picks_new RENAME TO picks;
-            COMMIT;
             """
-        )
+        ):
+            conn.execute(statement)
 
 
-def seed_if_needed(conn: sqlite3.Connection) -> None:
-    if conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 0:
-        conn.executemany(
-            "INSERT INTO users (name, is_admin) VALUES (?, ?)",
-            [(u, 1 if u == "Carl" else 0) for u in USERS],
+def migrate_data_versions(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS data_versions ("
+        "table_name TEXT PRIMARY KEY, version INTEGER NOT NULL DEFAULT 0"
+        ") WITHOUT ROWID"
+    )
+    for table in ("picks", "results", "golfers", "users", "tournaments", "leaderboard_overrides"):
+        conn.execute(
+            "INSERT OR IGNORE INTO data_versions (table_name, version) VALUES (?, 0)",
+            (table,),
         )
-    else:
-        conn.execute("UPDATE users SET is_admin = 1 WHERE name = ?", ("Carl",))
+        for event in ("INSERT", "UPDATE", "DELETE"):
+            conn.execute(
+                f"CREATE TRIGGER IF NOT EXISTS trg_{table}_version_{event.lower()} "
+                f"AFTER {event} ON {table} BEGIN "
+                f"UPDATE data_versions SET version = version + 1 WHERE table_name = '{table}'; "
+                f"END"
+            )
 
-    # Remove tournaments we don't want in the schedule
-    conn.execute("DELETE FROM tournaments WHERE name = ?", ("Puerto Rico Open",))
-    conn.execute("DELETE FROM tournaments WHERE name = ?", ("ONEflight Myrtle Beach Classic",))
-    conn.execute("DELETE FROM tournaments WHERE name = ?", ("ISCO Championship",))
-    conn.execute("DELETE FROM tournaments WHERE name = ?", ("Corales Puntacana Championship",))
 
-    if conn.execute("SELECT COUNT(*) FROM golfers").fetchone()[0] == 0:
-        conn.executemany(
-            "INSERT INTO golfers (name, fedex_rank, fedex_points) VALUES (?, ?, ?)",
-            SEED_GOLFERS,
-        )
+STANDINGS_SCHEMA_SQL = """
+CREATE TABLE IF NOT EXISTS standings (
+  user_id INTEGER PRIMARY KEY,
+  total INTEGER NOT NULL DEFAULT 0,
+  wins INTEGER NOT NULL DEFAULT 0,
+  top5 INTEGER NOT NULL DEFAULT 0,
+  top10 INTEGER NOT NULL DEFAULT 0,
+  FOREIGN KEY(user_id) REFERENCES users(id) ON DELETE CASCADE
+);
+
+CREATE TRIGGER IF NOT EXISTS trg_standings_user_insert AFTER INSERT ON users BEGIN
+  INSERT OR IGNORE INTO standings (user_id) VALUES (NEW.id);
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_standings_pick_insert AFTER INSERT ON picks BEGIN
+  UPDATE standings SET
+    total = standings.total + r.purse,
+    wins = standings.wins + CASE WHEN r.position = 1 THEN 1 ELSE 0 END,
+    top5 = standings.top5 + CASE WHEN r.position IS NOT NULL AND r.position <= 5 THEN 1 ELSE 0 END,
+    top10 = standings.top10 + CASE WHEN r.position IS NOT NULL AND r.position <= 10 THEN 1 ELSE 0 END
+  FROM results AS r
+  WHERE standings.user_id = NEW.user_id
+    AND r.tournament_id = NEW.tournament_id
+    AND r.golfer_id = NEW.golfer_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_standings_pick_delete AFTER DELETE ON picks BEGIN
+  UPDATE standings SET
+    total = standings.total - r.purse,
+    wins = standings.wins - CASE WHEN r.position = 1 THEN 1 ELSE 0 END,
+    top5 = standings.top5 - CASE WHEN r.position IS NOT NULL AND r.position <= 5 THEN 1 ELSE 0 END,
+    top10 = standings.top10 - CASE WHEN r.position IS NOT NULL AND r.position <= 10 THEN 1 ELSE 0 END
+  FROM results AS r
+  WHERE standings.user_id = OLD.user_id
+    AND r.tournament_id = OLD.tournament_id
+    AND r.golfer_id = OLD.golfer_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_standings_pick_update
+AFTER UPDATE OF user_id, tournament_id, golfer_id ON picks BEGIN
+  UPDATE standings SET
+    total = standings.total - r.purse,
+    wins = standings.wins - CASE WHEN r.position = 1 THEN 1 ELSE 0 END,
+    top5 = standings.top5 - CASE WHEN r.position IS NOT NULL AND r.position <= 5 THEN 1 ELSE 0 END,
+    top10 = standings.top10 - CASE WHEN r.position IS NOT NULL AND r.position <= 10 THEN 1 ELSE 0 END
+  FROM results AS r
+  WHERE standings.user_id = OLD.user_id
+    AND r.tournament_id = OLD.tournament_id
+    AND r.golfer_id = OLD.golfer_id;
+  UPDATE standings SET
+    total = standings.total + r.purse,
+    wins = standings.wins + CASE WHEN r.position = 1 THEN 1 ELSE 0 END,
+    top5 = standings.top5 + CASE WHEN r.position IS NOT NULL AND r.position <= 5 THEN 1 ELSE 0 END,
+    top10 = standings.top10 + CASE WHEN r.position IS NOT NULL AND r.position <= 10 THEN 1 ELSE 0 END
+  FROM results AS r
+  WHERE standings.user_id = NEW.user_id
+    AND r.tournament_id = NEW.tournament_id
+    AND r.golfer_id = NEW.golfer_id;
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_standings_result_insert AFTER INSERT ON results BEGIN
+  UPDATE standings SET
+    total = total + NEW.purse,
+    wins = wins + CASE WHEN NEW.position = 1 THEN 1 ELSE 0 END,
+    top5 = top5 + CASE WHEN NEW.position IS NOT NULL AND NEW.position <= 5 THEN 1 ELSE 0 END,
+    top10 = top10 + CASE WHEN NEW.position IS NOT NULL AND NEW.position <= 10 THEN 1 ELSE 0 END
+  WHERE user_id IN (
+    SELECT user_id FROM picks WHERE tournament_id = NEW.tournament_id AND golfer_id = NEW.golfer_id
+  );
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_standings_result_delete AFTER DELETE ON results BEGIN
+  UPDATE standings SET
+    total = total - OLD.purse,
+    wins = wins - CASE WHEN OLD.position = 1 THEN 1 ELSE 0 END,
+    top5 = top5 - CASE WHEN OLD.position IS NOT NULL AND OLD.position <= 5 THEN 1 ELSE 0 END,
+    top10 = top10 - CASE WHEN OLD.position IS NOT NULL AND OLD.position <= 10 THEN 1 ELSE 0 END
+  WHERE user_id IN (
+    SELECT user_id FROM picks WHERE tournament_id = OLD.tournament_id AND golfer_id = OLD.golfer_id
+  );
+END;
+
+CREATE TRIGGER IF NOT EXISTS trg_standings_result_update
+AFTER UPDATE OF tournament_id, golfer_id, purse, position ON results BEGIN
+  UPDATE standings SET
+    total = total - OLD.purse,
+    wins = wins - CASE WHEN OLD.position = 1 THEN 1 ELSE 0 END,
+    top5 = top5 - CASE WHEN OLD.position IS NOT NULL AND OLD.position <= 5 THEN 1 ELSE 0 END,
+    top10 = top10 - CASE WHEN OLD.position IS NOT NULL AND OLD.position <= 10 THEN 1 ELSE 0 END
+  WHERE user_id IN (
+    SELECT user_id FROM picks WHERE tournament_id = OLD.tournament_id AND golfer_id = OLD.golfer_id
+  );
+  UPDATE standings SET
+    total = total + NEW.purse,
+    wins = wins + CASE WHEN NEW.position = 1 THEN 1 ELSE 0 END,
+    top5 = top5 + CASE WHEN NEW.position IS NOT NULL AND NEW.position <= 5 THEN 1 ELSE 0 END,
+    top10 = top10 + CASE WHEN NEW.position IS NOT NULL AND NEW.position <= 10 THEN 1 ELSE 0 END
+  WHERE user_id IN (
+    SELECT user_id FROM picks WHERE tournament_id = NEW.tournament_id AND golfer_id = NEW.golfer_id
+  );
+END;
+"""
+
+
+# Sheet row key of a local row, as rendered by SHEET_EXPORTS (key columns
+# joined with char(31)); {row} is NEW or OLD inside a trigger.
+ROW_SYNC_KEY_SQL = {
+    "results": (
+        "(SELECT name FROM tournaments WHERE id = {row}.tournament_id) || char(31) || "
+        "(SELECT name FROM golfers WHERE id = {row}.golfer_id)"
+    ),
+    "golfers": "{row}.name",
+    "users": "{row}.name",
+}
 
-    existing_tournaments = {
-        row["name"]: row
-        for row in conn.execute("SELECT id, name FROM tournaments").fetchall()
-    }
-    for tournament in SEED_TOURNAMENTS:
-        name, start, end, is_major, is_signature, season, purse = tournament
-        if name in existing_tournaments:
-            conn.execute(
-                "UPDATE tournaments SET start_date = ?, end_date = ?, is_major = ?, is_signature = ?, season = ?, purse = ? WHERE id = ?",
-                (start, end, is_major, is_signature, season, purse, existing_tournaments[name]["id"]),
+
+def migrate_row_sync(conn: sqlite3.Connection) -> None:
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS sync_changes ("
+        "table_name TEXT NOT NULL, row_key TEXT NOT NULL, seq INTEGER NOT NULL, updated_at TEXT NOT NULL, "
+        "PRIMARY KEY (table_name, row_key)"
+        ") WITHOUT ROWID"
+    )
+    conn.execute("CREATE INDEX IF NOT EXISTS idx_sync_changes_seq ON sync_changes(seq)")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS sync_rows ("
+        "table_name TEXT NOT NULL, row_key TEXT NOT NULL, local_hash TEXT NOT NULL, remote_hash TEXT NOT NULL, "
+        "updated_at TEXT NOT NULL, PRIMARY KEY (table_name, row_key)"
+        ") WITHOUT ROWID"
+    )
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS sync_conflicts ("
+        "id INTEGER PRIMARY KEY AUTOINCREMENT, table_name TEXT NOT NULL, row_key TEXT NOT NULL, "
+        "local_value TEXT, local_updated_at TEXT, remote_value TEXT, remote_updated_at TEXT, "
+        "winner TEXT NOT NULL, resolved_at TEXT NOT NULL"
+        ")"
+    )
+    for table, key_sql in ROW_SYNC_KEY_SQL.items():
+        for event, refs in (("INSERT", ("NEW",)), ("UPDATE", ("OLD", "NEW")), ("DELETE", ("OLD",))):
+            body = " ".join(
+                f"INSERT INTO sync_changes (table_name, row_key, seq, updated_at) "
+                f"SELECT '{table}', {key_sql.format(row=ref)}, "
+                f"(SELECT COALESCE(MAX(seq), 0) + 1 FROM sync_changes), strftime('%Y-%m-%dT%H:%M:%f', 'now') "
+                f"WHERE {key_sql.format(row=ref)} IS NOT NULL "
+                f"ON CONFLICT(table_name, row_key) DO UPDATE SET seq = excluded.seq, updated_at = excluded.updated_at;"
+                for ref in refs
             )
-        else:
             conn.execute(
-                "INSERT INTO tournaments (name, start_date, end_date, is_major, is_signature, season, purse) VALUES (?, ?, ?, ?, ?, ?, ?)",
-                (name, start, end, is_major, is_signature, season, purse),
+                f"CREATE TRIGGER IF NOT EXISTS trg_{table}_sync_{event.lower()} "
+                f"AFTER {event} ON {table} BEGIN {body} END"
             )
 
-    if conn.execute("SELECT COUNT(*) FROM picks").fetchone()[0] == 0 and not get_sheets_id():
-        tournament_id = conn.execute(
-            "SELECT id FROM tournaments WHERE name = ?", ("WM Phoenix Open",)
-        ).fetchone()[0]
-        for user_name, golfer_name, purse, position in INITIAL_PICKS:
-            user_id = conn.execute("SELECT id FROM users WHERE name = ?", (user_name,)).fetchone()[0]
-            golfer_id = conn.execute("SELECT id FROM golfers WHERE name = ?", (golfer_name,)).fetchone()[0]
-            conn.execute(
+
+def migrate_standings(conn: sqlite3.Connection) -> None:
+    for statement in iter_sql_statements(STANDINGS_SCHEMA_SQL):
+        conn.execute(statement)
+    rebuild_standings(conn)
+
+
+# Ordered (version, description, step) entries keyed on PRAGMA user_version.
+# A step is either a SQL script or a callable taking the connection. Append
+# new entries; never edit or reorder ones that have shipped.
+MIGRATIONS = [
+    (1, "baseline schema", migrate_baseline_schema),
+    (
+        2,
+        "indexes for hot query paths",
+        """
+        CREATE INDEX IF NOT EXISTS idx_tournaments_name ON tournaments(name);
+        CREATE INDEX IF NOT EXISTS idx_tournaments_dates ON tournaments(start_date, end_date);
+        CREATE INDEX IF NOT EXISTS idx_tournaments_end_date ON tournaments(end_date);
+        CREATE INDEX IF NOT EXISTS idx_tournaments_rapid_tourn_id ON tournaments(rapid_tourn_id);
+        CREATE INDEX IF NOT EXISTS idx_tournaments_season ON tournaments(season, bdl_id);
+        CREATE INDEX IF NOT EXISTS idx_picks_tournament ON picks(tournament_id, user_id, golfer_id);
+        CREATE INDEX IF NOT EXISTS idx_results_golfer ON results(golfer_id);
+        CREATE INDEX IF NOT EXISTS idx_golfers_active_name ON golfers(active, name);
+        """,
+    ),
+    (3, "data version counters", migrate_data_versions),
+    (4, "standings read model", migrate_standings),
+    (
+        5,
+        "sheets outbox",
+        """
+        CREATE TABLE IF NOT EXISTS sheets_outbox (
+          sheet_name TEXT PRIMARY KEY,
+          seq INTEGER NOT NULL DEFAULT 1,
+          enqueued_at TEXT NOT NULL,
+          attempts INTEGER NOT NULL DEFAULT 0,
+          next_attempt_at TEXT,
+          last_error TEXT
+        ) WITHOUT ROWID;
+        """,
+    ),
+    (
+        6,
+        "pick event log",
+        """
+        CREATE TABLE IF NOT EXISTS pick_events (
+          id INTEGER PRIMARY KEY AUTOINCREMENT,
+          event_id TEXT NOT NULL UNIQUE,
+          kind TEXT NOT NULL,
+          user_name TEXT NOT NULL,
+          tournament_name TEXT,
+          golfer_name TEXT,
+          at TEXT NOT NULL,
+          pushed INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS idx_pick_events_pushed ON pick_events(pushed, id);
+        CREATE TRIGGER IF NOT EXISTS trg_pick_events_created AFTER INSERT ON picks BEGIN
+          INSERT INTO pick_events (event_id, kind, user_name, tournament_name, golfer_name, at)
+          SELECT lower(hex(randomblob(8))), 'created', users.name, tournaments.name, golfers.name, NEW.created_at
+          FROM users, tournaments, golfers
+          WHERE users.id = NEW.user_id AND tournaments.id = NEW.tournament_id AND golfers.id = NEW.golfer_id;
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_pick_events_deleted AFTER DELETE ON picks BEGIN
+          INSERT INTO pick_events (event_id, kind, user_name, tournament_name, golfer_name, at)
+          SELECT lower(hex(randomblob(8))), 'deleted', users.name, tournaments.name, golfers.name,
+                 strftime('%Y-%m-%dT%H:%M:%f', 'now')
+          FROM users, tournaments, golfers
+          WHERE users.id = OLD.user_id AND tournaments.id = OLD.tournament_id AND golfers.id = OLD.golfer_id;
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_pick_events_double_pick
+        AFTER UPDATE OF double_pick_used ON users
+        WHEN NEW.double_pick_used = 1 AND OLD.double_pick_used = 0 BEGIN
+          INSERT INTO pick_events (event_id, kind, user_name, at)
+          VALUES (lower(hex(randomblob(8))), 'double_pick', NEW.name, strftime('%Y-%m-%dT%H:%M:%f', 'now'));
+        END;
+        """,
+    ),
+    (7, "row-versioned sheet sync", migrate_row_sync),
+    (
+        8,
+        "row sync keys for cascaded result deletes",
+        # A cascaded results delete fires after its parent row is gone, so the
+        # results trigger cannot build the key; log the child keys up front.
+        """
+        CREATE TRIGGER IF NOT EXISTS trg_tournaments_sync_cascade BEFORE DELETE ON tournaments BEGIN
+          INSERT INTO sync_changes (table_name, row_key, seq, updated_at)
+          SELECT 'results', OLD.name || char(31) || golfers.name,
+                 (SELECT COALESCE(MAX(seq), 0) + 1 FROM sync_changes), strftime('%Y-%m-%dT%H:%M:%f', 'now')
+          FROM results JOIN golfers ON golfers.id = results.golfer_id
+          WHERE results.tournament_id = OLD.id
+          ON CONFLICT(table_name, row_key) DO UPDATE SET seq = excluded.seq, updated_at = excluded.updated_at;
+        END;
+        CREATE TRIGGER IF NOT EXISTS trg_golfers_sync_cascade BEFORE DELETE ON golfers BEGIN
+          INSERT INTO sync_changes (table_name, row_key, seq, updated_at)
+          SELECT 'results', tournaments.name || char(31) || OLD.name,
+                 (SELECT COALESCE(MAX(seq), 0) + 1 FROM sync_changes), strftime('%Y-%m-%dT%H:%M:%f', 'now')
+          FROM results JOIN tournaments ON tournaments.id = results.tournament_id
+          WHERE results.golfer_id = OLD.id
+          ON CONFLICT(table_name, row_key) DO UPDATE SET seq = excluded.seq, updated_at = excluded.updated_at;
+        END;
+        """,
+    ),
+    (
+        9,
+        "picks by golfer index",
+        # Updating or deleting a golfer checks picks.golfer_id for the foreign
+        # key, which otherwise scans every pick.
+        "CREATE INDEX IF NOT EXISTS idx_picks_golfer ON picks(golfer_id);",
+    ),
+]
+SCHEMA_VERSION = MIGRATIONS[-1][0]
+
+
+def get_schema_version(conn: sqlite3.Connection) -> int:
+    return conn.execute("PRAGMA user_version").fetchone()[0]
+
+
+def plan_migrations(conn: sqlite3.Connection) -> list[tuple[int, str]]:
+    current = get_schema_version(conn)
+    return [(version, description) for version, description, _ in MIGRATIONS if version > current]
+
+
+def migrate_db(conn: sqlite3.Connection, dry_run: bool = False) -> list[tuple[int, str]]:
+    pending = plan_migrations(conn)
+    if dry_run or not pending:
+        return pending
+    if conn.in_transaction:
+        conn.commit()
+    pending_versions = {version for version, _ in pending}
+    for version, _, step in MIGRATIONS:
+        if version not in pending_versions:
+            continue
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            # Another process may have migrated while we waited for the lock.
+            if version <= get_schema_version(conn):
+                conn.rollback()
+                continue
+            if callable(step):
+                step(conn)
+            else:
+                for statement in iter_sql_statements(step):
+                    conn.execute(statement)
+            conn.execute(f"PRAGMA user_version = {version}")
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+    return pending
+
+
+def init_db(conn: sqlite3.Connection) -> None:
+    migrate_db(conn)
+
+
+def get_data_versions(conn: sqlite3.Connection) -> dict[str, int]:
+    return {
+        row[0]: row[1]
+        for row in conn.execute("SELECT table_name, version FROM data_versions").fetchall()
+    }
+
+
+def get_data_version(conn: sqlite3.Connection, tables) -> tuple:
+    versions = get_data_versions(conn)
+    return tuple(versions.get(table, 0) for table in tables)
+
+
+@st.cache_resource(show_spinner=False)
+def get_query_cache() -> dict:
+    return {"lock": threading.Lock(), "entries": {}}
+
+
+def cached_by_data_version(conn: sqlite3.Connection, key: str, tables, loader, *args):
+    # Results are shared across sessions and processes' reruns until one of
+    # the tables they read from is written to, or the loader's args (e.g.
+    # today's date) change. One entry per key, so the cache never grows.
+    version = get_data_version(conn, tables)
+    cache = get_query_cache()
+    cache_key = (os.path.abspath(get_db_path()), key)
+    entry = cache["entries"].get(cache_key)
+    if entry and entry["version"] == version and entry["args"] == args:
+        return entry["value"]
+    value = loader(*args)
+    with cache["lock"]:
+        cache["entries"][cache_key] = {"version": version, "args": args, "value": value}
+    return value
+
+
+def get_sync_meta(conn: sqlite3.Connection, key: str) -> Optional[str]:
+    row = conn.execute("SELECT value FROM sync_meta WHERE key = ?", (key,)).fetchone()
+    return row[0] if row else None
+
+
+def set_sync_meta(conn: sqlite3.Connection, key: str, value: str) -> None:
+    conn.execute(
+        "INSERT INTO sync_meta (key, value) VALUES (?, ?) "
+        "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
+        (key, value),
+    )
+
+
+def seed_if_needed(conn: sqlite3.Connection) -> None:
+    if conn.execute("SELECT COUNT(*) FROM users").fetchone()[0] == 0:
+        conn.executemany(
+            "INSERT INTO users (name, is_admin) VALUES (?, ?)",
+            [(u, 1 if u == "Carl" else 0) for u in USERS],
+        )
+    else:
+        conn.execute("UPDATE users SET is_admin = 1 WHERE name = ?", ("Carl",))
+
+    # Remove tournaments we don't want in the schedule
+    conn.execute("DELETE FROM tournaments WHERE name = ?", ("Puerto Rico Open",))
+    conn.execute("DELETE FROM tournaments WHERE name = ?", ("ONEflight Myrtle Beach Classic",))
+    conn.execute("DELETE FROM tournaments WHERE name = ?", ("ISCO Championship",))
+    conn.execute("DELETE FROM tournaments WHERE name = ?", ("Corales Puntacana Championship",))
+
+    if conn.execute("SELECT COUNT(*) FROM golfers").fetchone()[0] == 0:
+        conn.executemany(
+            "INSERT INTO golfers (name, fedex_rank, fedex_points) VALUES (?, ?, ?)",
+            SEED_GOLFERS,
+        )
+
+    existing_tournaments = {
+        row["name"]: row
+        for row in conn.execute("SELECT id, name FROM tournaments").fetchall()
+    }
+    for tournament in SEED_TOURNAMENTS:
+        name, start, end, is_major, is_signature, season, purse = tournament
+        if name in existing_tournaments:
+            conn.execute(
+                "UPDATE tournaments SET start_date = ?, end_date = ?, is_major = ?, is_signature = ?, season = ?, purse = ? WHERE id = ?",
+                (start, end, is_major, is_signature, season, purse, existing_tournaments[name]["id"]),
+            )
+        else:
+            conn.execute(
+                "INSERT INTO tournaments (name, start_date, end_date, is_major, is_signature, season, purse) VALUES (?, ?, ?, ?, ?, ?, ?)",
+                (name, start, end, is_major, is_signature, season, purse),
+            )
+
+    if conn.execute("SELECT COUNT(*) FROM picks").fetchone()[0] == 0 and get_storage_backend() is None:
+        tournament_id = conn.execute(
+            "SELECT id FROM tournaments WHERE name = ?", ("WM Phoenix Open",)
+        ).fetchone()[0]
+        for user_name, golfer_name, purse, position in INITIAL_PICKS:
+            user_id = conn.execute("SELECT id FROM users WHERE name = ?", (user_name,)).fetchone()[0]
+            golfer_id = conn.execute("SELECT id FROM golfers WHERE name = ?", (golfer_name,)).fetchone()[0]
+            conn.execute(
                 "INSERT OR IGNORE INTO picks (user_id, tournament_id, golfer_id, created_at) VALUES (?, ?, ?, ?)",
                 (user_id, tournament_id, golfer_id, datetime.utcnow().isoformat()),
             )
@@ -573,43 +1895,209 @@ def seed_if_needed(conn: sqlite3.Connection) -> None:
         )
     conn.commit()
 
-def resolve_entity_id(conn: sqlite3.Connection, table: str, name: str) -> Optional[int]:
-    row = conn.execute(f"SELECT id FROM {table} WHERE name = ?", (name,)).fetchone()
-    if row:
-        return row["id"]
-    normalized_target = normalize_lookup_name(name)
-    for candidate in conn.execute(f"SELECT id, name FROM {table}").fetchall():
-        if normalize_lookup_name(candidate["name"]) == normalized_target:
-            return candidate["id"]
-    return None
+PICK_IMPORT_FIELDS = {"user": "users", "tournament": "tournaments", "golfer": "golfers"}
+RESULT_IMPORT_FIELDS = {"tournament": "tournaments", "golfer": "golfers"}
+
+
+def load_name_index(conn: sqlite3.Connection, table: str) -> dict[str, dict]:
+    exact: dict[str, int] = {}
+    normalized: dict[str, int] = {}
+    for row in conn.execute(f"SELECT id, name FROM {table} ORDER BY id"):
+        exact.setdefault(row["name"], row["id"])
+        normalized.setdefault(normalize_lookup_name(row["name"]), row["id"])
+    return {"exact": exact, "normalized": normalized}
+
+
+def lookup_name_id(index: dict[str, dict], name) -> Optional[int]:
+    name = "" if name is None else str(name)
+    if name in index["exact"]:
+        return index["exact"][name]
+    if not name.strip():
+        return None
+    return index["normalized"].get(normalize_lookup_name(name))
+
+
+def new_import_report(total: int) -> dict:
+    return {"total": total, "imported": 0, "created_golfers": [], "unresolved": []}
+
+
+def resolve_import_rows(
+    conn: sqlite3.Connection,
+    rows: list[dict],
+    fields: dict[str, str],
+    create_golfers: bool = True,
+) -> tuple[list[tuple[int, dict, dict[str, int]]], dict]:
+    # One SELECT per referenced table and one executemany for missing golfers,
+    # however many rows are imported. Nothing is committed here.
+    indexes = {table: load_name_index(conn, table) for table in set(fields.values())}
+    report = new_import_report(len(rows))
+    resolved_ids = [
+        {field: lookup_name_id(indexes[table], row.get(field)) for field, table in fields.items()}
+        for row in rows
+    ]
+    if create_golfers and "golfers" in indexes:
+        missing = {}
+        for row, ids in zip(rows, resolved_ids):
+            unresolved_fields = [field for field, value in ids.items() if value is None]
+            # Only create golfers for rows that would otherwise import.
+            if unresolved_fields and all(fields[field] == "golfers" for field in unresolved_fields):
+                for field in unresolved_fields:
+                    name = str(row.get(field) or "").strip()
+                    if name:
+                        missing[name] = None
+        if missing:
+            conn.executemany(
+                "INSERT INTO golfers (name, active) VALUES (?, 0) ON CONFLICT(name) DO NOTHING",
+                [(name,) for name in missing],
+            )
+            golfers = load_name_index(conn, "golfers")
+            for row, ids in zip(rows, resolved_ids):
+                for field, table in fields.items():
+                    if table == "golfers" and ids[field] is None:
+                        ids[field] = lookup_name_id(golfers, row.get(field))
+            report["created_golfers"] = list(missing)
+    resolved = []
+    for line, (row, ids) in enumerate(zip(rows, resolved_ids), start=1):
+        unresolved_fields = [field for field, value in ids.items() if value is None]
+        if unresolved_fields:
+            report["unresolved"].append({"line": line, "row": row, "missing": unresolved_fields})
+            continue
+        resolved.append((line, row, ids))
+    return resolved, report
 
 
-def ensure_golfer_id(conn: sqlite3.Connection, name: str) -> Optional[int]:
-    golfer_id = resolve_entity_id(conn, "golfers", name)
-    if golfer_id:
-        return golfer_id
-    cleaned = (name or "").strip()
-    if not cleaned:
+def parse_purse(value) -> Optional[int]:
+    text = str(value if value is not None else "").replace("$", "").replace(",", "").strip()
+    try:
+        return int(float(text or 0))
+    except ValueError:
         return None
-    cursor = conn.execute(
-        "INSERT INTO golfers (name, active) VALUES (?, 0)",
-        (cleaned,),
+
+
+def parse_position(value) -> Optional[int]:
+    text = str(value if value is not None else "").strip()
+    return int(text) if text.isdigit() else None
+
+
+def import_picks(conn: sqlite3.Connection, rows: list[dict], replace: bool = False) -> dict:
+    resolved, report = resolve_import_rows(conn, rows, PICK_IMPORT_FIELDS)
+    now = datetime.utcnow().isoformat()
+    pending = [
+        (ids["user"], ids["tournament"], ids["golfer"], row.get("created_at") or now)
+        for _, row, ids in resolved
+    ]
+    if pending:
+        if replace:
+            conn.execute("DELETE FROM picks")
+        conn.executemany(
+            "INSERT OR IGNORE INTO picks (user_id, tournament_id, golfer_id, created_at) VALUES (?, ?, ?, ?)",
+            pending,
+        )
+    report["imported"] = len(pending)
+    return report
+
+
+def import_results(
+    conn: sqlite3.Connection,
+    rows: list[dict],
+    replace: bool = False,
+    create_golfers: bool = True,
+) -> dict:
+    resolved, report = resolve_import_rows(conn, rows, RESULT_IMPORT_FIELDS, create_golfers=create_golfers)
+    desired: dict[tuple[int, int], tuple] = {}
+    for line, row, ids in resolved:
+        purse = parse_purse(row.get("purse"))
+        if purse is None:
+            report["unresolved"].append({"line": line, "row": row, "missing": ["purse"]})
+            continue
+        desired[(ids["tournament"], ids["golfer"])] = (purse, parse_position(row.get("position")))
+    stale = []
+    if desired and replace:
+        # Keyed merge: only rows that differ are written, so unchanged results
+        # don't fire triggers or churn the WAL.
+        existing = {
+            (row["tournament_id"], row["golfer_id"]): (row["purse"], row["position"])
+            for row in conn.execute("SELECT tournament_id, golfer_id, purse, position FROM results")
+        }
+        stale = [key for key in existing if key not in desired]
+        changed = [(*key, *values) for key, values in desired.items() if existing.get(key) != values]
+        conn.executemany("DELETE FROM results WHERE tournament_id = ? AND golfer_id = ?", stale)
+    else:
+        changed = [(*key, *values) for key, values in desired.items()]
+    conn.executemany(
+        "INSERT INTO results (tournament_id, golfer_id, purse, position) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(tournament_id, golfer_id) DO UPDATE SET purse = excluded.purse, position = excluded.position",
+        changed,
     )
-    conn.commit()
-    return cursor.lastrowid
+    report["imported"] = len(desired)
+    report["changed"] = len(changed) + len(stale)
+    return report
+
+
+def import_golfers(
+    conn: sqlite3.Connection,
+    rows: list[dict],
+    deactivate_others: bool = False,
+    clear_stats: bool = False,
+) -> dict:
+    index = load_name_index(conn, "golfers")
+    report = new_import_report(len(rows))
+    updates: dict[int, tuple] = {}
+    inserts: dict[str, tuple] = {}
+    for line, row in enumerate(rows, start=1):
+        name = str(row.get("name") or "").strip()
+        if not name:
+            report["unresolved"].append({"line": line, "row": row, "missing": ["name"]})
+            continue
+        stats = (None, None) if clear_stats else (row.get("fedex_rank"), row.get("fedex_points"))
+        golfer_id = lookup_name_id(index, name)
+        if golfer_id:
+            updates[golfer_id] = (*stats, golfer_id)
+        else:
+            inserts[name] = (name, *stats)
+    if deactivate_others:
+        conn.execute("UPDATE golfers SET active = 0")
+    if clear_stats:
+        update_sql = "UPDATE golfers SET active = 1, fedex_rank = ?, fedex_points = ? WHERE id = ?"
+    else:
+        update_sql = (
+            "UPDATE golfers SET active = 1, fedex_rank = COALESCE(?, fedex_rank), "
+            "fedex_points = COALESCE(?, fedex_points) WHERE id = ?"
+        )
+    conn.executemany(update_sql, list(updates.values()))
+    conn.executemany(
+        "INSERT INTO golfers (name, fedex_rank, fedex_points, active) VALUES (?, ?, ?, 1) "
+        "ON CONFLICT(name) DO UPDATE SET active = 1",
+        list(inserts.values()),
+    )
+    report["imported"] = len(updates) + len(inserts)
+    report["created_golfers"] = list(inserts)
+    return report
+
+
+def describe_unresolved(report: dict, limit: int = 10) -> str:
+    lines = []
+    for item in report["unresolved"][:limit]:
+        row = item["row"]
+        values = ", ".join(str(row.get(field) or "?") for field in item["missing"])
+        lines.append(f"line {item['line']}: unknown {'/'.join(item['missing'])} ({values})")
+    if len(report["unresolved"]) > limit:
+        lines.append(f"... and {len(report['unresolved']) - limit} more")
+    return "; ".join(lines)
 
 
 def reconcile_recovery_picks(conn: sqlite3.Connection) -> bool:
     desired: dict[tuple[int, int], list[int]] = {}
-    unresolved: list[tuple[str, str, str]] = []
-    for user_name, tournament_name, golfer_name in RECOVERY_PICKS:
-        user_id = resolve_entity_id(conn, "users", user_name)
-        tournament_id = resolve_entity_id(conn, "tournaments", tournament_name)
-        golfer_id = ensure_golfer_id(conn, golfer_name)
-        if not user_id or not tournament_id or not golfer_id:
-            unresolved.append((user_name, tournament_name, golfer_name))
-            continue
-        desired.setdefault((user_id, tournament_id), []).append(golfer_id)
+    resolved, _ = resolve_import_rows(
+        conn,
+        [
+            {"user": user_name, "tournament": tournament_name, "golfer": golfer_name}
+            for user_name, tournament_name, golfer_name in RECOVERY_PICKS
+        ],
+        PICK_IMPORT_FIELDS,
+    )
+    for _, _, ids in resolved:
+        desired.setdefault((ids["user"], ids["tournament"]), []).append(ids["golfer"])
 
     changed = False
     for (user_id, tournament_id), desired_ids in desired.items():
@@ -633,7 +2121,6 @@ def reconcile_recovery_picks(conn: sqlite3.Connection) -> bool:
         changed = True
 
     if changed:
-        conn.commit()
         persist_picks(conn)
     return changed
 
@@ -691,352 +2178,980 @@ def save_picks_snapshot(conn: sqlite3.Connection) -> None:
     with open(path, "w", encoding="utf-8") as handle:
         json.dump(payload, handle, indent=2)
 
-def sync_picks_from_sheet(conn: sqlite3.Connection) -> bool:
-    worksheet = get_picks_worksheet()
-    if not worksheet:
-        return False
-    rows = get_cached_sheet_records("picks")
-    if rows is None:
-        return False
-    if not rows:
-        return False
-    pending = []
-    for row in rows:
-        user = conn.execute("SELECT id FROM users WHERE name = ?", (row.get("user"),)).fetchone()
-        tournament = conn.execute("SELECT id FROM tournaments WHERE name = ?", (row.get("tournament"),)).fetchone()
-        golfer_id = ensure_golfer_id(conn, row.get("golfer"))
-        if not user or not tournament or not golfer_id:
-            continue
-        pending.append(
-            (user["id"], tournament["id"], golfer_id, row.get("created_at") or datetime.utcnow().isoformat())
-        )
-    if not pending:
-        return False
-    conn.execute("DELETE FROM picks")
-    conn.executemany(
-        "INSERT OR IGNORE INTO picks (user_id, tournament_id, golfer_id, created_at) VALUES (?, ?, ?, ?)",
-        pending,
-    )
-    conn.commit()
-    return True
+SHEET_EXPORTS = {
+    "picks": {
+        "rows": 200,
+        "header": ["user", "tournament", "golfer", "created_at"],
+        "key_width": 3,
+        "stamped": False,
+        "sql": """
+            SELECT users.name as user,
+                   tournaments.name as tournament,
+                   golfers.name as golfer,
+                   picks.created_at as created_at
+            FROM picks
+            JOIN users ON users.id = picks.user_id
+            JOIN tournaments ON tournaments.id = picks.tournament_id
+            JOIN golfers ON golfers.id = picks.golfer_id
+            ORDER BY picks.created_at
+        """,
+        "row": lambda row: [row["user"], row["tournament"], row["golfer"], row["created_at"]],
+    },
+    "results": {
+        "rows": 500,
+        "header": ["tournament", "golfer", "purse", "position", "updated_at"],
+        "key_width": 2,
+        "stamped": True,
+        "sql": """
+            SELECT tournaments.name as tournament,
+                   golfers.name as golfer,
+                   results.purse as purse,
+                   results.position as position
+            FROM results
+            JOIN tournaments ON tournaments.id = results.tournament_id
+            JOIN golfers ON golfers.id = results.golfer_id
+            ORDER BY tournaments.start_date, golfers.name
+        """,
+        "row": lambda row: [row["tournament"], row["golfer"], row["purse"] or 0, row["position"] or ""],
+    },
+    "golfers": {
+        "rows": 500,
+        "header": ["name", "fedex_rank", "fedex_points", "active", "bdl_id", "updated_at"],
+        "key_width": 1,
+        "stamped": True,
+        "sql": "SELECT name, fedex_rank, fedex_points, active, bdl_id FROM golfers ORDER BY name",
+        "row": lambda row: [
+            row["name"],
+            row["fedex_rank"] or "",
+            row["fedex_points"] or "",
+            1 if row["active"] else 0,
+            row["bdl_id"] or "",
+        ],
+    },
+    "users": {
+        "rows": 200,
+        "header": ["name", "pin_hash", "is_admin", "double_pick_used", "updated_at"],
+        "key_width": 1,
+        "stamped": True,
+        "sql": "SELECT name, pin_hash, is_admin, double_pick_used FROM users ORDER BY name",
+        "row": lambda row: [row["name"], row["pin_hash"] or "", row["is_admin"], row["double_pick_used"]],
+    },
+}
 
+PICK_EVENTS_SHEET = "pick_events"
+PICK_EVENT_HEADER = ["event_id", "kind", "user", "tournament", "golfer", "at", "checkpoint"]
+PICK_EVENTS_COMPACT_AFTER = 500
+# Append-only tabs: created like the exported ones but never diff-written.
+SHEET_EVENT_TABS = {PICK_EVENTS_SHEET: {"rows": 1000, "header": PICK_EVENT_HEADER}}
 
-def sync_results_from_sheet(conn: sqlite3.Connection) -> bool:
-    worksheet = get_results_worksheet()
-    if not worksheet:
-        return False
-    rows = get_cached_sheet_records("results")
-    if rows is None:
-        return False
-    if not rows:
-        return False
-    pending = []
-    for row in rows:
-        tournament = conn.execute("SELECT id FROM tournaments WHERE name = ?", (row.get("tournament"),)).fetchone()
-        golfer_id = ensure_golfer_id(conn, row.get("golfer"))
-        if not tournament or not golfer_id:
-            continue
-        purse = row.get("purse") or 0
-        position = row.get("position")
-        pending.append((tournament["id"], golfer_id, int(purse), int(position) if position else None))
-    if not pending:
-        return False
-    conn.execute("DELETE FROM results")
-    conn.executemany(
-        "INSERT OR IGNORE INTO results (tournament_id, golfer_id, purse, position) VALUES (?, ?, ?, ?)",
-        pending,
-    )
-    latest_updated_at = max(
-        (str(row.get("updated_at") or "").strip() for row in rows),
-        default="",
-    )
-    if latest_updated_at:
-        conn.execute(
-            "INSERT INTO sync_meta (key, value) VALUES (?, ?) "
-            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-            ("results_sheet_updated_at", latest_updated_at),
-        )
-    conn.commit()
-    return True
 
+def get_sheet_tab_spec(sheet_name: str) -> dict:
+    return SHEET_EXPORTS.get(sheet_name) or SHEET_EVENT_TABS[sheet_name]
 
-def sync_results_to_sheet(conn: sqlite3.Connection) -> bool:
-    worksheet = get_results_worksheet()
-    if not worksheet:
+
+def sheet_cell_text(value) -> str:
+    if value is None:
+        return ""
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def diff_sheet_rows(
+    layout: list[list[str]], spec: dict, local_rows: list[list], now: str
+) -> tuple[dict[int, list], list[list[str]]]:
+    header = spec["header"]
+    width = len(header)
+    data_width = width - 1 if spec["stamped"] else width
+    key_width = spec["key_width"]
+    existing = [(list(row) + [""] * width)[:width] for row in layout[1:]]
+
+    def stamped(values: list) -> list:
+        # A row may bring its own updated_at (the time of the edit it carries).
+        if not spec["stamped"]:
+            return list(values)
+        return list(values[:data_width]) + [values[data_width] if len(values) > data_width else now]
+
+    header_ok = bool(layout) and layout[0][:width] == header
+    desired = {}
+    for values in local_rows:
+        desired.setdefault(tuple(sheet_cell_text(v) for v in values[:key_width]), values)
+
+    writes: dict[int, list] = {} if header_ok else {1: list(header)}
+    placed: dict[int, list] = {}
+    free = []
+    for row_number, current in enumerate(existing, start=2):
+        key = tuple(current[:key_width])
+        values = desired.pop(key, None) if header_ok else None
+        if values is None:
+            free.append(row_number)
+            continue
+        if [sheet_cell_text(v) for v in values[:data_width]] == current[:data_width]:
+            placed[row_number] = current
+        else:
+            placed[row_number] = stamped(values)
+            writes[row_number] = placed[row_number]
+
+    last_row = len(existing) + 1
+    for values in desired.values():
+        if free:
+            row_number = free.pop(0)
+        else:
+            last_row += 1
+            row_number = last_row
+        placed[row_number] = stamped(values)
+        writes[row_number] = placed[row_number]
+
+    # Close gaps left by deleted rows by moving tail rows up, then blank the
+    # now-unused tail so the sheet never holds stale records.
+    end = len(placed) + 1
+    for row_number in sorted((n for n in placed if n > end), reverse=True):
+        slot = free.pop(0)
+        placed[slot] = placed.pop(row_number)
+        writes[slot] = placed[slot]
+        writes.pop(row_number, None)
+    for row_number in range(end + 1, last_row + 1):
+        writes[row_number] = [""] * width
+
+    new_layout = [list(header)] + [[sheet_cell_text(v) for v in placed[n]] for n in range(2, end + 1)]
+    return writes, new_layout
+
+
+def sheet_write_ranges(title: str, writes: dict[int, list]) -> list[dict]:
+    ranges = []
+    block_start = None
+    block: list[list] = []
+    for row_number in sorted(writes) + [None]:
+        if block and (row_number is None or row_number != block_start + len(block)):
+            end_cell = gspread.utils.rowcol_to_a1(block_start + len(block) - 1, max(len(r) for r in block))
+            ranges.append({"range": f"'{title}'!A{block_start}:{end_cell}", "values": block})
+            block = []
+        if row_number is not None:
+            if not block:
+                block_start = row_number
+            block.append(writes[row_number])
+    return ranges
+
+
+def holds_sheets_lock(func):
+    # Every sync or write against the backend runs under the outbox's flush
+    # lock (re-entrant, since these nest), so a rerun and the worker never
+    # diff against the same snapshot or cached layout and both push.
+    @functools.wraps(func)
+    def locked(*args, **kwargs):
+        with get_outbox_worker()["flush_lock"]:
+            return func(*args, **kwargs)
+
+    return locked
+
+
+@holds_sheets_lock
+def write_sheet_deltas(
+    conn: sqlite3.Connection, sheet_names: list[str], rows_by_sheet: Optional[dict[str, list[list]]] = None
+) -> bool:
+    global SHEETS_LAST_ERROR
+    backend = get_storage_backend()
+    if backend is None:
         return False
-    rows = conn.execute(
-        """
-        SELECT tournaments.name as tournament,
-               golfers.name as golfer,
-               results.purse as purse,
-               results.position as position
-        FROM results
-        JOIN tournaments ON tournaments.id = results.tournament_id
-        JOIN golfers ON golfers.id = results.golfer_id
-        ORDER BY tournaments.start_date, golfers.name
-        """
-    ).fetchall()
-    values = [["tournament", "golfer", "purse", "position", "updated_at"]]
     now = datetime.utcnow().isoformat()
-    for row in rows:
-        values.append(
-            [row["tournament"], row["golfer"], row["purse"] or 0, row["position"] or "", now]
-        )
+    writes_by_sheet = {}
+    staged = []
     try:
-        worksheet.clear()
-        worksheet.update(values=values, range_name="A1")
-        clear_sheet_records_cache("results")
-        conn.execute(
-            "INSERT INTO sync_meta (key, value) VALUES (?, ?) "
-            "ON CONFLICT(key) DO UPDATE SET value = excluded.value",
-            ("results_sheet_updated_at", now),
-        )
-        conn.commit()
-        return True
-    except APIError as exc:
-        global SHEETS_LAST_ERROR
+        # Last-known cell text of each tab, header included. Read from the
+        # backend only when we have no copy (first write, or after an error).
+        missing = [sheet_name for sheet_name in sheet_names if sheet_name not in SHEETS_CACHE["layouts"]]
+        if missing:
+            for sheet_name, values in backend.read_tabs(missing).items():
+                SHEETS_CACHE["layouts"][sheet_name] = pad_sheet_values(values)
+        for sheet_name in sheet_names:
+            spec = SHEET_EXPORTS[sheet_name]
+            if rows_by_sheet and sheet_name in rows_by_sheet:
+                local_rows = rows_by_sheet[sheet_name]
+            else:
+                local_rows = [spec["row"](row) for row in conn.execute(spec["sql"]).fetchall()]
+            writes, new_layout = diff_sheet_rows(SHEETS_CACHE["layouts"][sheet_name], spec, local_rows, now)
+            if writes:
+                writes_by_sheet[sheet_name] = writes
+            staged.append((sheet_name, new_layout, bool(writes)))
+        if writes_by_sheet:
+            backend.write_rows(writes_by_sheet)
+    except (APIError, SheetsUnavailableError) as exc:
         SHEETS_LAST_ERROR = f"{type(exc).__name__}: {exc}"
+        for sheet_name in sheet_names:
+            SHEETS_CACHE["layouts"].pop(sheet_name, None)
         return False
+    for sheet_name, new_layout, changed in staged:
+        SHEETS_CACHE["layouts"][sheet_name] = new_layout
+        if changed:
+            clear_sheet_records_cache(sheet_name)
+            if sheet_name == "results":
+                set_sync_meta(conn, "results_sheet_updated_at", now)
+                conn.commit()
+    return True
 
 
-def sync_golfers_from_sheet(conn: sqlite3.Connection) -> bool:
-    worksheet = get_golfers_worksheet()
-    if not worksheet:
-        return False
-    rows = get_cached_sheet_records("golfers")
-    if rows is None or not rows:
-        return False
-    pending = []
-    for row in rows:
-        name = (row.get("name") or "").strip()
-        if not name:
-            continue
-        rank = row.get("fedex_rank")
-        points = row.get("fedex_points")
-        active = row.get("active")
-        bdl_id = row.get("bdl_id")
-        pending.append(
-            (
-                name,
-                int(rank) if str(rank).strip().isdigit() else None,
-                int(points) if str(points).strip().isdigit() else None,
-                1 if str(active).strip().lower() in {"1", "true", "yes"} else 0,
-                int(bdl_id) if str(bdl_id).strip().isdigit() else None,
-            )
-        )
-    if not pending:
-        return False
-    # Never delete golfers here: picks/results reference golfers with ON DELETE CASCADE,
-    # and replacing the roster should only affect active-field state, not history.
-    conn.execute("UPDATE golfers SET active = 0")
-    conn.executemany(
-        "INSERT INTO golfers (name, fedex_rank, fedex_points, active, bdl_id) VALUES (?, ?, ?, ?, ?) "
-        "ON CONFLICT(name) DO UPDATE SET "
-        "fedex_rank = COALESCE(excluded.fedex_rank, golfers.fedex_rank), "
-        "fedex_points = COALESCE(excluded.fedex_points, golfers.fedex_points), "
-        "active = excluded.active, "
-        "bdl_id = COALESCE(excluded.bdl_id, golfers.bdl_id)",
-        pending,
-    )
-    conn.commit()
-    return True
+def sync_results_to_sheet(conn: sqlite3.Connection) -> bool:
+    return write_sheet_deltas(conn, ["results"])
+
 
 
 def sync_golfers_to_sheet(conn: sqlite3.Connection) -> bool:
-    worksheet = get_golfers_worksheet()
-    if not worksheet:
-        return False
-    rows = conn.execute(
-        """
-        SELECT name, fedex_rank, fedex_points, active, bdl_id
-        FROM golfers
-        ORDER BY name
-        """
-    ).fetchall()
-    values = [["name", "fedex_rank", "fedex_points", "active", "bdl_id"]]
-    for row in rows:
-        values.append(
-            [
-                row["name"],
-                row["fedex_rank"] or "",
-                row["fedex_points"] or "",
-                1 if row["active"] else 0,
-                row["bdl_id"] or "",
-            ]
-        )
-    try:
-        worksheet.clear()
-        worksheet.update(values=values, range_name="A1")
-        clear_sheet_records_cache("golfers")
-        return True
-    except APIError as exc:
-        global SHEETS_LAST_ERROR
-        SHEETS_LAST_ERROR = f"{type(exc).__name__}: {exc}"
-        return False
+    return write_sheet_deltas(conn, ["golfers"])
 
-def sync_users_from_sheet(conn: sqlite3.Connection) -> bool:
-    worksheet = get_users_worksheet()
-    if not worksheet:
-        return False
-    rows = get_cached_sheet_records("users")
-    if rows is None:
-        return False
-    if not rows:
-        return False
-    restored = 0
-    for row in rows:
-        name = (row.get("name") or "").strip()
-        if not name:
-            continue
-        pin_hash = (row.get("pin_hash") or "").strip() or None
-        is_admin = 1 if str(row.get("is_admin") or "0").strip() in ("1", "true", "True") else 0
-        double_pick_used = 1 if str(row.get("double_pick_used") or "0").strip() in ("1", "true", "True") else 0
-        existing = conn.execute("SELECT id, pin_hash FROM users WHERE name = ?", (name,)).fetchone()
-        if existing:
-            if pin_hash:
-                conn.execute(
-                    "UPDATE users SET pin_hash = ?, is_admin = ?, double_pick_used = ? WHERE id = ?",
-                    (pin_hash, is_admin, double_pick_used, existing["id"]),
-                )
-            else:
-                conn.execute(
-                    "UPDATE users SET is_admin = ?, double_pick_used = ? WHERE id = ?",
-                    (is_admin, double_pick_used, existing["id"]),
-                )
-        else:
-            conn.execute(
-                "INSERT INTO users (name, pin_hash, is_admin, double_pick_used) VALUES (?, ?, ?, ?)",
-                (name, pin_hash, is_admin, double_pick_used),
-            )
-        restored += 1
-    conn.commit()
-    return restored > 0
 
 def sync_users_to_sheet(conn: sqlite3.Connection) -> None:
-    worksheet = get_users_worksheet()
-    if not worksheet:
-        return
-    rows = conn.execute(
-        "SELECT name, pin_hash, is_admin, double_pick_used FROM users ORDER BY name"
-    ).fetchall()
-    values = [["name", "pin_hash", "is_admin", "double_pick_used", "updated_at"]]
-    now = datetime.utcnow().isoformat()
-    for row in rows:
-        values.append(
-            [row["name"], row["pin_hash"] or "", row["is_admin"], row["double_pick_used"], now]
-        )
-    try:
-        worksheet.clear()
-        worksheet.update(values=values, range_name="A1")
-        clear_sheet_records_cache("users")
-    except APIError as exc:
-        global SHEETS_LAST_ERROR
-        SHEETS_LAST_ERROR = f"{type(exc).__name__}: {exc}"
-        return
+    write_sheet_deltas(conn, ["users"])
 
 
-def sync_picks_to_sheet(conn: sqlite3.Connection) -> bool:
-    worksheet = get_picks_worksheet()
-    if not worksheet:
-        return False
-    picks = conn.execute(
-        """
-        SELECT users.name as user,
-               tournaments.name as tournament,
-               golfers.name as golfer,
-               picks.created_at as created_at
-        FROM picks
-        JOIN users ON users.id = picks.user_id
-        JOIN tournaments ON tournaments.id = picks.tournament_id
-        JOIN golfers ON golfers.id = picks.golfer_id
-        ORDER BY picks.created_at
-        """
-    ).fetchall()
-    values = [["user", "tournament", "golfer", "created_at"]]
-    for row in picks:
-        values.append([row["user"], row["tournament"], row["golfer"], row["created_at"]])
+def parse_sheet_int(value) -> Optional[int]:
+    return int(value) if str(value).strip().isdigit() else None
+
+
+def parse_sheet_flag(value) -> int:
+    return 1 if str(value).strip().lower() in {"1", "true", "yes"} else 0
+
+
+def apply_result_records(conn: sqlite3.Connection, records: list[dict]) -> set[int]:
+    report = import_results(conn, records)
+    # Rows that didn't resolve (e.g. a tournament not synced yet) are retried
+    # next sync.
+    return {item["line"] - 1 for item in report["unresolved"]}
+
+
+def delete_result_keys(conn: sqlite3.Connection, keys: list[tuple]) -> None:
+    conn.executemany(
+        "DELETE FROM results WHERE tournament_id = (SELECT id FROM tournaments WHERE name = ?) "
+        "AND golfer_id = (SELECT id FROM golfers WHERE name = ?)",
+        keys,
+    )
+
+
+def apply_golfer_records(conn: sqlite3.Connection, records: list[dict]) -> set[int]:
+    conn.executemany(
+        "INSERT INTO golfers (name, fedex_rank, fedex_points, active, bdl_id) VALUES (?, ?, ?, ?, ?) "
+        "ON CONFLICT(name) DO UPDATE SET fedex_rank = excluded.fedex_rank, fedex_points = excluded.fedex_points, "
+        "active = excluded.active, bdl_id = excluded.bdl_id",
+        [
+            (
+                str(row["name"]).strip(),
+                parse_sheet_int(row.get("fedex_rank")),
+                parse_sheet_int(row.get("fedex_points")),
+                parse_sheet_flag(row.get("active")),
+                parse_sheet_int(row.get("bdl_id")),
+            )
+            for row in records
+        ],
+    )
+    return set()
+
+
+def delete_golfer_keys(conn: sqlite3.Connection, keys: list[tuple]) -> None:
+    # Never delete golfers here: picks/results reference golfers with ON DELETE
+    # CASCADE, so a golfer removed from the sheet is only deactivated.
+    conn.executemany("UPDATE golfers SET active = 0 WHERE name = ?", keys)
+
+
+def apply_user_records(conn: sqlite3.Connection, records: list[dict]) -> set[int]:
+    # A blank pin in the sheet never clears one set locally.
+    conn.executemany(
+        "INSERT INTO users (name, pin_hash, is_admin, double_pick_used) VALUES (?, ?, ?, ?) "
+        "ON CONFLICT(name) DO UPDATE SET pin_hash = COALESCE(excluded.pin_hash, users.pin_hash), "
+        "is_admin = excluded.is_admin, double_pick_used = excluded.double_pick_used",
+        [
+            (
+                str(row["name"]).strip(),
+                str(row.get("pin_hash") or "").strip() or None,
+                parse_sheet_flag(row.get("is_admin")),
+                parse_sheet_flag(row.get("double_pick_used")),
+            )
+            for row in records
+        ],
+    )
+    return set()
+
+
+# Tables kept in sync row by row: "apply" upserts records pulled from the sheet
+# and returns the indexes it couldn't resolve; "delete" handles rows removed
+# from the sheet (None keeps the local row and pushes it back). Picks aren't
+# here: they travel through the pick event log.
+ROW_SYNC_TABLES = {
+    "results": {"apply": apply_result_records, "delete": delete_result_keys},
+    "golfers": {"apply": apply_golfer_records, "delete": delete_golfer_keys},
+    "users": {"apply": apply_user_records, "delete": None},
+}
+ROW_KEY_SEPARATOR = "\x1f"
+
+
+def sheet_row_digest(cells: Optional[list[str]]) -> str:
+    if cells is None:
+        return ""
+    return hashlib.sha256(ROW_KEY_SEPARATOR.join(cells).encode("utf-8")).hexdigest()[:16]
+
+
+def load_local_sheet_rows(conn: sqlite3.Connection, spec: dict) -> dict[str, list[str]]:
+    rows = {}
+    for row in conn.execute(spec["sql"]).fetchall():
+        cells = [sheet_cell_text(value) for value in spec["row"](row)]
+        rows.setdefault(ROW_KEY_SEPARATOR.join(cells[: spec["key_width"]]), cells)
+    return rows
+
+
+def load_remote_sheet_rows(values: list[list[str]], spec: dict) -> dict[str, list[str]]:
+    # Columns are matched by header name, so a tab written with an older
+    # header still lines up.
+    header = values[0] if values else []
+    columns = [header.index(name) if name in header else None for name in spec["header"]]
+    rows = {}
+    for row in values[1:]:
+        cells = [sheet_cell_text(row[i]) if i is not None and i < len(row) else "" for i in columns]
+        key = ROW_KEY_SEPARATOR.join(cells[: spec["key_width"]])
+        if key.strip(ROW_KEY_SEPARATOR):
+            rows.setdefault(key, cells)
+    return rows
+
+
+def merge_sheet_table(conn: sqlite3.Connection, sheet_name: str, now: str) -> Optional[dict]:
+    spec = SHEET_EXPORTS[sheet_name]
+    handlers = ROW_SYNC_TABLES[sheet_name]
+    data_width = len(spec["header"]) - 1
+    if get_cached_sheet_records(sheet_name, conn) is None:
+        return None
+    remote = load_remote_sheet_rows(SHEETS_CACHE["records"][sheet_name]["values"], spec)
+    watermark_key = f"{sheet_name}_sync_watermark"
+    if conn.in_transaction:
+        raise RuntimeError("Row sync needs its own transaction; commit or roll back first.")
+    conn.execute("BEGIN IMMEDIATE")
     try:
-        worksheet.clear()
-        worksheet.update(values=values, range_name="A1")
-        clear_sheet_records_cache("picks")
+        local = load_local_sheet_rows(conn, spec)
+        base = {
+            row["row_key"]: row
+            for row in conn.execute(
+                "SELECT row_key, local_hash, remote_hash, updated_at FROM sync_rows WHERE table_name = ?",
+                (sheet_name,),
+            )
+        }
+        watermark = get_sync_meta(conn, watermark_key)
+        pulls, pushes, agreed, conflicts = [], [], [], []
+        if not remote and not base:
+            # Nothing synced yet, so an empty tab is seeded from local. Once
+            # rows have been synced, an emptied tab means they were deleted.
+            watermark = None
+        if watermark is None:
+            # First sync: local rows predate the change log, so the sheet wins
+            # wherever both have the row (unless an edit is still waiting in
+            # the outbox) and nothing is logged as a conflict.
+            changes = {key: "" for key in local}
+            first_winner = (
+                pushes
+                if conn.execute("SELECT 1 FROM sheets_outbox WHERE sheet_name = ?", (sheet_name,)).fetchone()
+                else pulls
+            )
+        else:
+            changes = {
+                row["row_key"]: row["updated_at"]
+                for row in conn.execute(
+                    "SELECT row_key, updated_at FROM sync_changes WHERE table_name = ? AND seq > ?",
+                    (sheet_name, int(watermark)),
+                )
+            }
+        seq = conn.execute("SELECT COALESCE(MAX(seq), 0) FROM sync_changes").fetchone()[0]
+        for key in set(changes) | set(remote) | set(base):
+            known = base.get(key)
+            local_cells = local.get(key)
+            remote_cells = remote[key][:data_width] if key in remote else None
+            local_changed = key in changes and sheet_row_digest(local_cells) != (known["local_hash"] if known else "")
+            remote_changed = sheet_row_digest(remote_cells) != (known["remote_hash"] if known else "")
+            if not (local_changed or remote_changed):
+                continue
+            if local_cells == remote_cells:
+                agreed.append(key)
+            elif local_changed and remote_changed and watermark is None:
+                first_winner.append(key)
+            elif local_changed and remote_changed:
+                # Last writer wins. A sheet edit that left updated_at alone (or
+                # deleted the row) counts as made now.
+                remote_stamp = remote[key][data_width] if key in remote else ""
+                remote_at = remote_stamp if remote_stamp > (known["updated_at"] if known else "") else now
+                winner = "local" if changes[key] > remote_at else "remote"
+                (pushes if winner == "local" else pulls).append(key)
+                conflicts.append(
+                    (
+                        sheet_name,
+                        key,
+                        json.dumps(local_cells),
+                        changes[key] or None,
+                        json.dumps(remote_cells),
+                        remote_at,
+                        winner,
+                        now,
+                    )
+                )
+            elif local_changed:
+                pushes.append(key)
+            else:
+                pulls.append(key)
+
+        failed: set[str] = set()
+        updated = [key for key in pulls if key in remote]
+        if updated:
+            records = parse_sheet_records([spec["header"]] + [remote[key] for key in updated])
+            failed = {updated[index] for index in handlers["apply"](conn, records)}
+        removed = [key for key in pulls if key not in remote]
+        if removed and handlers["delete"]:
+            handlers["delete"](conn, [tuple(key.split(ROW_KEY_SEPARATOR)) for key in removed])
+        elif removed:
+            pushes.extend(removed)
+        if pulls:
+            local = load_local_sheet_rows(conn, spec)
+        settled = [key for key in pulls + agreed if key not in failed and key not in pushes]
+        conn.executemany(
+            "INSERT INTO sync_rows (table_name, row_key, local_hash, remote_hash, updated_at) VALUES (?, ?, ?, ?, ?) "
+            "ON CONFLICT(table_name, row_key) DO UPDATE SET local_hash = excluded.local_hash, "
+            "remote_hash = excluded.remote_hash, updated_at = excluded.updated_at",
+            [
+                (
+                    sheet_name,
+                    key,
+                    sheet_row_digest(local.get(key)),
+                    sheet_row_digest(remote[key][:data_width] if key in remote else None),
+                    (remote[key][data_width] if key in remote else "") or now,
+                )
+                for key in settled
+            ],
+        )
+        conn.executemany(
+            "INSERT INTO sync_conflicts (table_name, row_key, local_value, local_updated_at, remote_value, "
+            "remote_updated_at, winner, resolved_at) VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+            conflicts,
+        )
+        stamps = [cells[data_width] for cells in remote.values() if cells[data_width]]
+        if stamps:
+            set_sync_meta(conn, f"{sheet_name}_sheet_updated_at", max(stamps))
+        if not pushes:
+            set_sync_meta(conn, watermark_key, str(seq))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    if pulls:
+        mark_sheet_records_current(conn, sheet_name)
+    # Pushed rows carry the time of the local edit, so the next writer
+    # compares against when the change was made rather than when it landed.
+    stamps = {key: changes.get(key) or now for key in pushes}
+    rows = dict(remote)
+    for key in pushes:
+        if key in local:
+            rows[key] = local[key] + [stamps[key]]
+        else:
+            rows.pop(key, None)
+    return {
+        "pulled": len(settled) - len(agreed),
+        "pushed": stamps,
+        "conflicts": len(conflicts),
+        "unresolved": len(failed),
+        "seq": seq,
+        "rows": list(rows.values()),
+        "local": local,
+    }
+
+
+@holds_sheets_lock
+def sync_sheet_tables(conn: sqlite3.Connection, sheet_names: list[str]) -> Optional[dict[str, dict]]:
+    # Two-way sync of row-keyed tables: local edits since the watermark (from
+    # sync_changes) go up, sheet rows whose content moved away from the last
+    # synced copy come down, and rows changed on both sides go to the newer
+    # write. Unchanged rows cost nothing beyond the hash comparison.
+    if get_storage_backend() is None:
+        return None
+    now = datetime.utcnow().isoformat()
+    merged = {}
+    for sheet_name in sheet_names:
+        if not storage_tab_ready(sheet_name):
+            return None
+        merged[sheet_name] = merge_sheet_table(conn, sheet_name, now)
+        if merged[sheet_name] is None:
+            return None
+    pushing = [name for name, result in merged.items() if result["pushed"]]
+    if pushing:
+        if not write_sheet_deltas(conn, pushing, {name: merged[name]["rows"] for name in pushing}):
+            return None
+        for name in pushing:
+            result = merged[name]
+            conn.executemany(
+                "INSERT INTO sync_rows (table_name, row_key, local_hash, remote_hash, updated_at) "
+                "VALUES (?, ?, ?, ?, ?) ON CONFLICT(table_name, row_key) DO UPDATE SET "
+                "local_hash = excluded.local_hash, remote_hash = excluded.remote_hash, updated_at = excluded.updated_at",
+                [
+                    (name, key, sheet_row_digest(result["local"].get(key)), sheet_row_digest(result["local"].get(key)), stamp)
+                    for key, stamp in result["pushed"].items()
+                ],
+            )
+            set_sync_meta(conn, f"{name}_sync_watermark", str(result["seq"]))
+        conn.commit()
+    return {
+        name: {
+            "pulled": result["pulled"],
+            "pushed": len(result["pushed"]),
+            "conflicts": result["conflicts"],
+            "unresolved": result["unresolved"],
+        }
+        for name, result in merged.items()
+    }
+
+
+def get_sync_conflicts(conn: sqlite3.Connection, limit: int = 50) -> list[sqlite3.Row]:
+    return conn.execute(
+        "SELECT table_name, row_key, local_value, local_updated_at, remote_value, remote_updated_at, winner, "
+        "resolved_at FROM sync_conflicts ORDER BY id DESC LIMIT ?",
+        (limit,),
+    ).fetchall()
+
+
+
+def sync_picks_to_sheet(conn: sqlite3.Connection) -> bool:
+    return write_sheet_deltas(conn, ["picks"])
+
+
+# Pick changes are appended to the pick_events tab (filled locally by the
+# trg_pick_events_* triggers) instead of rewriting the picks tab. The picks tab
+# is the snapshot the log is periodically compacted into; the header row's
+# last cell carries the compaction generation ("checkpoint:<id>").
+def pick_event_row(event: dict) -> list:
+    return [event["event_id"], event["kind"], event["user"], event["tournament"] or "", event["golfer"] or "", event["at"]]
+
+
+def parse_pick_events(rows: list[list]) -> list[dict]:
+    events = []
+    for row in rows:
+        row = [sheet_cell_text(value) for value in row] + [""] * len(PICK_EVENT_HEADER)
+        if row[0] and row[1] in ("created", "deleted", "double_pick"):
+            events.append(dict(zip(["event_id", "kind", "user", "tournament", "golfer", "at"], row)))
+    return events
+
+
+def pick_event_generation(header: list) -> str:
+    cell = sheet_cell_text(header[len(PICK_EVENT_HEADER) - 1]) if len(header) >= len(PICK_EVENT_HEADER) else ""
+    return cell.split(":", 1)[1] if cell.startswith("checkpoint:") else ""
+
+
+def load_local_pick_events(conn: sqlite3.Connection, where: str, params: tuple = ()) -> list[dict]:
+    return [
+        {
+            "id": row["id"],
+            "event_id": row["event_id"],
+            "kind": row["kind"],
+            "user": row["user_name"],
+            "tournament": row["tournament_name"],
+            "golfer": row["golfer_name"],
+            "at": row["at"],
+        }
+        for row in conn.execute(f"SELECT * FROM pick_events WHERE {where} ORDER BY id", params)
+    ]
+
+
+def replay_pick_events(conn: sqlite3.Connection, events: list[dict]) -> int:
+    # Events are idempotent per (user, golfer), so replaying a prefix that is
+    # already folded into the current state is harmless.
+    pick_events = [event for event in events if event["kind"] != "double_pick"]
+    resolved, _ = resolve_import_rows(conn, pick_events, PICK_IMPORT_FIELDS)
+    ids_by_event = {row["event_id"]: ids for _, row, ids in resolved}
+    users = load_name_index(conn, "users")
+    applied = 0
+    for event in events:
+        if event["kind"] == "double_pick":
+            user_id = lookup_name_id(users, event["user"])
+            if user_id is not None:
+                conn.execute("UPDATE users SET double_pick_used = 1 WHERE id = ?", (user_id,))
+                applied += 1
+            continue
+        ids = ids_by_event.get(event["event_id"])
+        if ids is None:
+            continue
+        if event["kind"] == "created":
+            conn.execute(
+                "INSERT INTO picks (user_id, tournament_id, golfer_id, created_at) VALUES (?, ?, ?, ?) "
+                "ON CONFLICT(user_id, golfer_id) DO UPDATE SET "
+                "tournament_id = excluded.tournament_id, created_at = excluded.created_at",
+                (ids["user"], ids["tournament"], ids["golfer"], event["at"]),
+            )
+        else:
+            conn.execute(
+                "DELETE FROM picks WHERE user_id = ? AND tournament_id = ? AND golfer_id = ?",
+                (ids["user"], ids["tournament"], ids["golfer"]),
+            )
+        applied += 1
+    return applied
+
+
+def apply_pick_events(
+    conn: sqlite3.Connection,
+    events: list[dict],
+    checkpoint: dict,
+    snapshot: Optional[list[dict]] = None,
+) -> int:
+    # Own write transaction, so the events the triggers echo while replaying
+    # can be told apart from local edits and dropped.
+    if conn.in_transaction:
+        raise RuntimeError("Pick event replay needs its own transaction; commit or roll back first.")
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        before = conn.execute("SELECT COALESCE(MAX(id), 0) FROM pick_events").fetchone()[0]
+        if snapshot is not None:
+            conn.execute("DELETE FROM picks")
+            import_picks(conn, snapshot)
+            replay = list(events)
+        else:
+            # Only the incoming ids are looked up, through the UNIQUE index.
+            ids = [event["event_id"] for event in events]
+            known = set()
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                known.update(
+                    row[0]
+                    for row in conn.execute(f"SELECT event_id FROM pick_events WHERE event_id IN ({placeholders})", chunk)
+                )
+            replay = [event for event in events if event["event_id"] not in known]
+        # Local edits not yet pushed land after everything in the log.
+        replay += load_local_pick_events(conn, "pushed = 0 AND id <= ?", (before,))
+        applied = replay_pick_events(conn, replay)
+        conn.execute("DELETE FROM pick_events WHERE id > ?", (before,))
+        conn.executemany(
+            "INSERT OR IGNORE INTO pick_events (event_id, kind, user_name, tournament_name, golfer_name, at, pushed) "
+            "VALUES (?, ?, ?, ?, ?, ?, 1)",
+            [pick_event_row(event) for event in events],
+        )
+        if snapshot is not None:
+            # Pushed events that were compacted away are only needed for dedup
+            # against the log, which no longer holds them.
+            remote = {event["event_id"] for event in events}
+            stale = [
+                (row[0],)
+                for row in conn.execute("SELECT event_id FROM pick_events WHERE pushed = 1")
+                if row[0] not in remote
+            ]
+            conn.executemany("DELETE FROM pick_events WHERE event_id = ?", stale)
+        set_sync_meta(conn, "pick_events_checkpoint", json.dumps(checkpoint))
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    return applied
+
+
+@holds_sheets_lock
+def sync_pick_events(conn: sqlite3.Connection) -> bool:
+    global SHEETS_LAST_ERROR
+    backend = get_storage_backend()
+    if backend is None:
+        return False
+    raw_checkpoint = get_sync_meta(conn, "pick_events_checkpoint")
+    checkpoint = json.loads(raw_checkpoint) if raw_checkpoint else None
+    try:
+        backend.ensure_tabs([PICK_EVENTS_SHEET])
+        if checkpoint:
+            # Header (for the generation) plus only the rows after the last
+            # one we applied, in one request.
+            header, tail = backend.read_row_spans(PICK_EVENTS_SHEET, [(1, 1), (checkpoint["rows"] + 2, None)])
+            if header and pick_event_generation(header[0]) == checkpoint["generation"]:
+                checkpoint = {**checkpoint, "rows": checkpoint["rows"] + len(tail)}
+                apply_pick_events(conn, parse_pick_events(tail), checkpoint)
+                return True
+        # First sync, or the log was compacted since: rebuild from the
+        # snapshot tab plus the whole log.
+        tabs = backend.read_tabs(["picks", PICK_EVENTS_SHEET])
+    except (APIError, SheetsUnavailableError) as exc:
+        SHEETS_LAST_ERROR = f"{type(exc).__name__}: {exc}"
+        return False
+    log = tabs[PICK_EVENTS_SHEET]
+    events = parse_pick_events(log[1:])
+    snapshot = parse_sheet_records(pad_sheet_values(tabs["picks"]))
+    if not snapshot and not events:
+        # Nothing in Sheets yet; seed the snapshot from local picks.
+        if conn.execute("SELECT COUNT(*) FROM picks").fetchone()[0] == 0:
+            return False
+        set_sync_meta(conn, "pick_events_checkpoint", json.dumps({"generation": pick_event_generation(log[0] if log else []), "rows": 0}))
+        conn.execute("UPDATE pick_events SET pushed = 1 WHERE pushed = 0")
+        persist_tables(conn, ["picks"])
+        return True
+    apply_pick_events(
+        conn,
+        events,
+        {"generation": pick_event_generation(log[0]) if log else "", "rows": max(len(log) - 1, 0)},
+        snapshot=snapshot,
+    )
+    return True
+
+
+@holds_sheets_lock
+def push_pick_events(conn: sqlite3.Connection) -> bool:
+    global SHEETS_LAST_ERROR
+    backend = get_storage_backend()
+    if backend is None:
+        return False
+    # Read once: only the events actually appended are marked pushed, even if
+    # another connection logs a pick meanwhile.
+    events = load_local_pick_events(conn, "pushed = 0")
+    if not events:
         return True
-    except APIError as exc:
-        global SHEETS_LAST_ERROR
+    try:
+        # One append request however long the season's log already is.
+        last_row = backend.append_rows(PICK_EVENTS_SHEET, [pick_event_row(event) for event in events])
+    except (APIError, SheetsUnavailableError) as exc:
         SHEETS_LAST_ERROR = f"{type(exc).__name__}: {exc}"
         return False
+    conn.executemany("UPDATE pick_events SET pushed = 1 WHERE id = ?", [(event["id"],) for event in events])
+    conn.commit()
+    if last_row - 1 > PICK_EVENTS_COMPACT_AFTER:
+        compact_pick_events(conn)
+    return True
 
 
-def should_bootstrap_from_sheets(conn: sqlite3.Connection, table_name: str) -> bool:
+@holds_sheets_lock
+def compact_pick_events(conn: sqlite3.Connection) -> bool:
+    global SHEETS_LAST_ERROR
+    backend = get_storage_backend()
+    if backend is None:
+        return False
     try:
-        return conn.execute(f"SELECT COUNT(*) FROM {table_name}").fetchone()[0] == 0
-    except sqlite3.Error:
+        tabs = backend.read_tabs(["picks", PICK_EVENTS_SHEET])
+        log = tabs[PICK_EVENTS_SHEET]
+        events = parse_pick_events(log[1:])
+        if not events:
+            return True
+        # Fold the log into the snapshot as it stands in Sheets (not local
+        # state), keyed like picks' UNIQUE(user_id, golfer_id).
+        header = SHEET_EXPORTS["picks"]["header"]
+        state = {}
+        for row in pad_sheet_values(tabs["picks"])[1:]:
+            record = dict(zip(header, row))
+            if record["user"] and record["golfer"]:
+                state[(record["user"], record["golfer"])] = [record[name] for name in header]
+        for event in events:
+            key = (event["user"], event["golfer"])
+            if event["kind"] == "created":
+                state[key] = [event["user"], event["tournament"], event["golfer"], event["at"]]
+            elif event["kind"] == "deleted" and state.get(key, [None, None])[1] == event["tournament"]:
+                del state[key]
+        snapshot = sorted(state.values(), key=lambda row: row[3])
+        if not write_sheet_deltas(conn, ["picks"], {"picks": snapshot}):
+            return False
+        # New generation first, then drop the folded rows: a reader that sees
+        # either step rebuilds from the snapshot, and replaying folded events
+        # onto it is idempotent. Rows appended meanwhile sit below len(log).
+        generation = os.urandom(4).hex()
+        backend.write_rows({PICK_EVENTS_SHEET: {1: PICK_EVENT_HEADER[:-1] + [f"checkpoint:{generation}"]}})
+        backend.delete_rows(PICK_EVENTS_SHEET, 2, len(log))
+    except (APIError, SheetsUnavailableError) as exc:
+        SHEETS_LAST_ERROR = f"{type(exc).__name__}: {exc}"
         return False
+    set_sync_meta(conn, "pick_events_compacted_at", datetime.utcnow().isoformat())
+    conn.commit()
+    return True
+
+
+
+
+OUTBOX_POLL_SECONDS = 30
+OUTBOX_COALESCE_SECONDS = 2.0
+OUTBOX_BACKOFF_BASE_SECONDS = 5
+OUTBOX_BACKOFF_MAX_SECONDS = 600
+
+
+def enqueue_sheet_sync(conn: sqlite3.Connection, sheet_names: list[str]) -> None:
+    # Runs inside the caller's transaction so the local write and the pending
+    # Sheets push commit (or roll back) together.
+    if get_storage_backend() is None:
+        return
+    now = datetime.utcnow().isoformat()
+    conn.executemany(
+        "INSERT INTO sheets_outbox (sheet_name, enqueued_at) VALUES (?, ?) "
+        "ON CONFLICT(sheet_name) DO UPDATE SET seq = seq + 1",
+        [(sheet_name, now) for sheet_name in sheet_names],
+    )
+
+
+@st.cache_resource(show_spinner=False)
+def get_outbox_worker() -> dict:
+    return {
+        "lock": threading.Lock(),
+        "flush_lock": threading.RLock(),
+        "wake": threading.Event(),
+        "thread": None,
+        "flushes": 0,
+        "last_flush_at": None,
+        "last_flush_ok": None,
+        "last_error": None,
+    }
+
+
+def flush_outbox(conn: sqlite3.Connection) -> int:
+    worker = get_outbox_worker()
+    with worker["flush_lock"]:
+        now = datetime.utcnow()
+        due = conn.execute(
+            "SELECT sheet_name, seq, attempts FROM sheets_outbox "
+            "WHERE next_attempt_at IS NULL OR next_attempt_at <= ? ORDER BY sheet_name",
+            (now.isoformat(),),
+        ).fetchall()
+        if not due:
+            return 0
+        # Every pending edit to a sheet collapses into one sync of its changed
+        # rows, and all due sheets share one batch update.
+        names = [row["sheet_name"] for row in due]
+        error = None
+        try:
+            ok = push_pick_events(conn) if PICK_EVENTS_SHEET in names else True
+            row_tables = [name for name in names if name in ROW_SYNC_TABLES]
+            if row_tables:
+                ok = sync_sheet_tables(conn, row_tables) is not None and ok
+            tab_names = [name for name in names if name != PICK_EVENTS_SHEET and name not in ROW_SYNC_TABLES]
+            if tab_names:
+                ok = write_sheet_deltas(conn, tab_names) and ok
+        except Exception as exc:
+            # Any failure backs off like a Sheets error instead of being
+            # retried on every poll.
+            if conn.in_transaction:
+                conn.rollback()
+            ok = False
+            error = f"{type(exc).__name__}: {exc}"
+        if ok:
+            # Rows re-enqueued while we were writing keep their (newer) seq.
+            conn.executemany(
+                "DELETE FROM sheets_outbox WHERE sheet_name = ? AND seq = ?",
+                [(row["sheet_name"], row["seq"]) for row in due],
+            )
+        else:
+            error = error or SHEETS_LAST_ERROR or "Sheets unavailable"
+            conn.executemany(
+                "UPDATE sheets_outbox SET attempts = ?, next_attempt_at = ?, last_error = ? WHERE sheet_name = ?",
+                [
+                    (
+                        row["attempts"] + 1,
+                        (
+                            now
+                            + timedelta(
+                                seconds=min(
+                                    OUTBOX_BACKOFF_MAX_SECONDS,
+                                    OUTBOX_BACKOFF_BASE_SECONDS * 2 ** row["attempts"],
+                                )
+                            )
+                        ).isoformat(),
+                        error,
+                        row["sheet_name"],
+                    )
+                    for row in due
+                ],
+            )
+        conn.commit()
+        worker["flushes"] += 1
+        worker["last_flush_at"] = now.isoformat()
+        worker["last_flush_ok"] = ok
+        worker["last_error"] = None if ok else error
+        return len(due)
+
+
+def run_outbox_worker(db_path: str) -> None:
+    worker = get_outbox_worker()
+    conn = open_connection(db_path)
+    while True:
+        if worker["wake"].wait(OUTBOX_POLL_SECONDS):
+            # Let a burst of edits land before pushing.
+            time_mod.sleep(OUTBOX_COALESCE_SECONDS)
+            worker["wake"].clear()
+        try:
+            flush_outbox(conn)
+        except Exception as exc:
+            if conn.in_transaction:
+                conn.rollback()
+            worker["last_flush_ok"] = False
+            worker["last_error"] = f"{type(exc).__name__}: {exc}"
+
+
+def ensure_outbox_worker() -> None:
+    if get_storage_backend() is None:
+        return
+    worker = get_outbox_worker()
+    with worker["lock"]:
+        if worker["thread"] and worker["thread"].is_alive():
+            return
+        thread = threading.Thread(
+            target=run_outbox_worker,
+            args=(os.path.abspath(get_db_path()),),
+            name="sheets-outbox",
+            daemon=True,
+        )
+        worker["thread"] = thread
+        thread.start()
+
+
+def wake_outbox_worker() -> None:
+    if get_storage_backend() is None:
+        return
+    ensure_outbox_worker()
+    get_outbox_worker()["wake"].set()
+
+
+def get_outbox_status(conn: sqlite3.Connection) -> dict:
+    row = conn.execute(
+        "SELECT COUNT(*) AS pending, MIN(enqueued_at) AS oldest, MAX(attempts) AS attempts, "
+        "MIN(next_attempt_at) AS next_attempt_at FROM sheets_outbox"
+    ).fetchone()
+    worker = get_outbox_worker()
+    return {
+        "pending": row["pending"],
+        "oldest": row["oldest"],
+        "attempts": row["attempts"] or 0,
+        "next_attempt_at": row["next_attempt_at"],
+        "running": bool(worker["thread"] and worker["thread"].is_alive()),
+        "flushes": worker["flushes"],
+        "last_flush_at": worker["last_flush_at"],
+        "last_flush_ok": worker["last_flush_ok"],
+        "last_error": worker["last_error"],
+    }
 
-def persist_picks(conn: sqlite3.Connection) -> bool:
+
+def persist_tables(conn: sqlite3.Connection, sheet_names: list[str]) -> None:
+    # Durable once committed: the outbox retries until Sheets takes it.
+    enqueue_sheet_sync(conn, sheet_names)
+    conn.commit()
+    wake_outbox_worker()
+
+
+def persist_picks(conn: sqlite3.Connection, include_users: bool = False) -> None:
+    persist_tables(conn, [PICK_EVENTS_SHEET, "users"] if include_users else [PICK_EVENTS_SHEET])
     # Always keep a local snapshot even when Sheets is configured.
     save_picks_snapshot(conn)
-    worksheet = get_picks_worksheet()
-    if worksheet:
-        return sync_picks_to_sheet(conn)
-    return True
 
 def persist_users(conn: sqlite3.Connection) -> None:
-    if get_users_worksheet():
-        sync_users_to_sheet(conn)
+    persist_tables(conn, ["users"])
 
 
-def persist_golfers(conn: sqlite3.Connection) -> bool:
-    if get_golfers_worksheet():
-        return sync_golfers_to_sheet(conn)
-    return True
+def persist_golfers(conn: sqlite3.Connection) -> None:
+    persist_tables(conn, ["golfers"])
 
 
-def persist_results(conn: sqlite3.Connection) -> bool:
-    if get_results_worksheet():
-        return sync_results_to_sheet(conn)
-    return True
+def persist_results(conn: sqlite3.Connection) -> None:
+    persist_tables(conn, ["results"])
 
 def hydrate_picks(conn: sqlite3.Connection) -> None:
-    if not should_bootstrap_from_sheets(conn, "picks"):
-        return
-    worksheet = get_picks_worksheet()
-    if worksheet and sync_picks_from_sheet(conn):
+    # Cheap even when local picks exist: only the log's tail is read.
+    if sync_pick_events(conn):
         return
     if conn.execute("SELECT COUNT(*) FROM picks").fetchone()[0] == 0:
         restore_picks_snapshot(conn)
 
 def hydrate_users(conn: sqlite3.Connection) -> None:
-    if not should_bootstrap_from_sheets(conn, "users"):
-        return
-    if get_users_worksheet():
-        if sync_users_from_sheet(conn):
-            return
-        sync_users_to_sheet(conn)
+    sync_sheet_tables(conn, ["users"])
 
 
 def hydrate_golfers(conn: sqlite3.Connection) -> None:
-    worksheet = get_golfers_worksheet()
-    if not worksheet:
-        return
-    rows = get_cached_sheet_records("golfers")
-    if rows:
-        sync_golfers_from_sheet(conn)
-        return
-    if conn.execute("SELECT COUNT(*) FROM golfers").fetchone()[0] > 0:
-        persist_golfers(conn)
+    sync_sheet_tables(conn, ["golfers"])
 
 
 def hydrate_results(conn: sqlite3.Connection) -> None:
-    worksheet = get_results_worksheet()
-    if not worksheet:
-        return
-    rows = get_cached_sheet_records("results")
-    if rows is None or not rows:
-        return
-    # Results are authoritative in Google Sheets for this app.
-    # Keep local SQLite aligned on every app run, while still benefiting
-    # from the in-process sheet record cache to avoid quota spam.
-    sync_results_from_sheet(conn)
+    # Only rows changed on either side since the last sync are exchanged.
+    sync_sheet_tables(conn, ["results"])
 
 
 def restore_picks_snapshot(conn: sqlite3.Connection) -> bool:
@@ -1050,20 +3165,377 @@ def restore_picks_snapshot(conn: sqlite3.Connection) -> bool:
             return False
     if not payload:
         return False
-    restored = 0
-    for row in payload:
-        user = conn.execute("SELECT id FROM users WHERE name = ?", (row["user"],)).fetchone()
-        tournament = conn.execute("SELECT id FROM tournaments WHERE name = ?", (row["tournament"],)).fetchone()
-        golfer_id = ensure_golfer_id(conn, row["golfer"])
-        if not user or not tournament or not golfer:
-            continue
-        conn.execute(
-            "INSERT OR IGNORE INTO picks (user_id, tournament_id, golfer_id, created_at) VALUES (?, ?, ?, ?)",
-            (user["id"], tournament["id"], golfer_id, row.get("created_at") or datetime.utcnow().isoformat()),
-        )
-        restored += 1
+    report = import_picks(conn, payload)
     conn.commit()
-    return restored > 0
+    return report["imported"] > 0
+
+
+HTTP_CONNECT_TIMEOUT_SECONDS = 5
+HTTP_READ_TIMEOUT_SECONDS = 30
+HTTP_POOL_SIZE = 8
+HTTP_MAX_RETRIES = 3
+HTTP_BACKOFF_BASE_SECONDS = 0.5
+HTTP_BACKOFF_MAX_SECONDS = 30
+HTTP_RETRY_STATUSES = {429, 500, 502, 503, 504}
+HTTP_LOG_SIZE = 200
+# Per API host: requests in flight at once, and a token bucket of requests
+# per second (one second of burst).
+HTTP_HOST_MAX_CONCURRENCY = 4
+HTTP_HOST_RATE_PER_SECOND = 5.0
+# Seconds a cached response is served without asking the provider, by the
+# last path segment. Endpoints not listed here are never cached.
+HTTP_CACHE_TTLS = {
+    "/schedules": 3 * 86400,
+    "/schedule": 3 * 86400,
+    "/tournaments": 86400,
+    "/tournament_results": 600,
+    "/leaderboards": 60,
+    "/leaderboard": 60,
+    "/earnings": 300,
+    "/earning": 300,
+}
+# 400/404 are kept too: the fallback paths that don't exist stay missing.
+HTTP_CACHE_STATUSES = {200, 400, 404}
+HTTP_CACHE_MAX_BYTES = 32 * 1024 * 1024
+
+
+@st.cache_resource(show_spinner=False)
+def get_http_clients() -> dict:
+    # One keep-alive session per API host, shared by every session and worker
+    # thread, so repeated calls reuse the TCP+TLS connection.
+    return {
+        "lock": threading.Lock(),
+        "sessions": {},
+        "log": deque(maxlen=HTTP_LOG_SIZE),
+        "hosts": {},
+        # On-disk response cache: key -> (bytes, last used), built from the
+        # directory on first use.
+        "cache_index": None,
+        "cache_stats": {"hits": 0, "misses": 0, "revalidated": 0, "evicted": 0},
+    }
+
+
+def get_http_session(host: str) -> requests.Session:
+    clients = get_http_clients()
+    with clients["lock"]:
+        session = clients["sessions"].get(host)
+        if session is None:
+            session = requests.Session()
+            # Retries are handled in http_get_json so each attempt is logged
+            # and Retry-After is honoured.
+            adapter = requests.adapters.HTTPAdapter(
+                pool_connections=1, pool_maxsize=HTTP_POOL_SIZE, max_retries=0
+            )
+            session.mount("https://", adapter)
+            session.mount("http://", adapter)
+            clients["sessions"][host] = session
+        return session
+
+
+def get_http_host_limits(host: str) -> dict:
+    clients = get_http_clients()
+    with clients["lock"]:
+        limits = clients["hosts"].get(host)
+        if limits is None:
+            rate = float(os.getenv("GOLF_API_RATE_PER_SECOND", "") or HTTP_HOST_RATE_PER_SECOND)
+            concurrency = int(os.getenv("GOLF_API_MAX_CONCURRENCY", "") or HTTP_HOST_MAX_CONCURRENCY)
+            limits = {
+                "lock": threading.Lock(),
+                "slots": threading.BoundedSemaphore(concurrency),
+                "rate": rate,
+                "tokens": rate,
+                "refilled_at": time_mod.monotonic(),
+            }
+            clients["hosts"][host] = limits
+        return limits
+
+
+@contextmanager
+def http_host_slot(host: str):
+    limits = get_http_host_limits(host)
+    while True:
+        with limits["lock"]:
+            now = time_mod.monotonic()
+            limits["tokens"] = min(limits["rate"], limits["tokens"] + (now - limits["refilled_at"]) * limits["rate"])
+            limits["refilled_at"] = now
+            if limits["tokens"] >= 1:
+                limits["tokens"] -= 1
+                break
+            wait = (1 - limits["tokens"]) / limits["rate"]
+        time_mod.sleep(wait)
+    with limits["slots"]:
+        yield
+
+
+def http_retry_delay(resp: Optional[requests.Response], attempt: int) -> float:
+    # Retry-After is honoured as sent; the caller decides whether to wait.
+    retry_after = resp.headers.get("Retry-After") if resp is not None else None
+    if retry_after:
+        try:
+            return max(0.0, float(retry_after))
+        except ValueError:
+            try:
+                when = email.utils.parsedate_to_datetime(retry_after)
+            except (TypeError, ValueError):
+                when = None
+            if when is not None:
+                wait = (when - datetime.now(when.tzinfo)).total_seconds()
+                return max(0.0, wait)
+    # Full jitter keeps parallel callers from retrying in lockstep.
+    return random.uniform(0, min(HTTP_BACKOFF_MAX_SECONDS, HTTP_BACKOFF_BASE_SECONDS * 2**attempt))
+
+
+def record_http_call(host: str, path: str, status: Optional[int], ms: float, attempt: int, error: Optional[str]) -> None:
+    get_http_clients()["log"].append(
+        {
+            "at": datetime.utcnow().isoformat(),
+            "host": host,
+            "path": path,
+            "status": status,
+            "ms": ms,
+            "attempt": attempt,
+            "error": error,
+        }
+    )
+
+
+def load_http_cache_index() -> dict:
+    clients = get_http_clients()
+    if clients["cache_index"] is None:
+        index = {}
+        directory = get_http_cache_dir()
+        if os.path.isdir(directory):
+            for name in os.listdir(directory):
+                if name.endswith(".json"):
+                    stat = os.stat(os.path.join(directory, name))
+                    index[name[:-5]] = (stat.st_size, stat.st_mtime)
+        clients["cache_index"] = index
+    return clients["cache_index"]
+
+
+def http_cache_key(url: str, params: Optional[dict]) -> str:
+    payload = json.dumps([url, sorted((params or {}).items())], default=str)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()[:32]
+
+
+def read_http_cache(key: str) -> Optional[dict]:
+    path = os.path.join(get_http_cache_dir(), f"{key}.json")
+    try:
+        with open(path, "r", encoding="utf-8") as handle:
+            return json.load(handle)
+    except (OSError, ValueError):
+        return None
+
+
+def touch_http_cache(key: str) -> None:
+    # File mtime is the LRU clock, so it survives restarts.
+    clients = get_http_clients()
+    now = time_mod.time()
+    try:
+        os.utime(os.path.join(get_http_cache_dir(), f"{key}.json"), (now, now))
+    except OSError:
+        return
+    with clients["lock"]:
+        index = load_http_cache_index()
+        if key in index:
+            index[key] = (index[key][0], now)
+
+
+def write_http_cache(key: str, entry: dict) -> None:
+    clients = get_http_clients()
+    directory = get_http_cache_dir()
+    path = os.path.join(directory, f"{key}.json")
+    encoded = json.dumps(entry)
+    try:
+        os.makedirs(directory, exist_ok=True)
+        tmp_path = f"{path}.{threading.get_ident()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as handle:
+            handle.write(encoded)
+        os.replace(tmp_path, path)
+    except OSError:
+        return
+    budget = int(os.getenv("GOLF_HTTP_CACHE_MAX_BYTES", "") or HTTP_CACHE_MAX_BYTES)
+    with clients["lock"]:
+        index = load_http_cache_index()
+        index[key] = (len(encoded), time_mod.time())
+        total = sum(size for size, _ in index.values())
+        # Least recently used responses go first when over budget.
+        for stale_key in sorted(index, key=lambda k: index[k][1]):
+            if total <= budget:
+                break
+            if stale_key == key:
+                continue
+            try:
+                os.remove(os.path.join(directory, f"{stale_key}.json"))
+            except OSError:
+                pass
+            total -= index.pop(stale_key)[0]
+            clients["cache_stats"]["evicted"] += 1
+
+
+def cached_http_payload(entry: dict) -> dict:
+    if entry["status"] >= 400:
+        resp = requests.Response()
+        resp.status_code = entry["status"]
+        resp.url = entry["url"]
+        resp._content = entry["body"].encode("utf-8")
+        resp.raise_for_status()
+    return json.loads(entry["body"])
+
+
+def count_http_cache(outcome: str) -> None:
+    clients = get_http_clients()
+    with clients["lock"]:
+        clients["cache_stats"][outcome] += 1
+
+
+def get_http_cache_status() -> dict:
+    clients = get_http_clients()
+    with clients["lock"]:
+        index = load_http_cache_index()
+        return {
+            **clients["cache_stats"],
+            "entries": len(index),
+            "bytes": sum(size for size, _ in index.values()),
+        }
+
+
+def http_get_json(url: str, headers: Optional[dict] = None, params: Optional[dict] = None) -> dict:
+    parts = urllib.parse.urlsplit(url)
+    ttl = HTTP_CACHE_TTLS.get("/" + parts.path.rstrip("/").rsplit("/", 1)[-1], 0)
+    key = http_cache_key(url, params) if ttl else None
+    cached = read_http_cache(key) if key else None
+    if cached and time_mod.time() - cached["stored_at"] < ttl:
+        count_http_cache("hits")
+        touch_http_cache(key)
+        return cached_http_payload(cached)
+    request_headers = dict(headers or {})
+    # Past its TTL, a cached 200 is revalidated instead of re-downloaded where
+    # the provider sends validators.
+    if cached and cached["status"] == 200:
+        if cached.get("etag"):
+            request_headers["If-None-Match"] = cached["etag"]
+        if cached.get("last_modified"):
+            request_headers["If-Modified-Since"] = cached["last_modified"]
+    session = get_http_session(parts.netloc)
+    attempt = 0
+    while True:
+        record_network_call()
+        resp = None
+        try:
+            with http_host_slot(parts.netloc):
+                started = time_mod.perf_counter()
+                resp = session.get(
+                    url,
+                    headers=request_headers,
+                    params=params,
+                    timeout=(HTTP_CONNECT_TIMEOUT_SECONDS, HTTP_READ_TIMEOUT_SECONDS),
+                )
+        except (requests.ConnectionError, requests.Timeout) as exc:
+            record_http_call(
+                parts.netloc, parts.path, None, (time_mod.perf_counter() - started) * 1000, attempt, type(exc).__name__
+            )
+            if attempt >= HTTP_MAX_RETRIES:
+                raise
+        else:
+            record_http_call(
+                parts.netloc, parts.path, resp.status_code, (time_mod.perf_counter() - started) * 1000, attempt, None
+            )
+            if resp.status_code == 304 and cached:
+                count_http_cache("revalidated")
+                write_http_cache(key, {**cached, "stored_at": time_mod.time()})
+                return cached_http_payload(cached)
+            if resp.status_code not in HTTP_RETRY_STATUSES or attempt >= HTTP_MAX_RETRIES:
+                if key:
+                    count_http_cache("misses")
+                    if resp.status_code in HTTP_CACHE_STATUSES:
+                        write_http_cache(
+                            key,
+                            {
+                                "url": url,
+                                "status": resp.status_code,
+                                "body": resp.text,
+                                "etag": resp.headers.get("ETag"),
+                                "last_modified": resp.headers.get("Last-Modified"),
+                                "stored_at": time_mod.time(),
+                            },
+                        )
+                resp.raise_for_status()
+                return resp.json()
+        delay = http_retry_delay(resp, attempt)
+        if delay > HTTP_BACKOFF_MAX_SECONDS:
+            # The server asked for a longer pause than we block for; retrying
+            # sooner would only be refused again.
+            resp.raise_for_status()
+        time_mod.sleep(delay)
+        attempt += 1
+
+
+def summarize_http_calls() -> list[dict]:
+    calls = list(get_http_clients()["log"])
+    by_host: dict[str, list[dict]] = {}
+    for call in calls:
+        by_host.setdefault(call["host"], []).append(call)
+    summary = []
+    for host, samples in by_host.items():
+        timings = [sample["ms"] for sample in samples]
+        errors = [sample for sample in samples if sample["error"] or (sample["status"] or 0) >= 400]
+        summary.append(
+            {
+                "Host": host,
+                "Requests": len(samples),
+                "Retries": sum(1 for sample in samples if sample["attempt"]),
+                "p50 ms": round(percentile(timings, 50), 1),
+                "p95 ms": round(percentile(timings, 95), 1),
+                "Errors": len(errors),
+                "Last error": (
+                    f"{errors[-1]['error'] or errors[-1]['status']} on {errors[-1]['path']}" if errors else ""
+                ),
+            }
+        )
+    return summary
+
+
+API_MAX_CONCURRENCY = 6
+
+
+@st.cache_resource(show_spinner=False)
+def get_api_executor() -> ThreadPoolExecutor:
+    # Bounded pool for independent API requests. Only leaf requests are
+    # submitted (never from inside a pool task), so it can't deadlock on itself.
+    return ThreadPoolExecutor(max_workers=API_MAX_CONCURRENCY, thread_name_prefix="api")
+
+
+def submit_api_call(func, *args) -> Future:
+    # Pool threads are shared across reruns and only do HTTP, so they never
+    # get a script run context.
+    calls = [0]
+
+    def run():
+        local = get_profile_store()["local"]
+        local.net_count = 0
+        try:
+            return func(*args)
+        finally:
+            calls[0] = local.net_count
+
+    future = get_api_executor().submit(run)
+    future.net_calls = calls
+    return future
+
+
+def api_call_result(future: Future):
+    try:
+        return future.result()
+    finally:
+        # Requests made on the pool count toward the caller's profile.
+        record_network_call(future.net_calls[0])
+
+
+def cancel_api_calls(futures) -> None:
+    # Requests already in flight finish in the background and are ignored.
+    for future in futures:
+        future.cancel()
 
 
 def bdl_get(path: str, params: Optional[dict] = None) -> dict:
@@ -1071,25 +3543,78 @@ def bdl_get(path: str, params: Optional[dict] = None) -> dict:
     if not api_key:
         raise RuntimeError("Missing BDL_API_KEY")
     headers = {"Authorization": api_key}
-    resp = requests.get(f"{BDL_BASE}{path}", headers=headers, params=params, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+    return http_get_json(f"{BDL_BASE}{path}", headers=headers, params=params)
 
 
-def bdl_fetch_all(path: str, params: Optional[dict] = None) -> list:
-    params = params or {}
-    params = {**params, "per_page": 100}
-    results = []
+BDL_PAGE_SIZE = 100
+PREFETCH_DEPTH = 2
+
+
+def bdl_pages(path: str, params: Optional[dict] = None) -> Iterator[list]:
+    params = {**(params or {}), "per_page": BDL_PAGE_SIZE}
     cursor = None
     while True:
         if cursor:
             params["cursor"] = cursor
         data = bdl_get(path, params)
-        results.extend(data.get("data", []))
+        yield data.get("data", [])
         cursor = data.get("meta", {}).get("next_cursor")
         if not cursor:
             break
-    return results
+
+
+def bdl_fetch_all(path: str, params: Optional[dict] = None) -> list:
+    return [row for page in bdl_pages(path, params) for row in page]
+
+
+def prefetch_iter(iterable, depth: int = PREFETCH_DEPTH) -> Iterator:
+    # Runs the iterable on a producer thread, at most `depth` items ahead of
+    # the consumer: the next page is in flight while this one is written, and
+    # memory stays bounded by a few pages.
+    items: queue.Queue = queue.Queue(maxsize=depth)
+    stop = threading.Event()
+    ctx = get_script_run_ctx()
+    done = object()
+
+    def offer(item) -> bool:
+        while not stop.is_set():
+            try:
+                items.put(item, timeout=0.5)
+                return True
+            except queue.Full:
+                continue
+        return False
+
+    def produce() -> None:
+        local = get_profile_store()["local"]
+        local.net_count = 0
+        iterator = iter(iterable)
+        while True:
+            try:
+                item = next(iterator, done)
+            except Exception as exc:
+                offer((done, exc, local.net_count))
+                return
+            calls, local.net_count = local.net_count, 0
+            if not offer((item, None, calls)) or item is done:
+                return
+
+    producer = threading.Thread(target=produce, name="prefetch", daemon=True)
+    if ctx is not None:
+        add_script_run_ctx(producer, ctx)
+    producer.start()
+    try:
+        while True:
+            item, error, calls = items.get()
+            # Requests made by the producer count toward the caller's profile.
+            record_network_call(calls)
+            if error is not None:
+                raise error
+            if item is done:
+                return
+            yield item
+    finally:
+        stop.set()
 
 
 def rapidapi_get(path: str, params: Optional[dict] = None) -> dict:
@@ -1101,9 +3626,7 @@ def rapidapi_get(path: str, params: Optional[dict] = None) -> dict:
         "x-rapidapi-host": host,
         "x-rapidapi-key": api_key,
     }
-    resp = requests.get(f"https://{host}{path}", headers=headers, params=params, timeout=30)
-    resp.raise_for_status()
-    return resp.json()
+    return http_get_json(f"https://{host}{path}", headers=headers, params=params)
 
 
 def rapidapi_get_with_fallback(
@@ -1182,6 +3705,59 @@ def normalize_tournament_name(value: str) -> str:
     return value
 
 
+def match_schedule_tourn_id(schedule: dict, target_name: str, target_start: Optional[str]) -> Optional[str]:
+    items = schedule.get("schedule") or schedule.get("tournaments") or schedule.get("data") or []
+    best = None
+    best_score = 0.0
+    for item in items:
+        name = (
+            item.get("tournament")
+            or item.get("name")
+            or item.get("tournName")
+            or item.get("eventName")
+            or ""
+        )
+        if not name:
+            continue
+        norm = normalize_tournament_name(name)
+        score = SequenceMatcher(None, target_name, norm).ratio()
+        start = extract_date(
+            item.get("startDate")
+            or item.get("start_date")
+            or item.get("start")
+            or item.get("startDateUtc")
+        )
+        if start and target_start and start == target_start:
+            score += 0.25
+        if score > best_score:
+            best_score = score
+            best = item
+    if best and best_score >= 0.6:
+        tourn_id = best.get("tournId") or best.get("tournamentId") or best.get("id")
+        if tourn_id is not None:
+            return str(tourn_id)
+    return None
+
+
+def submit_schedule_lookups(year: int) -> list[tuple[int, Future]]:
+    return [(test_year, submit_api_call(rapidapi_fetch_schedule, test_year)) for test_year in (year, year - 1)]
+
+
+def resolve_tourn_id_from_schedules(
+    name: str, start_date: Optional[str], schedules: list[tuple[int, Future]]
+) -> tuple[Optional[str], Optional[int]]:
+    target_name = normalize_tournament_name(name)
+    for test_year, future in schedules:
+        try:
+            schedule = api_call_result(future)
+        except Exception:
+            continue
+        tourn_id = match_schedule_tourn_id(schedule, target_name, start_date)
+        if tourn_id is not None:
+            return tourn_id, test_year
+    return None, None
+
+
 def resolve_tourn_id_for_event(
     conn: sqlite3.Connection, tournament_id: int, year: int
 ) -> tuple[Optional[str], Optional[int]]:
@@ -1191,57 +3767,47 @@ def resolve_tourn_id_for_event(
     ).fetchone()
     if not row:
         return None, None
-    target_name = normalize_tournament_name(row["name"])
-    target_start = row["start_date"]
-
-    for test_year in (year, year - 1):
-        try:
-            schedule = rapidapi_fetch_schedule(test_year)
-        except Exception:
-            continue
-        items = schedule.get("schedule") or schedule.get("tournaments") or schedule.get("data") or []
-        best = None
-        best_score = 0.0
-        for item in items:
-            name = (
-                item.get("tournament")
-                or item.get("name")
-                or item.get("tournName")
-                or item.get("eventName")
-                or ""
-            )
-            if not name:
-                continue
-            norm = normalize_tournament_name(name)
-            score = SequenceMatcher(None, target_name, norm).ratio()
-            start = extract_date(
-                item.get("startDate")
-                or item.get("start_date")
-                or item.get("start")
-                or item.get("startDateUtc")
-            )
-            if start and target_start and start == target_start:
-                score += 0.25
-            if score > best_score:
-                best_score = score
-                best = item
-        if best and best_score >= 0.6:
-            tourn_id = best.get("tournId") or best.get("tournamentId") or best.get("id")
-            if tourn_id is not None:
-                return str(tourn_id), test_year
-    return None, None
+    # Both seasons' schedules are requested at once.
+    schedules = submit_schedule_lookups(year)
+    try:
+        return resolve_tourn_id_from_schedules(row["name"], row["start_date"], schedules)
+    finally:
+        cancel_api_calls(future for _, future in schedules)
 
 
-def sync_results_from_rapidapi(
-    conn: sqlite3.Connection, tourn_id: str, year: int, tournament_id: int
-) -> tuple[int, int]:
+def submit_rapidapi_results(tourn_id: str, year: int) -> tuple[Future, Future]:
+    # Leaderboard and earnings don't depend on each other, so both go out at once.
     safe_tourn_id = str(tourn_id).strip()
-    leaderboard = rapidapi_fetch_leaderboard(safe_tourn_id, year)
+    return (
+        submit_api_call(rapidapi_fetch_leaderboard, safe_tourn_id, year),
+        submit_api_call(rapidapi_fetch_earnings, safe_tourn_id, year),
+    )
+
+
+def collect_rapidapi_results(futures: tuple[Future, Future]) -> tuple[dict, dict]:
+    leaderboard_future, earnings_future = futures
     try:
-        earnings = rapidapi_fetch_earnings(safe_tourn_id, year)
+        leaderboard = api_call_result(leaderboard_future)
+    except Exception:
+        earnings_future.cancel()
+        raise
+    try:
+        earnings = api_call_result(earnings_future)
     except requests.HTTPError:
         earnings = {"leaderboard": []}
+    return leaderboard, earnings
+
+
+def sync_results_from_rapidapi(
+    conn: sqlite3.Connection, tourn_id: str, year: int, tournament_id: int
+) -> tuple[int, int]:
+    leaderboard, earnings = collect_rapidapi_results(submit_rapidapi_results(tourn_id, year))
+    return store_rapidapi_results(conn, tournament_id, leaderboard, earnings)
 
+
+def store_rapidapi_results(
+    conn: sqlite3.Connection, tournament_id: int, leaderboard: dict, earnings: dict, commit: bool = True
+) -> tuple[int, int]:
     leaderboard_rows = leaderboard.get("leaderboard", [])
     earnings_rows = earnings.get("leaderboard", [])
 
@@ -1303,35 +3869,57 @@ def sync_results_from_rapidapi(
             )
             updated += 1
 
-    conn.commit()
+    if commit:
+        conn.commit()
     return updated, skipped
 
 
 def sync_results_with_autoresolve(
     conn: sqlite3.Connection, tourn_id: str, year: int, tournament_id: int
 ) -> tuple[int, int]:
-    attempts = []
-    if tourn_id:
-        attempts.append((tourn_id, year))
-        attempts.append((tourn_id, year - 1))
-    resolved_id, resolved_year = resolve_tourn_id_for_event(conn, tournament_id, year)
-    if resolved_id:
-        attempts.append((resolved_id, resolved_year or year))
-        attempts.append((resolved_id, (resolved_year or year) - 1))
+    # Every candidate (tournId, year) and the schedule lookup are requested up
+    # front. Candidates are still judged in priority order, so last season's
+    # results never win just by answering first; the first one that stores
+    # rows wins and the rest are cancelled.
+    row = conn.execute(
+        "SELECT name, start_date FROM tournaments WHERE id = ?",
+        (tournament_id,),
+    ).fetchone()
+    schedules = submit_schedule_lookups(year) if row else []
+    attempts: list[tuple[tuple[str, int], tuple[Future, Future]]] = []
 
+    def add_attempt(attempt_id, attempt_year: int) -> None:
+        key = (str(attempt_id).strip(), int(attempt_year))
+        if attempt_id and key not in [known for known, _ in attempts]:
+            attempts.append((key, submit_rapidapi_results(*key)))
+
+    if tourn_id:
+        add_attempt(tourn_id, year)
+        add_attempt(tourn_id, year - 1)
+    resolved = row is None
     last_error = None
-    for attempt_id, attempt_year in attempts:
-        if not attempt_id:
-            continue
-        try:
-            updated, skipped = sync_results_from_rapidapi(
-                conn, str(attempt_id), int(attempt_year), tournament_id
-            )
+    index = 0
+    try:
+        while index < len(attempts) or not resolved:
+            if index == len(attempts):
+                resolved = True
+                resolved_id, resolved_year = resolve_tourn_id_from_schedules(row["name"], row["start_date"], schedules)
+                if resolved_id:
+                    add_attempt(resolved_id, resolved_year or year)
+                    add_attempt(resolved_id, (resolved_year or year) - 1)
+                continue
+            _, futures = attempts[index]
+            index += 1
+            try:
+                leaderboard, earnings = collect_rapidapi_results(futures)
+            except requests.HTTPError as exc:
+                last_error = exc
+                continue
+            updated, skipped = store_rapidapi_results(conn, tournament_id, leaderboard, earnings)
             if updated > 0:
                 return updated, skipped
-        except requests.HTTPError as exc:
-            last_error = exc
-            continue
+    finally:
+        cancel_api_calls([future for _, futures in attempts for future in futures] + [future for _, future in schedules])
     if last_error:
         raise last_error
     return 0, 0
@@ -1419,45 +4007,174 @@ def sync_tournaments(conn: sqlite3.Connection, season: int = 2026) -> int:
     return inserted
 
 
+def load_bdl_golfer_index(conn: sqlite3.Connection) -> dict:
+    golfers = conn.execute("SELECT id, name, bdl_id FROM golfers").fetchall()
+    return {normalize_name(row["name"]): row for row in golfers}
+
+
+def store_bdl_results(conn: sqlite3.Connection, tournament_id: int, results: list, golfer_by_norm: dict) -> int:
+    # Called once per page: new golfers, bdl_id backfills and result upserts
+    # are one executemany each instead of a statement pair per row.
+    players = []
+    for r in results:
+        player = r.get("player") or {}
+        display = player.get("display_name")
+        if display:
+            players.append((normalize_name(display), display, player.get("id"), r))
+    new_golfers = {}
+    for norm, display, bdl_id, _ in players:
+        if norm not in golfer_by_norm:
+            new_golfers.setdefault(norm, (display, bdl_id))
+    if new_golfers:
+        conn.executemany(
+            "INSERT OR IGNORE INTO golfers (name, active, bdl_id) VALUES (?, 1, ?)",
+            list(new_golfers.values()),
+        )
+        names = [display for display, _ in new_golfers.values()]
+        for start in range(0, len(names), 500):
+            chunk = names[start : start + 500]
+            placeholders = ", ".join("?" for _ in chunk)
+            for row in conn.execute(f"SELECT id, name, bdl_id FROM golfers WHERE name IN ({placeholders})", chunk):
+                golfer_by_norm[normalize_name(row["name"])] = row
+    backfill = {}
+    for norm, display, bdl_id, _ in players:
+        golfer = golfer_by_norm.get(norm)
+        if golfer and golfer["bdl_id"] is None and bdl_id is not None:
+            backfill[norm] = {"id": golfer["id"], "name": golfer["name"], "bdl_id": bdl_id}
+    conn.executemany(
+        "UPDATE golfers SET bdl_id = ? WHERE id = ?",
+        [(golfer["bdl_id"], golfer["id"]) for golfer in backfill.values()],
+    )
+    golfer_by_norm.update(backfill)
+    rows = [
+        (tournament_id, golfer_by_norm[norm]["id"], int(round(r.get("earnings") or 0)), r.get("position_numeric"))
+        for norm, _, _, r in players
+        if norm in golfer_by_norm
+    ]
+    conn.executemany(
+        "INSERT INTO results (tournament_id, golfer_id, purse, position) VALUES (?, ?, ?, ?)"
+        " ON CONFLICT(tournament_id, golfer_id) DO UPDATE SET purse = excluded.purse, position = excluded.position",
+        rows,
+    )
+    return len(rows)
+
+
 def sync_results(conn: sqlite3.Connection, season: int = 2026) -> int:
+    report = sync_season_results(conn, season, provider="bdl")
+    return sum(row["updated"] for row in report)
+
+
+def fetch_timed(func, *args):
+    started = time_mod.perf_counter()
+    return func(*args), (time_mod.perf_counter() - started) * 1000
+
+
+def bdl_result_pages(tournaments: list) -> Iterator[tuple]:
+    # Yields (tournament, page, error, fetch ms); a failed tournament is
+    # reported once and the stream moves on to the next one.
+    for t in tournaments:
+        pages = bdl_pages("/tournament_results", {"tournament_ids": t["bdl_id"]})
+        while True:
+            started = time_mod.perf_counter()
+            try:
+                page = next(pages, None)
+            except Exception as exc:
+                yield t, None, exc, 0.0
+                break
+            if page is None:
+                break
+            yield t, page, None, (time_mod.perf_counter() - started) * 1000
+
+
+def sync_season_results(conn: sqlite3.Connection, season: int = 2026, provider: Optional[str] = None) -> list[dict]:
+    # RapidAPI payloads are fetched on the shared API pool (the HTTP layer
+    # enforces per-host limits) and applied in one transaction. BDL pages are
+    # streamed: the producer fetches the next page while this thread upserts
+    # the current one in a short transaction, so a long backfill never holds
+    # more than a few pages or the write lock for long.
+    if conn.in_transaction:
+        raise RuntimeError("Season sync needs its own transaction; commit or roll back first.")
     tournaments = conn.execute(
-        "SELECT id, name, bdl_id FROM tournaments WHERE season = ? AND bdl_id IS NOT NULL",
+        "SELECT id, name, rapid_tourn_id, bdl_id FROM tournaments "
+        "WHERE season = ? AND (rapid_tourn_id IS NOT NULL OR bdl_id IS NOT NULL) ORDER BY start_date",
         (season,),
     ).fetchall()
-
-    golfers = conn.execute("SELECT id, name, bdl_id FROM golfers").fetchall()
-    golfer_by_norm = {normalize_name(row["name"]): row for row in golfers}
-
-    updated = 0
+    report = []
+    rows = {}
+    rapid_jobs = []
+    bdl_jobs = []
     for t in tournaments:
-        results = bdl_fetch_all("/tournament_results", {"tournament_ids": t["bdl_id"]})
-        for r in results:
-            player = r.get("player") or {}
-            display = player.get("display_name")
-            if not display:
+        source = provider or ("rapidapi" if t["rapid_tourn_id"] else "bdl")
+        if source == "rapidapi" and t["rapid_tourn_id"]:
+            tourn_id = str(t["rapid_tourn_id"]).strip()
+            futures = [
+                submit_api_call(fetch_timed, rapidapi_fetch_leaderboard, tourn_id, season),
+                submit_api_call(fetch_timed, rapidapi_fetch_earnings, tourn_id, season),
+            ]
+            rapid_jobs.append((t, futures))
+        elif source == "bdl" and t["bdl_id"]:
+            bdl_jobs.append(t)
+        else:
+            continue
+        rows[t["id"]] = {"tournament": t["name"], "provider": source, "updated": 0, "skipped": 0, "error": None, "ms": 0.0}
+        report.append(rows[t["id"]])
+
+    changed = False
+    if bdl_jobs:
+        golfer_by_norm = load_bdl_golfer_index(conn)
+        for t, page, error, ms in prefetch_iter(bdl_result_pages(bdl_jobs)):
+            row = rows[t["id"]]
+            if error is not None:
+                row["error"] = f"{type(error).__name__}: {error}"
                 continue
-            norm = normalize_name(display)
-            golfer = golfer_by_norm.get(norm)
-            if not golfer:
-                conn.execute(
-                    "INSERT OR IGNORE INTO golfers (name, active, bdl_id) VALUES (?, 1, ?)",
-                    (display, player.get("id")),
-                )
-                golfer = conn.execute("SELECT id, name, bdl_id FROM golfers WHERE name = ?", (display,)).fetchone()
-                golfer_by_norm[norm] = golfer
-            elif golfer["bdl_id"] is None:
-                conn.execute("UPDATE golfers SET bdl_id = ? WHERE id = ?", (player.get("id"), golfer["id"]))
+            row["ms"] = round(row["ms"] + ms, 1)
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                count = store_bdl_results(conn, t["id"], page, golfer_by_norm)
+                if count:
+                    enqueue_sheet_sync(conn, ["results"])
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            row["updated"] += count
+            changed = changed or bool(count)
+
+    fetched = []
+    for t, futures in rapid_jobs:
+        row = rows[t["id"]]
+        payloads = []
+        for position, future in enumerate(futures):
+            try:
+                payload, ms = api_call_result(future)
+            except Exception as exc:
+                if position == 1 and isinstance(exc, requests.HTTPError):
+                    # Same as a single sync: positions are stored without earnings.
+                    payloads.append({"leaderboard": []})
+                    continue
+                row["error"] = f"{type(exc).__name__}: {exc}"
+                cancel_api_calls(futures[position + 1 :])
+                break
+            payloads.append(payload)
+            row["ms"] = max(row["ms"], round(ms, 1))
+        if row["error"] is None:
+            fetched.append((t, payloads, row))
 
-            earnings = r.get("earnings") or 0
-            position = r.get("position_numeric")
-            conn.execute(
-                "INSERT INTO results (tournament_id, golfer_id, purse, position) VALUES (?, ?, ?, ?)"
-                " ON CONFLICT(tournament_id, golfer_id) DO UPDATE SET purse = excluded.purse, position = excluded.position",
-                (t["id"], golfer["id"], int(round(earnings)), position),
-            )
-            updated += 1
-    conn.commit()
-    return updated
+    if fetched:
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for t, payloads, row in fetched:
+                row["updated"], row["skipped"] = store_rapidapi_results(conn, t["id"], *payloads, commit=False)
+            if any(row["updated"] for _, _, row in fetched):
+                enqueue_sheet_sync(conn, ["results"])
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        changed = changed or any(row["updated"] for _, _, row in fetched)
+    if changed:
+        wake_outbox_worker()
+    return report
 
 
 def format_money(value: int) -> str:
@@ -1530,38 +4247,277 @@ def parse_clipboard_results(raw: str):
     return rows, errors
 
 
+# Queries on interactive render paths. They are kept as constants so that
+# QUERY_PLAN_CHECKS can EXPLAIN exactly what the app runs.
+LEADERBOARD_SQL = """
+SELECT users.name,
+       COALESCE(leaderboard_overrides.total_override, standings.total) as total,
+       standings.wins,
+       standings.top5,
+       standings.top10
+FROM standings
+JOIN users ON users.id = standings.user_id
+LEFT JOIN leaderboard_overrides ON leaderboard_overrides.user_id = standings.user_id
+ORDER BY total DESC, users.name ASC
+"""
+
+# Source of truth for the standings table; used to rebuild and verify it.
+STANDINGS_AGGREGATE_SQL = """
+SELECT users.id as user_id,
+       COALESCE(SUM(results.purse), 0) as total,
+       COALESCE(SUM(CASE WHEN results.position = 1 THEN 1 ELSE 0 END), 0) as wins,
+       COALESCE(SUM(CASE WHEN results.position IS NOT NULL AND results.position <= 5 THEN 1 ELSE 0 END), 0) as top5,
+       COALESCE(SUM(CASE WHEN results.position IS NOT NULL AND results.position <= 10 THEN 1 ELSE 0 END), 0) as top10
+FROM users
+LEFT JOIN picks ON picks.user_id = users.id
+LEFT JOIN results ON results.tournament_id = picks.tournament_id AND results.golfer_id = picks.golfer_id
+GROUP BY users.id
+"""
+
+REBUILD_STANDINGS_SQL = (
+    "INSERT INTO standings (user_id, total, wins, top5, top10) "
+    f"SELECT user_id, total, wins, top5, top10 FROM ({STANDINGS_AGGREGATE_SQL})"
+)
+
+TODAY_TOURNAMENT_SQL = (
+    "SELECT * FROM tournaments WHERE start_date <= ? AND end_date >= ? ORDER BY start_date LIMIT 1"
+)
+NEXT_TOURNAMENT_SQL = "SELECT * FROM tournaments WHERE start_date > ? ORDER BY start_date LIMIT 1"
+TOURNAMENT_ORDER_SQL = (
+    "SELECT id, name, start_date, end_date, purse, is_major FROM tournaments ORDER BY start_date"
+)
+# The unary + keeps the planner from walking all of idx_tournaments_dates to
+# skip a sort; only upcoming rows are looked up by end_date, then sorted.
+SCHEDULE_SQL = (
+    "SELECT name, start_date, end_date, is_major, is_signature, purse "
+    "FROM tournaments WHERE end_date >= ? ORDER BY +start_date"
+)
+TOURNAMENT_BY_RAPID_ID_SQL = "SELECT id FROM tournaments WHERE rapid_tourn_id = ?"
+ACTIVE_GOLFERS_SQL = "SELECT id, name FROM golfers WHERE active = 1 ORDER BY name"
+GOLFER_ALREADY_PICKED_SQL = "SELECT 1 FROM picks WHERE user_id = ? AND golfer_id = ?"
+
+TOURNAMENT_PICKS_SQL = """
+SELECT users.name as user,
+       GROUP_CONCAT(golfers.name, '\n') as golfer_list
+FROM picks
+JOIN users ON users.id = picks.user_id
+JOIN golfers ON golfers.id = picks.golfer_id
+JOIN tournaments ON tournaments.id = picks.tournament_id
+WHERE tournaments.name = ?
+GROUP BY users.name
+ORDER BY users.name
+"""
+
+USER_TOURNAMENT_PICKS_SQL = """
+SELECT users.name as user, GROUP_CONCAT(golfers.name, ', ') as golfers
+FROM picks
+JOIN users ON users.id = picks.user_id
+JOIN golfers ON golfers.id = picks.golfer_id
+JOIN tournaments ON tournaments.id = picks.tournament_id
+WHERE users.name = ? AND tournaments.name = ?
+GROUP BY users.name
+"""
+
+DELETE_USER_TOURNAMENT_PICKS_SQL = (
+    "DELETE FROM picks WHERE user_id = (SELECT id FROM users WHERE name = ?) "
+    "AND tournament_id = (SELECT id FROM tournaments WHERE name = ?)"
+)
+
+PLAYER_PICKS_SQL = """
+SELECT tournaments.name as tournament, golfers.name as golfer, tournaments.start_date, tournaments.end_date
+FROM picks
+JOIN tournaments ON tournaments.id = picks.tournament_id
+JOIN golfers ON golfers.id = picks.golfer_id
+WHERE picks.user_id = ?
+ORDER BY tournaments.start_date
+"""
+
+# (name, sql, sample params, tables the query may SCAN). Anything but a SEARCH
+# is a full scan, including SCAN ... USING INDEX. Every SQL literal in the app
+# is checked by scripts/check_query_plans.py; one that scans must be listed
+# here with the table allowed, and each f-string query needs a rendering here.
+# Scans are only allowed where the query reads every row on purpose (sheet
+# exports, bulk imports, rebuilds, full lists) or the table stays tiny (users,
+# standings, data_versions, one sheets_outbox row per tab).
+QUERY_PLAN_CHECKS = [
+    ("leaderboard", LEADERBOARD_SQL, (), {"users", "standings"}),
+    ("standings aggregate", STANDINGS_AGGREGATE_SQL, (), {"users"}),
+    ("today tournament", TODAY_TOURNAMENT_SQL, ("2026-03-01", "2026-03-01"), set()),
+    ("next tournament", NEXT_TOURNAMENT_SQL, ("2026-03-01",), set()),
+    ("tournament order", TOURNAMENT_ORDER_SQL, (), {"tournaments"}),
+    ("schedule", SCHEDULE_SQL, ("2026-03-01",), set()),
+    ("tournament by rapid id", TOURNAMENT_BY_RAPID_ID_SQL, ("475",), set()),
+    ("tournament by name", "SELECT id FROM tournaments WHERE name = ?", ("WM Phoenix Open",), set()),
+    ("user by name", "SELECT id FROM users WHERE name = ?", ("Carl",), set()),
+    ("golfer by name", "SELECT id FROM golfers WHERE name = ?", ("Si Woo Kim",), set()),
+    ("active golfers", ACTIVE_GOLFERS_SQL, (), set()),
+    ("golfer already picked", GOLFER_ALREADY_PICKED_SQL, (1, 1), set()),
+    (
+        "user tournament picks",
+        "SELECT golfer_id FROM picks WHERE user_id = ? AND tournament_id = ? ORDER BY golfer_id",
+        (1, 1),
+        set(),
+    ),
+    ("picks by tournament", TOURNAMENT_PICKS_SQL, ("WM Phoenix Open",), set()),
+    ("pending delete picks", USER_TOURNAMENT_PICKS_SQL, ("Carl", "WM Phoenix Open"), set()),
+    ("delete user tournament picks", DELETE_USER_TOURNAMENT_PICKS_SQL, ("Carl", "WM Phoenix Open"), set()),
+    ("picks by player", PLAYER_PICKS_SQL, (1,), set()),
+    ("results by golfer", "SELECT tournament_id FROM results WHERE golfer_id = ?", (1,), set()),
+    (
+        "season bdl tournaments",
+        "SELECT id, name, bdl_id FROM tournaments WHERE season = ? AND bdl_id IS NOT NULL",
+        (2026,),
+        set(),
+    ),
+    ("golfers by name", "SELECT id, name, bdl_id FROM golfers WHERE name IN (?, ?)", ("Si Woo Kim", "Jason Day"), set()),
+    ("unpushed pick events", "SELECT * FROM pick_events WHERE pushed = 0 ORDER BY id", (), set()),
+    ("replayable pick events", "SELECT * FROM pick_events WHERE pushed = 0 AND id <= ? ORDER BY id", (10,), set()),
+    ("known pick events", "SELECT event_id FROM pick_events WHERE event_id IN (?, ?)", ("a1", "b2"), set()),
+    # Whole-table reads and writes.
+    *[(f"{name} sheet export", spec["sql"], (), {name}) for name, spec in SHEET_EXPORTS.items()],
+    *[(f"{table} name index", f"SELECT id, name FROM {table} ORDER BY id", (), {table}) for table in ("users", "tournaments", "golfers")],
+    ("rebuild standings", REBUILD_STANDINGS_SQL, (), {"users"}),
+    ("clear standings", "DELETE FROM standings", (), {"standings"}),
+    ("stored standings", "SELECT user_id, total, wins, top5, top10 FROM standings", (), {"standings"}),
+    ("data versions", "SELECT table_name, version FROM data_versions", (), {"data_versions"}),
+    ("seed user check", "SELECT COUNT(*) FROM users", (), {"users"}),
+    ("seed golfer check", "SELECT COUNT(*) FROM golfers", (), {"golfers"}),
+    ("empty picks check", "SELECT COUNT(*) FROM picks", (), {"picks"}),
+    ("seed tournament names", "SELECT id, name FROM tournaments", (), {"tournaments"}),
+    ("replace all picks", "DELETE FROM picks", (), {"picks"}),
+    ("results merge", "SELECT tournament_id, golfer_id, purse, position FROM results", (), {"results"}),
+    ("deactivate roster", "UPDATE golfers SET active = 0", (), {"golfers"}),
+    ("bdl golfer index", "SELECT id, name, bdl_id FROM golfers", (), {"golfers"}),
+    ("user list", "SELECT id, name FROM users", (), {"users"}),
+    ("user list by name", "SELECT id, name FROM users ORDER BY name", (), {"users"}),
+    ("login users", "SELECT id, name, is_admin, pin_hash FROM users ORDER BY name", (), {"users"}),
+    ("tournament dates", "SELECT id, name, start_date FROM tournaments ORDER BY start_date", (), {"tournaments"}),
+    (
+        "admin tournament order",
+        "SELECT id, name, start_date, end_date, is_major FROM tournaments ORDER BY start_date",
+        (),
+        {"tournaments"},
+    ),
+    ("results tournament order", "SELECT id, name, start_date, end_date FROM tournaments ORDER BY start_date", (), {"tournaments"}),
+    (
+        "due outbox rows",
+        "SELECT sheet_name, seq, attempts FROM sheets_outbox "
+        "WHERE next_attempt_at IS NULL OR next_attempt_at <= ? ORDER BY sheet_name",
+        ("2026-03-01T00:00:00",),
+        {"sheets_outbox"},
+    ),
+    (
+        "outbox status",
+        "SELECT COUNT(*) AS pending, MIN(enqueued_at) AS oldest, MAX(attempts) AS attempts, "
+        "MIN(next_attempt_at) AS next_attempt_at FROM sheets_outbox",
+        (),
+        {"sheets_outbox"},
+    ),
+    ("retry outbox now", "UPDATE sheets_outbox SET next_attempt_at = NULL", (), {"sheets_outbox"}),
+    (
+        "pick log status",
+        "SELECT COUNT(*) AS total, COALESCE(SUM(pushed = 0), 0) AS pending FROM pick_events",
+        (),
+        {"pick_events"},
+    ),
+    # Newest first by rowid; LIMIT stops the walk.
+    (
+        "recent sync conflicts",
+        "SELECT table_name, row_key, local_value, local_updated_at, remote_value, remote_updated_at, winner, "
+        "resolved_at FROM sync_conflicts ORDER BY id DESC LIMIT ?",
+        (50,),
+        {"sync_conflicts"},
+    ),
+    ("sync conflict count", "SELECT COUNT(*) FROM sync_conflicts", (), {"sync_conflicts"}),
+]
+
+
+def explain_query_plan(conn: sqlite3.Connection, sql: str, params: tuple = ()) -> list[str]:
+    return [row[3] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()]
+
+
+def normalize_sql(sql: str) -> str:
+    return " ".join(sql.split())
+
+
+def check_query_plans(
+    conn: sqlite3.Connection,
+    statements: list[tuple[str, str]] = (),
+    templates: list[tuple[str, str]] = (),
+) -> list[str]:
+    # statements/templates are the (location, sql) literals the app source
+    # contains (templates have {} placeholders). Unlisted statements are
+    # checked with no scans allowed, every template needs a listed rendering,
+    # and every listed query must still appear in the source.
+    listed = {normalize_sql(sql) for _, sql, _, _ in QUERY_PLAN_CHECKS}
+    source = {normalize_sql(sql) for _, sql in statements}
+    patterns = [
+        re.compile(".+".join(re.escape(part) for part in normalize_sql(text).split("{}")) + "$")
+        for _, text in templates
+    ]
+    problems = []
+    if statements or templates:
+        for name, sql, _, _ in QUERY_PLAN_CHECKS:
+            text = normalize_sql(sql)
+            if text not in source and not any(pattern.match(text) for pattern in patterns):
+                problems.append(f"{name}: listed but not found in the app source")
+        for (location, text), pattern in zip(templates, patterns):
+            if not any(pattern.match(query) for query in listed):
+                problems.append(f"{location}: no QUERY_PLAN_CHECKS entry renders {normalize_sql(text)!r}")
+    checks = list(QUERY_PLAN_CHECKS) + [
+        (location, sql, (None,) * sql.count("?"), set())
+        for location, sql in statements
+        if normalize_sql(sql) not in listed
+    ]
+    # Only SEARCH steps are index lookups. SCAN ... USING [COVERING] INDEX
+    # still walks every entry, so it counts as a full scan too.
+    for name, sql, params, allowed_scans in checks:
+        try:
+            details = explain_query_plan(conn, sql, params)
+        except sqlite3.Error as exc:
+            problems.append(f"{name}: cannot EXPLAIN ({exc}): {normalize_sql(sql)[:80]}")
+            continue
+        for detail in details:
+            match = re.match(r"SCAN (\w+)", detail)
+            if not match or detail == "SCAN CONSTANT ROW" or match.group(1) in allowed_scans:
+                continue
+            problems.append(f"{name}: {detail} in {normalize_sql(sql)[:80]}")
+    return problems
+
+
 def build_leaderboard(conn: sqlite3.Connection):
-    return conn.execute(
-        """
-        SELECT users.name,
-               COALESCE(leaderboard_overrides.total_override, COALESCE(SUM(results.purse), 0)) as total,
-               SUM(CASE WHEN results.position = 1 THEN 1 ELSE 0 END) as wins,
-               SUM(CASE WHEN results.position IS NOT NULL AND results.position <= 5 THEN 1 ELSE 0 END) as top5,
-               SUM(CASE WHEN results.position IS NOT NULL AND results.position <= 10 THEN 1 ELSE 0 END) as top10
-        FROM users
-        LEFT JOIN picks ON picks.user_id = users.id
-        LEFT JOIN results ON results.tournament_id = picks.tournament_id AND results.golfer_id = picks.golfer_id
-        LEFT JOIN leaderboard_overrides ON leaderboard_overrides.user_id = users.id
-        GROUP BY users.id
-        ORDER BY total DESC, users.name ASC
-        """
-    ).fetchall()
+    return conn.execute(LEADERBOARD_SQL).fetchall()
 
 
-def get_today_tournament(conn: sqlite3.Connection):
-    today = date.today().isoformat()
-    return conn.execute(
-        "SELECT * FROM tournaments WHERE start_date <= ? AND end_date >= ? ORDER BY start_date LIMIT 1",
-        (today, today),
-    ).fetchone()
+def rebuild_standings(conn: sqlite3.Connection) -> None:
+    conn.execute("DELETE FROM standings")
+    conn.execute(REBUILD_STANDINGS_SQL)
 
 
-def get_next_tournament(conn: sqlite3.Connection):
-    today = date.today().isoformat()
-    return conn.execute(
-        "SELECT * FROM tournaments WHERE start_date > ? ORDER BY start_date LIMIT 1",
-        (today,),
-    ).fetchone()
+def check_standings(conn: sqlite3.Connection) -> list[str]:
+    expected = {row["user_id"]: tuple(row)[1:] for row in conn.execute(STANDINGS_AGGREGATE_SQL).fetchall()}
+    actual = {
+        row["user_id"]: tuple(row)[1:]
+        for row in conn.execute("SELECT user_id, total, wins, top5, top10 FROM standings").fetchall()
+    }
+    names = {row["id"]: row["name"] for row in conn.execute("SELECT id, name FROM users").fetchall()}
+    problems = []
+    for user_id in sorted(set(expected) | set(actual)):
+        if expected.get(user_id) != actual.get(user_id):
+            problems.append(
+                f"{names.get(user_id, user_id)}: standings {actual.get(user_id)} != computed {expected.get(user_id)}"
+            )
+    return problems
+
+
+def get_today_tournament(conn: sqlite3.Connection, today: Optional[str] = None):
+    today = today or date.today().isoformat()
+    return conn.execute(TODAY_TOURNAMENT_SQL, (today, today)).fetchone()
+
+
+def get_next_tournament(conn: sqlite3.Connection, today: Optional[str] = None):
+    today = today or date.today().isoformat()
+    return conn.execute(NEXT_TOURNAMENT_SQL, (today,)).fetchone()
 
 
 def get_next_tournament_index(tournaments) -> int:
@@ -1621,9 +4577,9 @@ def login_gate(conn: sqlite3.Connection) -> None:
     pin = st.text_input("PIN (4–6 digits)", type="password", key="login_pin")
 
     if user["pin_hash"] is None:
-        if get_sheets_id() and not st.session_state.get("users_sync_attempted"):
+        if get_storage_backend() is not None and not st.session_state.get("users_sync_attempted"):
             st.session_state["users_sync_attempted"] = True
-            if sync_users_from_sheet(conn):
+            if sync_sheet_tables(conn, ["users"]):
                 refreshed_user = conn.execute(
                     "SELECT id, name, is_admin, pin_hash FROM users WHERE id = ?",
                     (user["id"],),
@@ -1641,7 +4597,6 @@ def login_gate(conn: sqlite3.Connection) -> None:
                     "UPDATE users SET pin_hash = ? WHERE id = ?",
                     (hash_pin(pin), user["id"]),
                 )
-                conn.commit()
                 persist_users(conn)
                 st.session_state["current_user_id"] = user["id"]
                 st.session_state["users_sync_attempted"] = False
@@ -1665,19 +4620,239 @@ def admin_gate():
     return
 
 
+PROFILE_HISTORY_SIZE = 200
+
+
+@st.cache_resource(show_spinner=False)
+def get_profile_store() -> dict:
+    return {
+        "lock": threading.Lock(),
+        "local": threading.local(),
+        "runs": deque(maxlen=PROFILE_HISTORY_SIZE),
+    }
+
+
+def count_sql_statement(local, statement: str) -> None:
+    # Statements run by triggers are reported with a leading "--" comment.
+    if not statement.startswith("--"):
+        local.sql_count = getattr(local, "sql_count", 0) + 1
+
+
+def record_network_call(count: int = 1) -> None:
+    local = get_profile_store()["local"]
+    local.net_count = getattr(local, "net_count", 0) + count
+
+
+def start_profile_run() -> None:
+    local = get_profile_store()["local"]
+    local.run = {
+        "started_at": datetime.utcnow().isoformat(),
+        "cold": False,
+        "phases": [],
+    }
+
+
+def mark_profile_cold_start() -> None:
+    run = getattr(get_profile_store()["local"], "run", None)
+    if run is not None:
+        run["cold"] = True
+
+
+def get_current_profile_run() -> Optional[dict]:
+    return getattr(get_profile_store()["local"], "run", None)
+
+
+@contextmanager
+def profile_phase(name: str):
+    local = get_profile_store()["local"]
+    run = getattr(local, "run", None)
+    if run is None:
+        yield
+        return
+    sql_before = getattr(local, "sql_count", 0)
+    net_before = getattr(local, "net_count", 0)
+    started = time_mod.perf_counter()
+    try:
+        yield
+    finally:
+        run["phases"].append(
+            {
+                "phase": name,
+                "ms": (time_mod.perf_counter() - started) * 1000,
+                "sql": getattr(local, "sql_count", 0) - sql_before,
+                "net": getattr(local, "net_count", 0) - net_before,
+            }
+        )
+
+
+def finish_profile_run() -> None:
+    store = get_profile_store()
+    run = getattr(store["local"], "run", None)
+    store["local"].run = None
+    if not run or not run["phases"]:
+        return
+    run["total_ms"] = sum(phase["ms"] for phase in run["phases"])
+    with store["lock"]:
+        store["runs"].append(run)
+
+
+def percentile(values: list, pct: float) -> float:
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize_profile_runs() -> list[dict]:
+    store = get_profile_store()
+    with store["lock"]:
+        runs = list(store["runs"])
+    by_phase: dict[str, list[dict]] = {}
+    for run in runs:
+        for phase in run["phases"]:
+            by_phase.setdefault(phase["phase"], []).append(phase)
+    summary = []
+    for name, samples in by_phase.items():
+        timings = [sample["ms"] for sample in samples]
+        summary.append(
+            {
+                "Phase": name,
+                "Runs": len(samples),
+                "p50 ms": round(percentile(timings, 50), 1),
+                "p95 ms": round(percentile(timings, 95), 1),
+                "Avg SQL": round(sum(sample["sql"] for sample in samples) / len(samples), 1),
+                "Avg network": round(sum(sample["net"] for sample in samples) / len(samples), 1),
+            }
+        )
+    summary.sort(key=lambda row: row["p95 ms"], reverse=True)
+    return summary
+
+
+def get_last_cold_start() -> Optional[dict]:
+    store = get_profile_store()
+    with store["lock"]:
+        cold_runs = [run for run in store["runs"] if run["cold"]]
+    return cold_runs[-1] if cold_runs else None
+
+
+def render_profile_table(phases: list[dict]) -> None:
+    st.dataframe(
+        [
+            {
+                "Phase": phase["phase"],
+                "ms": round(phase["ms"], 1),
+                "SQL": phase["sql"],
+                "Network": phase["net"],
+            }
+            for phase in phases
+        ],
+        use_container_width=True,
+        hide_index=True,
+    )
+
+
+def get_bootstrap_fingerprint() -> str:
+    payload = {
+        "schema": SCHEMA_VERSION,
+        "users": USERS,
+        "golfers": SEED_GOLFERS,
+        "tournaments": SEED_TOURNAMENTS,
+        "initial_picks": INITIAL_PICKS,
+        "recovery_picks": RECOVERY_PICKS,
+        "overrides": LEADERBOARD_TOTAL_OVERRIDES,
+    }
+    encoded = json.dumps(payload, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+# Streamlit re-executes this script on every rerun, so anything that must
+# survive across reruns lives in a cache_resource object (one per process).
+@st.cache_resource(show_spinner=False)
+def get_bootstrap_state() -> dict:
+    return {
+        "lock": threading.Lock(),
+        "env_loaded": False,
+        "completed": {},
+        "fingerprint": None,
+    }
+
+
+def ensure_env_loaded() -> None:
+    state = get_bootstrap_state()
+    if state["env_loaded"]:
+        return
+    with state["lock"]:
+        if not state["env_loaded"]:
+            load_env_file()
+            state["env_loaded"] = True
+
+
+def bootstrap_app(conn: sqlite3.Connection) -> bool:
+    state = get_bootstrap_state()
+    db_path = os.path.abspath(get_db_path())
+    if state["fingerprint"] is None:
+        state["fingerprint"] = get_bootstrap_fingerprint()
+    fingerprint = state["fingerprint"]
+    if state["completed"].get(db_path) == fingerprint:
+        return False
+    with state["lock"]:
+        if state["completed"].get(db_path) == fingerprint:
+            return False
+        mark_profile_cold_start()
+        with profile_phase("init_db"):
+            init_db(conn)
+        # Seeding is idempotent but expensive; only redo it when the seed data
+        # or schema changed since this database was last bootstrapped.
+        if get_sync_meta(conn, "bootstrap_fingerprint") != fingerprint:
+            with profile_phase("seed_if_needed"):
+                seed_if_needed(conn)
+                set_sync_meta(conn, "bootstrap_fingerprint", fingerprint)
+                conn.commit()
+        for name, hydrate in (
+            ("hydrate_users", hydrate_users),
+            ("hydrate_golfers", hydrate_golfers),
+            ("hydrate_picks", hydrate_picks),
+            ("hydrate_results", hydrate_results),
+        ):
+            with profile_phase(name):
+                hydrate(conn)
+        with profile_phase("reconcile_recovery_picks"):
+            reconcile_recovery_picks(conn)
+        state["completed"][db_path] = fingerprint
+    return True
+
+
 def maybe_run_scheduled_sync(conn: sqlite3.Connection):
     params = st.query_params
     token = os.getenv("SYNC_TOKEN")
+    if params.get("sync") == "season" and token and params.get("token") == token:
+        season = int(params.get("year") or 2026)
+        st.info(f"Running season sync for {season}...")
+        started = time_mod.perf_counter()
+        try:
+            report = sync_season_results(conn, season)
+        except Exception as exc:
+            st.error(f"Season sync failed: {exc}")
+            return
+        failed = [row for row in report if row["error"]]
+        message = (
+            f"Synced {sum(row['updated'] for row in report)} results across {len(report) - len(failed)} "
+            f"tournament(s) in {time_mod.perf_counter() - started:.1f}s."
+        )
+        if failed:
+            st.warning(f"{message} {len(failed)} tournament(s) failed.")
+        else:
+            st.success(message)
+        st.dataframe(report, use_container_width=True, hide_index=True)
+        return
     if params.get("sync") == "1" and token and params.get("token") == token:
         tourn_id = params.get("tournId")
         year = params.get("year")
         if not tourn_id or not year:
             st.error("Missing tournId or year for scheduled sync.")
             return
-        tournament = conn.execute(
-            "SELECT id FROM tournaments WHERE rapid_tourn_id = ?",
-            (tourn_id,),
-        ).fetchone()
+        tournament = conn.execute(TOURNAMENT_BY_RAPID_ID_SQL, (tourn_id,)).fetchone()
         if not tournament:
             st.error("Scheduled sync failed: tournament not found for tournId.")
             return
@@ -1691,1032 +4866,850 @@ def maybe_run_scheduled_sync(conn: sqlite3.Connection):
             st.error(f"Sync failed: {exc}")
 
 
-def main():
-    load_env_file()
-    st.set_page_config(page_title="SplatStack Sports", layout="wide")
-    admin_gate()
-
-    conn = get_conn()
-    init_db(conn)
-    seed_if_needed(conn)
-    hydrate_users(conn)
-    hydrate_golfers(conn)
-    hydrate_picks(conn)
-    hydrate_results(conn)
-    reconcile_recovery_picks(conn)
-
-    login_gate(conn)
-
-    current_user = get_current_user(conn)
-    # Sign out removed from UI (keep login flow only)
-
-    st.markdown(
-        textwrap.dedent(
-            """
-            <style>
-              :root {
-                --midnight-base: #0d0f14;
-                --midnight-slate: #1c222b;
-                --midnight-olive: #2a322c;
-                --midnight-gold: #c9a646;
-              }
-              html, body {
-                background: radial-gradient(1200px 600px at 10% 0%, var(--midnight-slate) 0%, var(--midnight-base) 60%) !important;
-                background-attachment: fixed !important;
-                overflow-x: hidden !important;
-              }
-              .stApp,
-              .st-emotion-cache-13k62yr {
-                background: radial-gradient(1200px 600px at 10% 0%, var(--midnight-slate) 0%, var(--midnight-base) 60%) !important;
-              }
-              [data-testid="stAppViewContainer"],
-              [data-testid="stAppViewContainer"] > .main,
-              [data-testid="stAppViewContainer"] > .main > div,
-              [data-testid="stAppViewContainer"] [data-testid="stAppViewBlockContainer"],
-              [data-testid="stAppViewContainer"] [data-testid="stAppViewBlockContainer"] > div,
-              section.main,
-              section.main > div {
-                background: transparent !important;
-              }
-              [class^="st-emotion-cache-"],
-              [class^="st-emotion-cache-"] > div {
-                background: transparent !important;
-              }
-              .st-emotion-cache-13k62yr > div {
-                background: transparent !important;
-              }
-              [data-testid="stHeader"], [data-testid="stToolbar"] {
-                background: transparent !important;
-              }
-              [data-testid="stHeader"] {
-                height: 0 !important;
-                min-height: 0 !important;
-              }
-              [data-testid="stHeader"] * {
-                display: none !important;
-              }
-              [data-testid="stToolbar"] {
-                height: 0 !important;
-                min-height: 0 !important;
-                display: none !important;
-              }
-              section.main > div {
-                padding-top: 0 !important;
-              }
-              [data-testid="stAppViewBlockContainer"] {
-                padding-top: 0 !important;
-                padding-bottom: 0 !important;
-              }
-              .brand-header {
-                margin-top: -48px;
-              }
-              @media (max-width: 700px) {
-                .brand-header {
-                  margin-top: -72px;
-                }
-              }
-              .block-container {
-                padding-top: 24px !important;
-              }
-              @media (max-width: 700px) {
-                .block-container {
-                  padding-top: 12px !important;
-                }
-              }
-              .brand-header {
-                display: flex;
-                align-items: center;
-                justify-content: center;
-                width: 100%;
-                margin: 0 0 6px 0;
-                padding: 0;
-              }
-              .brand-logo {
-                width: clamp(300px, 55vw, 520px);
-                height: auto;
-                display: block;
-              }
-              @media (max-width: 700px) {
-                .brand-logo {
-                  width: clamp(260px, 90vw, 420px);
-                }
-              }
-              .masters-board {
-                border: 2px solid #0c4b2b;
-                border-radius: 12px;
-                overflow: hidden;
-                background: #0c4b2b;
-              }
-              .masters-board table {
-                width: 100%;
-                border-collapse: collapse;
-                font-family: "Georgia", "Times New Roman", serif;
-                background: #f7f3e7;
-              }
-              .masters-board th {
-                background: #0c4b2b;
-                color: #f7f3e7;
-                text-align: left;
-                padding: 10px 12px;
-                font-size: 0.9rem;
-                letter-spacing: 0.04em;
-                text-transform: uppercase;
-              }
-              .masters-board td {
-                padding: 10px 12px;
-                border-bottom: 1px solid #e2dbc7;
-                color: #1f1f1b;
-              }
-              .masters-board tr:nth-child(even) td {
-                background: #fbf8ef;
-              }
-              .masters-board .player {
-                font-weight: 700;
-              }
-              .masters-board .money {
-                font-variant-numeric: tabular-nums;
-              }
-              .masters-board .badge {
-                display: inline-block;
-                padding: 2px 8px;
-                border-radius: 999px;
-                background: #f0c84b;
-                color: #1f1f1b;
-                font-size: 0.75rem;
-                font-weight: 700;
-              }
-              button[kind="secondary"] {
-                background: transparent !important;
-                border: none !important;
-                padding: 0 !important;
-                min-height: 0 !important;
-                height: auto !important;
-                box-shadow: none !important;
-              }
-              button[kind="secondary"] p {
-                font-size: 20px !important;
-                line-height: 1 !important;
-                margin: 0 !important;
-                letter-spacing: 2px;
-              }
-              button[kind="secondary"]:hover {
-                color: #f0c84b !important;
-                background: transparent !important;
-              }
-              button[kind="secondary"]:focus {
-                outline: none !important;
-                box-shadow: none !important;
-              }
-              .menu-inline {
-                display: flex;
-                gap: 8px;
-                align-items: center;
-              }
-              .schedule-list {
-                display: flex;
-                flex-direction: column;
-                gap: 14px;
-              }
-              .schedule-card {
-                border: 2px solid #0c4b2b;
-                border-radius: 12px;
-                padding: 12px 16px;
-                background: #f7f3e7;
-              }
-              .schedule-name {
-                font-weight: 700;
-                color: #0c4b2b;
-                letter-spacing: 0.02em;
-              }
-              .schedule-meta {
-                color: #0c4b2b;
-                margin-top: 4px;
-              }
-              .schedule-tag {
-                display: inline-block;
-                margin-left: 8px;
-                font-weight: 700;
-                color: #f0c84b;
-              }
-              .signout-inline {
-                position: fixed;
-                top: 18px;
-                right: 18px;
-                z-index: 1000;
-              }
-              div[data-testid="stHorizontalBlock"]:has(.picks-row-marker):not(:has(div[data-testid="stHorizontalBlock"])) {
-                border: 2px solid #0c4b2b;
-                border-radius: 999px;
-                padding: 10px 14px;
-                margin-bottom: 10px;
-                background: #f7f3e7;
-                display: flex;
-                align-items: center;
-                gap: 12px;
-                flex-wrap: nowrap;
-                max-width: 100%;
-                overflow: hidden;
-              }
-              div[data-testid="stHorizontalBlock"]:has(div[data-testid="stHorizontalBlock"]) {
-                background: transparent !important;
-                border: none !important;
-                padding: 0 !important;
-                border-radius: 0 !important;
-              }
-              @media (max-width: 900px) {
-                div[data-testid="stHorizontalBlock"]:has(div[data-testid="stHorizontalBlock"]):not(:has(.picks-row-marker)) {
-                  flex-direction: column !important;
-                }
-                div[data-testid="stHorizontalBlock"]:has(div[data-testid="stHorizontalBlock"]):not(:has(.picks-row-marker)) > div {
-                  width: 100% !important;
-                }
-              }
-              .picks-row-marker {
-                display: none;
-              }
-              div[data-testid="stHorizontalBlock"]:has(.picks-row-marker):not(:has(div[data-testid="stHorizontalBlock"])) .stMarkdown,
-              div[data-testid="stHorizontalBlock"]:has(.picks-row-marker):not(:has(div[data-testid="stHorizontalBlock"])) .stMarkdown > div,
-              div[data-testid="stHorizontalBlock"]:has(.picks-row-marker):not(:has(div[data-testid="stHorizontalBlock"])) .stMarkdown > div > div {
-                background: transparent !important;
-              }
-              div[data-testid="stHorizontalBlock"]:has(.picks-row-marker):not(:has(div[data-testid="stHorizontalBlock"])) > div {
-                padding: 0 !important;
-                min-width: 0 !important;
-                flex: 1 1 0;
-              }
-              .picks-user {
-                color: #0c4b2b;
-                font-weight: 700;
-                white-space: nowrap;
-              }
-              .picks-golfer {
-                color: #f0c84b;
-                font-weight: 700;
-                white-space: nowrap;
-                overflow: hidden;
-                text-overflow: ellipsis;
-              }
-              div[data-testid="stHorizontalBlock"]:has(.picks-row-marker):not(:has(div[data-testid="stHorizontalBlock"])) .picks-golfer {
-                flex: 1 1 auto;
-                min-width: 0;
-                text-align: right;
-              }
-              .picks-menu {
-                color: #0c4b2b;
-                font-weight: 700;
-              }
-              @media (max-width: 600px) {
-                div[data-testid="stHorizontalBlock"]:has(.picks-row-marker):not(:has(div[data-testid="stHorizontalBlock"])) {
-                  gap: 8px;
-                  padding: 8px 12px;
-                  flex-wrap: wrap;
-                }
-                div[data-testid="stHorizontalBlock"]:has(.picks-row-marker):not(:has(div[data-testid="stHorizontalBlock"])) .picks-golfer {
-                  white-space: normal;
-                  text-align: left;
-                  overflow-wrap: anywhere;
-                  word-break: break-word;
-                }
-              }
-            </style>
-            """
-        ),
-        unsafe_allow_html=True,
+def render_dashboard() -> None:
+    read_conn = get_read_conn()
+    st.subheader("Leaderboard")
+    leaderboard = cached_by_data_version(
+        read_conn,
+        "leaderboard",
+        ("users", "picks", "results", "leaderboard_overrides"),
+        lambda: build_leaderboard(read_conn),
     )
+    rows = []
+    for row in leaderboard:
+        rows.append(
+            f"<tr>"
+            f"<td class=\"player\">{row['name']}</td>"
+            f"<td class=\"money\">{format_money(row['total'])}</td>"
+            f"<td><span class=\"badge\">{row['wins']}</span></td>"
+            f"<td>{row['top5']}</td>"
+            f"<td>{row['top10']}</td>"
+            f"</tr>"
+        )
 
-    logo_path = os.path.join(os.path.dirname(__file__), "assets", "splatstack_logo.png")
-    st.markdown(
+    table_html = textwrap.dedent(
         f"""
-        <div class="brand-header">
-          <img src="data:image/png;base64,{img_to_base64(logo_path)}" class="brand-logo" alt="SplatStack Sports" />
+        <div class="masters-board">
+          <table>
+            <thead>
+              <tr>
+                <th>Player</th>
+                <th>Total</th>
+                <th>Wins</th>
+                <th>Top 5</th>
+                <th>Top 10</th>
+              </tr>
+            </thead>
+            <tbody>
+              {''.join(rows)}
+            </tbody>
+          </table>
         </div>
-        """,
-        unsafe_allow_html=True,
+        """
     )
-    # Subtitle removed per user preference.
+    st.markdown(table_html, unsafe_allow_html=True)
 
-    maybe_run_scheduled_sync(conn)
+    def tournament_badge(row):
+        if row["is_major"]:
+            return " **MAJOR**"
+        if row["is_signature"]:
+            return " **SIGNATURE**"
+        return ""
 
-    if is_admin(conn):
-        tab_dashboard, tab_picks, tab_tournaments, tab_players, tab_admin = st.tabs(
-            ["Dashboard", "Picks", "Schedule", "Players", "Admin"]
-        )
-    else:
-        tab_dashboard, tab_picks, tab_tournaments = st.tabs(
-            ["Dashboard", "Picks", "Schedule"]
-        )
-        tab_players = None
-        tab_admin = None
-
-    with tab_dashboard:
-        st.subheader("Leaderboard")
-        leaderboard = build_leaderboard(conn)
-        rows = []
-        for row in leaderboard:
-            rows.append(
-                f"<tr>"
-                f"<td class=\"player\">{row['name']}</td>"
-                f"<td class=\"money\">{format_money(row['total'])}</td>"
-                f"<td><span class=\"badge\">{row['wins']}</span></td>"
-                f"<td>{row['top5']}</td>"
-                f"<td>{row['top10']}</td>"
-                f"</tr>"
+    today_str = date.today().isoformat()
+    current = cached_by_data_version(
+        read_conn,
+        "today_tournament",
+        ("tournaments",),
+        lambda today: get_today_tournament(read_conn, today),
+        today_str,
+    )
+    next_up = cached_by_data_version(
+        read_conn,
+        "next_tournament",
+        ("tournaments",),
+        lambda today: get_next_tournament(read_conn, today),
+        today_str,
+    )
+    col_tournaments, col_rules = st.columns([2, 1])
+    with col_tournaments:
+        st.subheader("Current Tournament")
+        if current:
+            st.write(
+                f"{current['name']} ({format_short_date(current['start_date'])} to {format_short_date(current['end_date'])}){tournament_badge(current)}"
             )
-
-        table_html = textwrap.dedent(
-            f"""
-            <div class="masters-board">
-              <table>
-                <thead>
-                  <tr>
-                    <th>Player</th>
-                    <th>Total</th>
-                    <th>Wins</th>
-                    <th>Top 5</th>
-                    <th>Top 10</th>
-                  </tr>
-                </thead>
-                <tbody>
-                  {''.join(rows)}
-                </tbody>
-              </table>
-            </div>
-            """
-        )
-        st.markdown(table_html, unsafe_allow_html=True)
-
-        def tournament_badge(row):
-            if row["is_major"]:
-                return " **MAJOR**"
-            if row["is_signature"]:
-                return " **SIGNATURE**"
-            return ""
-
-        current = get_today_tournament(conn)
-        col_tournaments, col_rules = st.columns([2, 1])
-        with col_tournaments:
-            st.subheader("Current Tournament")
-            if current:
+            if next_up:
+                st.subheader("Upcoming Tournament")
                 st.write(
-                    f"{current['name']} ({format_short_date(current['start_date'])} to {format_short_date(current['end_date'])}){tournament_badge(current)}"
+                    f"{next_up['name']} ({format_short_date(next_up['start_date'])} to {format_short_date(next_up['end_date'])}){tournament_badge(next_up)}"
+                )
+        else:
+            if next_up:
+                st.write(
+                    f"Next up: {next_up['name']} ({format_short_date(next_up['start_date'])} to {format_short_date(next_up['end_date'])})"
                 )
-                next_up = get_next_tournament(conn)
-                if next_up:
-                    st.subheader("Upcoming Tournament")
-                    st.write(
-                        f"{next_up['name']} ({format_short_date(next_up['start_date'])} to {format_short_date(next_up['end_date'])}){tournament_badge(next_up)}"
-                    )
             else:
-                next_up = get_next_tournament(conn)
-                if next_up:
-                    st.write(
-                        f"Next up: {next_up['name']} ({format_short_date(next_up['start_date'])} to {format_short_date(next_up['end_date'])})"
-                    )
-                else:
-                    st.write("No tournament in progress today.")
+                st.write("No tournament in progress today.")
 
-        with col_rules:
-            st.subheader("Rules")
-            st.markdown(
-                "- One pick per tournament\n"
-                "- Majors = two picks\n"
-                "- One non-major double pick per season\n"
-                "- Picks lock Thursday 7:00 AM ET\n"
-                "- Earnings = leaderboard totals"
-            )
+    with col_rules:
+        st.subheader("Rules")
+        st.markdown(
+            "- One pick per tournament\n"
+            "- Majors = two picks\n"
+            "- One non-major double pick per season\n"
+            "- Picks lock Thursday 7:00 AM ET\n"
+            "- Earnings = leaderboard totals"
+        )
 
-    with tab_picks:
-        st.subheader("Weekly Picks")
-        current_user = get_current_user(conn)
-        current_user_name = current_user["name"] if current_user else None
-        admin_view = is_admin(conn)
-        tournament_order = conn.execute(
-            "SELECT id, name, start_date, end_date, purse, is_major FROM tournaments ORDER BY start_date"
-        ).fetchall()
-        week_map = {row["name"]: idx + 1 for idx, row in enumerate(tournament_order)}
-
-        # pick current tournament if in progress, otherwise next upcoming
-        next_index = get_current_or_next_tournament_index(tournament_order)
-
-        st.markdown("#### Picks By Tournament")
-        tournament_options = []
-        tournament_label_map = {}
-        for row in tournament_order:
-            label = (
-                f"Week {week_map.get(row['name'], '—')} — {row['name']} "
-                f"({format_short_date(row['start_date'])}–{format_short_date(row['end_date'])})"
-            )
-            tournament_options.append(label)
-            tournament_label_map[label] = row["name"]
-        default_label = tournament_options[next_index] if tournament_options else ""
-        if "picks_tournament_select" not in st.session_state:
-            st.session_state["picks_tournament_select"] = default_label
-        tournament_label = st.selectbox(
-            "Tournament",
-            tournament_options,
-            key="picks_tournament_select",
+
+@st.fragment
+def render_picks() -> None:
+    conn = get_conn()
+    st.subheader("Weekly Picks")
+    current_user = get_current_user(conn)
+    current_user_name = current_user["name"] if current_user else None
+    admin_view = is_admin(conn)
+    tournament_order = conn.execute(TOURNAMENT_ORDER_SQL).fetchall()
+    week_map = {row["name"]: idx + 1 for idx, row in enumerate(tournament_order)}
+
+    # pick current tournament if in progress, otherwise next upcoming
+    next_index = get_current_or_next_tournament_index(tournament_order)
+
+    st.markdown("#### Picks By Tournament")
+    tournament_options = []
+    tournament_label_map = {}
+    for row in tournament_order:
+        label = (
+            f"Week {week_map.get(row['name'], '—')} — {row['name']} "
+            f"({format_short_date(row['start_date'])}–{format_short_date(row['end_date'])})"
         )
-        selected_name = tournament_label_map.get(
-            tournament_label,
-            tournament_order[next_index]["name"] if tournament_order else "",
+        tournament_options.append(label)
+        tournament_label_map[label] = row["name"]
+    default_label = tournament_options[next_index] if tournament_options else ""
+    if "picks_tournament_select" not in st.session_state:
+        st.session_state["picks_tournament_select"] = default_label
+    tournament_label = st.selectbox(
+        "Tournament",
+        tournament_options,
+        key="picks_tournament_select",
+    )
+    selected_name = tournament_label_map.get(
+        tournament_label,
+        tournament_order[next_index]["name"] if tournament_order else "",
+    )
+    selected_tournament_row = next(
+        (row for row in tournament_order if row["name"] == selected_name),
+        None,
+    )
+    now_et = datetime.now(ZoneInfo("America/New_York"))
+    reveal_time = (
+        get_reveal_time(selected_tournament_row["start_date"])
+        if selected_tournament_row
+        else now_et
+    )
+    pending_delete_user = st.session_state.get("delete_user")
+    pending_delete_tourn = st.session_state.get("delete_tourn")
+    if pending_delete_user and pending_delete_tourn:
+        pick_row = conn.execute(
+            USER_TOURNAMENT_PICKS_SQL,
+            (pending_delete_user, pending_delete_tourn),
+        ).fetchone()
+        if pick_row:
+            st.warning(
+                f"Delete picks for {pick_row['user']} → {pick_row['golfers']}?"
+            )
+            col_confirm, col_cancel = st.columns([1, 1])
+            if col_confirm.button("Yes, delete", key="confirm_delete_pick", type="primary"):
+                conn.execute(
+                    DELETE_USER_TOURNAMENT_PICKS_SQL,
+                    (pending_delete_user, pending_delete_tourn),
+                )
+                persist_picks(conn)
+                st.session_state["delete_user"] = None
+                st.session_state["delete_tourn"] = None
+                st.success("Picks deleted.")
+            if col_cancel.button("Cancel", key="cancel_delete_pick", type="primary"):
+                st.session_state["delete_user"] = None
+                st.session_state["delete_tourn"] = None
+    tournament_picks = conn.execute(TOURNAMENT_PICKS_SQL, (selected_name,)).fetchall()
+    for row in tournament_picks:
+        show_locked = (
+            row["user"] != current_user_name
+            and now_et < reveal_time
         )
-        selected_tournament_row = next(
-            (row for row in tournament_order if row["name"] == selected_name),
-            None,
+        golfer_text = "🔒 Locked" if show_locked else (row["golfer_list"] or "").replace("\n", " / ")
+        can_manage = row["user"] == current_user_name and now_et < reveal_time
+        row_key = f"menu_pick_{row['user']}"
+        col_a, col_b, col_c = st.columns([2, 4, 1])
+        col_a.markdown(
+            f"<span class='picks-row-marker'></span><span class='picks-user'>{row['user']}</span>",
+            unsafe_allow_html=True,
         )
-        now_et = datetime.now(ZoneInfo("America/New_York"))
-        reveal_time = (
-            get_reveal_time(selected_tournament_row["start_date"])
-            if selected_tournament_row
-            else now_et
+        col_b.markdown(
+            f"<span class='picks-golfer'>{golfer_text}</span>",
+            unsafe_allow_html=True,
         )
-        pending_delete_user = st.session_state.get("delete_user")
-        pending_delete_tourn = st.session_state.get("delete_tourn")
-        if pending_delete_user and pending_delete_tourn:
-            pick_row = conn.execute(
-                "SELECT users.name as user, GROUP_CONCAT(golfers.name, ', ') as golfers\n"
-                "FROM picks\n"
-                "JOIN users ON users.id = picks.user_id\n"
-                "JOIN golfers ON golfers.id = picks.golfer_id\n"
-                "JOIN tournaments ON tournaments.id = picks.tournament_id\n"
-                "WHERE users.name = ? AND tournaments.name = ?\n"
-                "GROUP BY users.name",
-                (pending_delete_user, pending_delete_tourn),
-            ).fetchone()
-            if pick_row:
-                st.warning(
-                    f"Delete picks for {pick_row['user']} → {pick_row['golfers']}?"
-                )
-                col_confirm, col_cancel = st.columns([1, 1])
-                if col_confirm.button("Yes, delete", key="confirm_delete_pick", type="primary"):
-                    conn.execute(
-                        "DELETE FROM picks WHERE user_id = (SELECT id FROM users WHERE name = ?) "
-                        "AND tournament_id = (SELECT id FROM tournaments WHERE name = ?)",
-                        (pending_delete_user, pending_delete_tourn),
-                    )
-                    conn.commit()
-                    backup_ok = persist_picks(conn)
-                    st.session_state["delete_user"] = None
-                    st.session_state["delete_tourn"] = None
-                    if backup_ok:
-                        st.success("Picks deleted.")
-                    else:
-                        st.warning("Picks deleted locally, but Sheets backup failed. Do not reboot until this is fixed.")
-                if col_cancel.button("Cancel", key="cancel_delete_pick", type="primary"):
-                    st.session_state["delete_user"] = None
-                    st.session_state["delete_tourn"] = None
-        tournament_picks = conn.execute(
-            """
-            SELECT users.name as user,
-                   GROUP_CONCAT(golfers.name, '\n') as golfer_list
-            FROM picks
-            JOIN users ON users.id = picks.user_id
-            JOIN golfers ON golfers.id = picks.golfer_id
-            JOIN tournaments ON tournaments.id = picks.tournament_id
-            WHERE tournaments.name = ?
-            GROUP BY users.name
-            ORDER BY users.name
-            """,
-            (selected_name,),
-        ).fetchall()
-        for row in tournament_picks:
-            show_locked = (
-                row["user"] != current_user_name
-                and now_et < reveal_time
-            )
-            golfer_text = "🔒 Locked" if show_locked else (row["golfer_list"] or "").replace("\n", " / ")
-            can_manage = row["user"] == current_user_name and now_et < reveal_time
-            row_key = f"menu_pick_{row['user']}"
-            col_a, col_b, col_c = st.columns([2, 4, 1])
-            col_a.markdown(
-                f"<span class='picks-row-marker'></span><span class='picks-user'>{row['user']}</span>",
-                unsafe_allow_html=True,
-            )
-            col_b.markdown(
-                f"<span class='picks-golfer'>{golfer_text}</span>",
-                unsafe_allow_html=True,
-            )
-            with col_c:
-                if can_manage and st.button("...", key=row_key, type="secondary"):
-                    st.session_state["delete_user"] = row["user"]
-                    st.session_state["delete_tourn"] = selected_name
-
-        st.markdown("#### Make Your Pick")
-        if not current_user:
-            st.info("Log in to make your pick.")
+        with col_c:
+            if can_manage and st.button("...", key=row_key, type="secondary"):
+                st.session_state["delete_user"] = row["user"]
+                st.session_state["delete_tourn"] = selected_name
+
+    st.markdown("#### Make Your Pick")
+    if not current_user:
+        st.info("Log in to make your pick.")
+    else:
+        user_id = current_user["id"]
+        upcoming = [t for t in tournament_order if t["end_date"] >= date.today().isoformat()]
+        if not upcoming:
+            st.info("No upcoming tournaments.")
         else:
-            user_id = current_user["id"]
-            upcoming = [t for t in tournament_order if t["end_date"] >= date.today().isoformat()]
-            if not upcoming:
-                st.info("No upcoming tournaments.")
-            else:
-                pick_default_idx = get_current_or_next_tournament_index(upcoming)
-                pick_tournament_label = st.selectbox(
-                    "Tournament",
-                    [f"{t['name']} ({format_short_date(t['start_date'])}–{format_short_date(t['end_date'])})" for t in upcoming],
-                    index=pick_default_idx,
-                    key="user_pick_tournament",
+            pick_default_idx = get_current_or_next_tournament_index(upcoming)
+            pick_tournament_label = st.selectbox(
+                "Tournament",
+                [f"{t['name']} ({format_short_date(t['start_date'])}–{format_short_date(t['end_date'])})" for t in upcoming],
+                index=pick_default_idx,
+                key="user_pick_tournament",
+            )
+            selected_pick = upcoming[
+                [f"{t['name']} ({format_short_date(t['start_date'])}–{format_short_date(t['end_date'])})" for t in upcoming].index(pick_tournament_label)
+            ]
+            pick_is_major = bool(selected_pick["is_major"])
+            pick_is_free_double = is_free_double_pick_event(selected_pick)
+            pick_reveal_time = get_reveal_time(selected_pick["start_date"])
+            if now_et >= pick_reveal_time:
+                st.warning("Picks are locked for this tournament.")
+            golfers = conn.execute(ACTIVE_GOLFERS_SQL).fetchall()
+            golfer_name = st.selectbox("Golfer", [g["name"] for g in golfers], key="user_pick_golfer")
+            second_golfer_name = None
+            use_double_pick = False
+            if pick_is_major:
+                second_golfer_name = st.selectbox(
+                    "Second Golfer",
+                    [g["name"] for g in golfers],
+                    key="user_pick_second",
                 )
-                selected_pick = upcoming[
-                    [f"{t['name']} ({format_short_date(t['start_date'])}–{format_short_date(t['end_date'])})" for t in upcoming].index(pick_tournament_label)
-                ]
-                pick_is_major = bool(selected_pick["is_major"])
-                pick_is_free_double = is_free_double_pick_event(selected_pick)
-                pick_reveal_time = get_reveal_time(selected_pick["start_date"])
-                if now_et >= pick_reveal_time:
-                    st.warning("Picks are locked for this tournament.")
-                golfers = conn.execute(
-                    "SELECT id, name FROM golfers WHERE active = 1 ORDER BY name"
-                ).fetchall()
-                golfer_name = st.selectbox("Golfer", [g["name"] for g in golfers], key="user_pick_golfer")
-                second_golfer_name = None
-                use_double_pick = False
-                if pick_is_major:
-                    second_golfer_name = st.selectbox(
-                        "Second Golfer",
-                        [g["name"] for g in golfers],
-                        key="user_pick_second",
-                    )
-                elif pick_is_free_double:
+            elif pick_is_free_double:
+                second_golfer_name = st.selectbox(
+                    "Second Golfer",
+                    [g["name"] for g in golfers],
+                    key="user_pick_second",
+                )
+            else:
+                use_double_pick = st.checkbox("Use season double-pick (non-major)", key="user_double_pick")
+                if use_double_pick:
                     second_golfer_name = st.selectbox(
                         "Second Golfer",
                         [g["name"] for g in golfers],
                         key="user_pick_second",
                     )
+            if st.button("Save My Pick", type="primary", disabled=now_et >= pick_reveal_time):
+                golfer_id = next(g["id"] for g in golfers if g["name"] == golfer_name)
+                second_golfer_id = None
+                if second_golfer_name:
+                    second_golfer_id = next(g["id"] for g in golfers if g["name"] == second_golfer_name)
+                used = conn.execute(
+                    GOLFER_ALREADY_PICKED_SQL,
+                    (user_id, golfer_id),
+                ).fetchone()
+                if used:
+                    st.error("You already used this golfer.")
+                elif second_golfer_id and conn.execute(
+                    GOLFER_ALREADY_PICKED_SQL,
+                    (user_id, second_golfer_id),
+                ).fetchone():
+                    st.error("You already used the second golfer.")
+                elif second_golfer_id and second_golfer_id == golfer_id:
+                    st.error("Choose two different golfers.")
+                elif (
+                    use_double_pick
+                    and not pick_is_free_double
+                    and conn.execute(
+                        "SELECT double_pick_used FROM users WHERE id = ?",
+                        (user_id,),
+                    ).fetchone()[0] == 1
+                ):
+                    st.error("You already used the season double-pick.")
                 else:
-                    use_double_pick = st.checkbox("Use season double-pick (non-major)", key="user_double_pick")
-                    if use_double_pick:
-                        second_golfer_name = st.selectbox(
-                            "Second Golfer",
-                            [g["name"] for g in golfers],
-                            key="user_pick_second",
-                        )
-                if st.button("Save My Pick", type="primary", disabled=now_et >= pick_reveal_time):
-                    golfer_id = next(g["id"] for g in golfers if g["name"] == golfer_name)
-                    second_golfer_id = None
-                    if second_golfer_name:
-                        second_golfer_id = next(g["id"] for g in golfers if g["name"] == second_golfer_name)
-                    used = conn.execute(
-                        "SELECT 1 FROM picks WHERE user_id = ? AND golfer_id = ?",
-                        (user_id, golfer_id),
-                    ).fetchone()
-                    if used:
-                        st.error("You already used this golfer.")
-                    elif second_golfer_id and conn.execute(
-                        "SELECT 1 FROM picks WHERE user_id = ? AND golfer_id = ?",
-                        (user_id, second_golfer_id),
-                    ).fetchone():
-                        st.error("You already used the second golfer.")
-                    elif second_golfer_id and second_golfer_id == golfer_id:
-                        st.error("Choose two different golfers.")
-                    elif (
-                        use_double_pick
-                        and not pick_is_free_double
-                        and conn.execute(
-                            "SELECT double_pick_used FROM users WHERE id = ?",
-                            (user_id,),
-                        ).fetchone()[0] == 1
-                    ):
-                        st.error("You already used the season double-pick.")
-                    else:
-                        conn.execute(
-                            "DELETE FROM picks WHERE user_id = ? AND tournament_id = ?",
-                            (user_id, selected_pick["id"]),
-                        )
+                    users_changed = False
+                    conn.execute(
+                        "DELETE FROM picks WHERE user_id = ? AND tournament_id = ?",
+                        (user_id, selected_pick["id"]),
+                    )
+                    conn.execute(
+                        "INSERT INTO picks (user_id, tournament_id, golfer_id, created_at) VALUES (?, ?, ?, ?)",
+                        (user_id, selected_pick["id"], golfer_id, datetime.utcnow().isoformat()),
+                    )
+                    if second_golfer_id:
                         conn.execute(
                             "INSERT INTO picks (user_id, tournament_id, golfer_id, created_at) VALUES (?, ?, ?, ?)",
-                            (user_id, selected_pick["id"], golfer_id, datetime.utcnow().isoformat()),
+                            (user_id, selected_pick["id"], second_golfer_id, datetime.utcnow().isoformat()),
                         )
-                        if second_golfer_id:
+                        if (not pick_is_major) and (not pick_is_free_double) and use_double_pick:
                             conn.execute(
-                                "INSERT INTO picks (user_id, tournament_id, golfer_id, created_at) VALUES (?, ?, ?, ?)",
-                                (user_id, selected_pick["id"], second_golfer_id, datetime.utcnow().isoformat()),
+                                "UPDATE users SET double_pick_used = 1 WHERE id = ?",
+                                (user_id,),
                             )
-                            if (not pick_is_major) and (not pick_is_free_double) and use_double_pick:
-                                conn.execute(
-                                    "UPDATE users SET double_pick_used = 1 WHERE id = ?",
-                                    (user_id,),
-                                )
-                                persist_users(conn)
-                        conn.commit()
-                        backup_ok = persist_picks(conn)
-                        if backup_ok:
-                            st.success("Pick saved.")
-                        else:
-                            st.warning("Pick saved locally, but Sheets backup failed. Do not reboot until this is fixed.")
-                        st.rerun()
-
-        st.markdown("#### Picks By Player")
-        users = conn.execute("SELECT id, name FROM users ORDER BY name").fetchall()
-        user_label = st.selectbox("Player", [u["name"] for u in users], key="picks_user_select")
-        user_id = next(u["id"] for u in users if u["name"] == user_label)
-        user_picks = conn.execute(
-            """
-            SELECT tournaments.name as tournament, golfers.name as golfer, tournaments.start_date, tournaments.end_date
-            FROM picks
-            JOIN tournaments ON tournaments.id = picks.tournament_id
-            JOIN golfers ON golfers.id = picks.golfer_id
-            WHERE picks.user_id = ?
-            ORDER BY tournaments.start_date
-            """,
-            (user_id,),
-        ).fetchall()
-        is_own_player_view = user_label == current_user_name
-        st.dataframe(
-            [
-                {
-                    "Tournament": f"{row['tournament']} ({format_short_date(row['start_date'])}–{format_short_date(row['end_date'])})",
-                    "Golfer": (
-                        "Locked"
-                        if (
-                            not is_own_player_view
-                            and now_et < get_reveal_time(row["start_date"])
-                        )
-                        else row["golfer"]
-                    ),
-                }
-                for row in user_picks
-            ],
-            use_container_width=True,
-            hide_index=True,
-        )
+                            users_changed = True
+                    persist_picks(conn, include_users=users_changed)
+                    st.success("Pick saved.")
+                    st.rerun()
 
+    st.markdown("#### Picks By Player")
+    users = conn.execute("SELECT id, name FROM users ORDER BY name").fetchall()
+    user_label = st.selectbox("Player", [u["name"] for u in users], key="picks_user_select")
+    user_id = next(u["id"] for u in users if u["name"] == user_label)
+    user_picks = conn.execute(PLAYER_PICKS_SQL, (user_id,)).fetchall()
+    is_own_player_view = user_label == current_user_name
+    st.dataframe(
+        [
+            {
+                "Tournament": f"{row['tournament']} ({format_short_date(row['start_date'])}–{format_short_date(row['end_date'])})",
+                "Golfer": (
+                    "Locked"
+                    if (
+                        not is_own_player_view
+                        and now_et < get_reveal_time(row["start_date"])
+                    )
+                    else row["golfer"]
+                ),
+            }
+            for row in user_picks
+        ],
+        use_container_width=True,
+        hide_index=True,
+    )
 
-        # admin pick management moved to Admin tab
 
-    with tab_tournaments:
-        today_str = date.today().isoformat()
-        tournaments = conn.execute(
-            "SELECT name, start_date, end_date, is_major, is_signature, purse "
-            "FROM tournaments WHERE end_date >= ? ORDER BY start_date",
-            (today_str,),
-        ).fetchall()
-        cards = []
-        for row in tournaments:
-            tag = ""
-            if row["is_major"]:
-                tag = "M"
-            elif row["is_signature"]:
-                tag = "S"
-            tag_html = f'<span class="schedule-tag">({tag})</span>' if tag else ""
-            cards.append(
-                f"<div class=\"schedule-card\">"
-                f"<div class=\"schedule-name\">{row['name']}{tag_html}</div>"
-                f"<div class=\"schedule-meta\">{format_short_date(row['start_date'])} to {format_short_date(row['end_date'])}</div>"
-                f"<div class=\"schedule-meta\">{format_money(row['purse']) if row['purse'] else '—'}</div>"
-                f"</div>"
-            )
-        st.markdown(
-            f"<div class=\"schedule-list\">{''.join(cards)}</div>",
-            unsafe_allow_html=True,
+    # admin pick management moved to Admin tab
+
+
+def render_schedule() -> None:
+    read_conn = get_read_conn()
+    today_str = date.today().isoformat()
+    tournaments = cached_by_data_version(
+        read_conn,
+        "schedule",
+        ("tournaments",),
+        lambda today: read_conn.execute(SCHEDULE_SQL, (today,)).fetchall(),
+        today_str,
+    )
+    cards = []
+    for row in tournaments:
+        tag = ""
+        if row["is_major"]:
+            tag = "M"
+        elif row["is_signature"]:
+            tag = "S"
+        tag_html = f'<span class="schedule-tag">({tag})</span>' if tag else ""
+        cards.append(
+            f"<div class=\"schedule-card\">"
+            f"<div class=\"schedule-name\">{row['name']}{tag_html}</div>"
+            f"<div class=\"schedule-meta\">{format_short_date(row['start_date'])} to {format_short_date(row['end_date'])}</div>"
+            f"<div class=\"schedule-meta\">{format_money(row['purse']) if row['purse'] else '—'}</div>"
+            f"</div>"
         )
+    st.markdown(
+        f"<div class=\"schedule-list\">{''.join(cards)}</div>",
+        unsafe_allow_html=True,
+    )
 
-    if tab_players:
-        with tab_players:
-            st.subheader("Player Roster")
-            golfers = conn.execute(
-                "SELECT name FROM golfers WHERE active = 1 ORDER BY name"
-            ).fetchall()
-            golfer_names = [row["name"] for row in golfers]
-            st.selectbox("Search golfers", golfer_names)
-
-            if is_admin(conn):
-                st.markdown("#### Add Golfer")
-                gname = st.text_input("Golfer name")
-                if st.button("Add Golfer", type="primary"):
-                    if not gname.strip():
-                        st.error("Golfer name is required.")
-                    else:
-                        conn.execute(
-                            "INSERT INTO golfers (name, active) VALUES (?, 1) "
-                            "ON CONFLICT(name) DO UPDATE SET active = 1",
-                            (gname.strip(),),
-                        )
-                        conn.commit()
-                        if persist_golfers(conn):
-                            st.success("Golfer added.")
-                        else:
-                            st.warning("Golfer added locally, but roster backup failed. Avoid rebooting until Sheets is healthy.")
-                        st.rerun()
-
-                st.markdown("#### Bulk Import Golfers")
-                bulk_golfers = st.text_area("Paste golfers", height=160)
-                st.caption("Format: Name only OR Name, Rank, Points (Rank/Points optional)")
-                if st.button("Import Golfers", type="primary"):
-                    added_or_reactivated = 0
-                    for line in bulk_golfers.splitlines():
-                        parts = [p.strip() for p in line.split(",") if p.strip()]
-                        if not parts:
-                            continue
-                        name = parts[0]
-                        rank = int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else None
-                        points = int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else None
-                        conn.execute(
-                            "INSERT INTO golfers (name, fedex_rank, fedex_points, active) VALUES (?, ?, ?, 1) "
-                            "ON CONFLICT(name) DO UPDATE SET active = 1, fedex_rank = COALESCE(excluded.fedex_rank, golfers.fedex_rank), fedex_points = COALESCE(excluded.fedex_points, golfers.fedex_points)",
-                            (name, rank, points),
-                        )
-                        added_or_reactivated += 1
-                    conn.commit()
-                    if persist_golfers(conn):
-                        st.success(f"Imported {added_or_reactivated} golfer lines.")
-                    else:
-                        st.warning(
-                            f"Imported {added_or_reactivated} golfer lines locally, but roster backup failed. Avoid rebooting until Sheets is healthy."
-                        )
-                    st.rerun()
 
-                st.markdown("#### Replace Roster (Name Only)")
-                roster_text = st.text_area("Paste full roster (one golfer per line)", height=200, key="roster_replace")
-                st.caption("This will set all current golfers to inactive, then activate the pasted names.")
-                if st.button("Replace Roster", type="primary"):
-                    names = [line.strip() for line in roster_text.splitlines() if line.strip()]
-                    if not names:
-                        st.error("Paste at least one golfer.")
-                    else:
-                        conn.execute("UPDATE golfers SET active = 0")
-                        for name in names:
-                            conn.execute(
-                                "INSERT INTO golfers (name, active) VALUES (?, 1)\n"
-                                "ON CONFLICT(name) DO UPDATE SET active = 1, fedex_rank = NULL, fedex_points = NULL",
-                                (name,),
-                            )
-                        conn.commit()
-                        if persist_golfers(conn):
-                            st.success(f"Roster replaced with {len(names)} golfers.")
-                        else:
-                            st.warning(
-                                f"Roster replaced locally with {len(names)} golfers, but roster backup failed. Avoid rebooting until Sheets is healthy."
-                            )
-                        st.rerun()
-
-                st.markdown("#### Remove Golfers From Current Field")
-                active_for_removal = conn.execute(
-                    "SELECT name FROM golfers WHERE active = 1 ORDER BY name"
-                ).fetchall()
-                remove_choices = [row["name"] for row in active_for_removal]
-                remove_names = st.multiselect(
-                    "Select golfers to remove from active field",
-                    remove_choices,
-                    key="remove_golfers_active",
+@st.fragment
+def render_players() -> None:
+    conn = get_conn()
+    st.subheader("Player Roster")
+    golfers = conn.execute(
+        "SELECT name FROM golfers WHERE active = 1 ORDER BY name"
+    ).fetchall()
+    golfer_names = [row["name"] for row in golfers]
+    st.selectbox("Search golfers", golfer_names)
+
+    if is_admin(conn):
+        st.markdown("#### Add Golfer")
+        gname = st.text_input("Golfer name")
+        if st.button("Add Golfer", type="primary"):
+            if not gname.strip():
+                st.error("Golfer name is required.")
+            else:
+                conn.execute(
+                    "INSERT INTO golfers (name, active) VALUES (?, 1) "
+                    "ON CONFLICT(name) DO UPDATE SET active = 1",
+                    (gname.strip(),),
                 )
-                st.caption("This deactivates golfers from this week's field only. Historical picks/results remain intact.")
-                if st.button("Remove Selected Golfers", type="secondary"):
-                    if not remove_names:
-                        st.error("Select at least one golfer.")
-                    else:
-                        conn.executemany(
-                            "UPDATE golfers SET active = 0 WHERE name = ?",
-                            [(name,) for name in remove_names],
-                        )
-                        conn.commit()
-                        if persist_golfers(conn):
-                            st.success(f"Removed {len(remove_names)} golfer(s) from active field.")
-                        else:
-                            st.warning(
-                                f"Removed {len(remove_names)} golfer(s) locally, but roster backup failed. Avoid rebooting until Sheets is healthy."
-                            )
-                        st.rerun()
+                persist_golfers(conn)
+                st.success("Golfer added.")
+                st.rerun()
 
-    if tab_admin:
-        with tab_admin:
-            st.subheader("Admin Tools")
-            st.write("Admin owner: Carl")
+        st.markdown("#### Bulk Import Golfers")
+        bulk_golfers = st.text_area("Paste golfers", height=160)
+        st.caption("Format: Name only OR Name, Rank, Points (Rank/Points optional)")
+        if st.button("Import Golfers", type="primary"):
+            golfer_rows = []
+            for line in bulk_golfers.splitlines():
+                parts = [p.strip() for p in line.split(",") if p.strip()]
+                if not parts:
+                    continue
+                golfer_rows.append(
+                    {
+                        "name": parts[0],
+                        "fedex_rank": int(parts[1]) if len(parts) > 1 and parts[1].isdigit() else None,
+                        "fedex_points": int(parts[2]) if len(parts) > 2 and parts[2].isdigit() else None,
+                    }
+                )
+            added_or_reactivated = import_golfers(conn, golfer_rows)["imported"]
+            persist_golfers(conn)
+            st.success(f"Imported {added_or_reactivated} golfer lines.")
+            st.rerun()
 
-            if not is_admin(conn):
-                st.warning("Admin access required.")
+        st.markdown("#### Replace Roster (Name Only)")
+        roster_text = st.text_area("Paste full roster (one golfer per line)", height=200, key="roster_replace")
+        st.caption("This will set all current golfers to inactive, then activate the pasted names.")
+        if st.button("Replace Roster", type="primary"):
+            names = [line.strip() for line in roster_text.splitlines() if line.strip()]
+            if not names:
+                st.error("Paste at least one golfer.")
             else:
-                st.markdown("#### Storage Status")
-                sheet_id = get_sheets_id()
-                if sheet_id:
-                    st.success("Google Sheets storage: configured.")
-                    sheet_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/edit"
-                    st.markdown(f"[Open Picks Sheet]({sheet_url})")
-                    if SHEETS_LAST_ERROR:
-                        st.caption(f"Last Sheets error: {SHEETS_LAST_ERROR}")
-                else:
-                    st.info("Google Sheets storage: not configured. Using local backup.")
-
-                if st.button("Refresh Data From Sheets", type="primary"):
-                    clear_sheet_records_cache("picks")
-                    clear_sheet_records_cache("golfers")
-                    clear_sheet_records_cache("results")
-                    clear_sheet_records_cache("users")
-                    hydrate_users(conn)
-                    hydrate_golfers(conn)
-                    hydrate_picks(conn)
-                    hydrate_results(conn)
-                    st.success("Reloaded golfers/picks/results/users from Google Sheets.")
+                import_golfers(
+                    conn,
+                    [{"name": name} for name in names],
+                    deactivate_others=True,
+                    clear_stats=True,
+                )
+                persist_golfers(conn)
+                st.success(f"Roster replaced with {len(names)} golfers.")
+                st.rerun()
+
+        st.markdown("#### Remove Golfers From Current Field")
+        active_for_removal = conn.execute(
+            "SELECT name FROM golfers WHERE active = 1 ORDER BY name"
+        ).fetchall()
+        remove_choices = [row["name"] for row in active_for_removal]
+        remove_names = st.multiselect(
+            "Select golfers to remove from active field",
+            remove_choices,
+            key="remove_golfers_active",
+        )
+        st.caption("This deactivates golfers from this week's field only. Historical picks/results remain intact.")
+        if st.button("Remove Selected Golfers", type="secondary"):
+            if not remove_names:
+                st.error("Select at least one golfer.")
+            else:
+                conn.executemany(
+                    "UPDATE golfers SET active = 0 WHERE name = ?",
+                    [(name,) for name in remove_names],
+                )
+                persist_golfers(conn)
+                st.success(f"Removed {len(remove_names)} golfer(s) from active field.")
+                st.rerun()
+
+
+@st.fragment
+def render_admin() -> None:
+    conn = get_conn()
+    st.subheader("Admin Tools")
+    st.write("Admin owner: Carl")
+
+    if not is_admin(conn):
+        st.warning("Admin access required.")
+    else:
+        st.markdown("#### Storage Status")
+        backend = get_storage_backend()
+        if backend is not None:
+            st.success(f"Sheets storage backend: {backend.describe()}.")
+            sheet_id = get_sheets_id()
+            if isinstance(backend, GoogleSheetsBackend):
+                sheet_url = f"https://docs.google.com/spreadsheets/d/{sheet_id}/edit"
+                st.markdown(f"[Open Picks Sheet]({sheet_url})")
+            if SHEETS_LAST_ERROR:
+                st.caption(f"Last Sheets error: {SHEETS_LAST_ERROR}")
+            guard = get_sheets_guard_status()
+            breaker_text = {
+                "closed": "closed (healthy)",
+                "half_open": "half-open (probing)",
+                "open": f"open, serving local data; next probe in {guard['retry_in']:.0f}s",
+            }[guard["state"]]
+            st.caption(
+                f"Circuit breaker: {breaker_text}. Request budget: {guard['tokens']}/{guard['capacity']} per minute. "
+                f"Calls {guard['calls']}, rejected {guard['rejected']}, throttled {guard['throttled']}."
+            )
+            if guard["state"] != "closed":
+                st.caption(f"Last failure: {guard['last_failure']}")
+                if st.button("Reset Circuit Breaker"):
+                    reset_sheets_guard()
                     st.rerun()
+            outbox = get_outbox_status(conn)
+            if outbox["pending"]:
+                st.warning(
+                    f"Sheets outbox: {outbox['pending']} worksheet(s) waiting since {outbox['oldest']} UTC"
+                    + (f", retry {outbox['attempts']} at {outbox['next_attempt_at']} UTC" if outbox["attempts"] else "")
+                    + "."
+                )
+            else:
+                st.caption("Sheets outbox: empty.")
+            if outbox["last_flush_at"]:
+                status = "ok" if outbox["last_flush_ok"] else f"failed ({outbox['last_error']})"
+                st.caption(f"Last flush: {outbox['last_flush_at']} UTC, {status}. Worker {'running' if outbox['running'] else 'stopped'}.")
+            disk = SHEETS_CACHE["disk"]
+            if disk["saved_at"]:
+                st.caption(
+                    f"Record cache on disk: {disk['tabs']} tab(s), {disk['bytes'] / 1024:.1f} KB"
+                    + (f"; restart copy {disk['last_result']} at {disk['revalidated_at']} UTC" if disk["revalidated_at"] else "")
+                    + "."
+                )
+            event_counts = conn.execute(
+                "SELECT COUNT(*) AS total, COALESCE(SUM(pushed = 0), 0) AS pending FROM pick_events"
+            ).fetchone()
+            compacted_at = get_sync_meta(conn, "pick_events_compacted_at")
+            st.caption(
+                f"Pick event log: {event_counts['pending']} event(s) waiting to append, {event_counts['total']} known locally"
+                + (f"; last compacted {compacted_at} UTC" if compacted_at else "")
+                + "."
+            )
+            if st.button("Compact Pick Log"):
+                if compact_pick_events(conn):
+                    st.success("Pick log folded into the picks snapshot tab.")
+                else:
+                    st.error(f"Compaction failed: {SHEETS_LAST_ERROR}")
+            conflicts = get_sync_conflicts(conn)
+            conflict_total = conn.execute("SELECT COUNT(*) FROM sync_conflicts").fetchone()[0]
+            st.caption(f"Row sync: {conflict_total} conflict(s) resolved last-writer-wins.")
+            if conflicts:
+                with st.expander("Recent sync conflicts"):
+                    st.dataframe(
+                        [
+                            {
+                                "Table": row["table_name"],
+                                "Row": row["row_key"].replace(ROW_KEY_SEPARATOR, " / "),
+                                "Winner": row["winner"],
+                                "Local": row["local_value"],
+                                "Local At": row["local_updated_at"],
+                                "Sheet": row["remote_value"],
+                                "Sheet At": row["remote_updated_at"],
+                                "Resolved At": row["resolved_at"],
+                            }
+                            for row in conflicts
+                        ],
+                        hide_index=True,
+                        use_container_width=True,
+                    )
+            if outbox["pending"] and st.button("Flush Outbox Now"):
+                conn.execute("UPDATE sheets_outbox SET next_attempt_at = NULL")
+                conn.commit()
+                flushed = flush_outbox(conn)
+                if get_outbox_worker()["last_flush_ok"]:
+                    st.success(f"Flushed {flushed} worksheet(s).")
+                else:
+                    st.error(f"Flush failed: {get_outbox_worker()['last_error']}")
+        else:
+            st.info("Sheets storage: not configured. Using local backup.")
+
+        if st.button("Refresh Data From Sheets", type="primary"):
+            clear_sheet_records_cache("picks")
+            clear_sheet_records_cache("golfers")
+            clear_sheet_records_cache("results")
+            clear_sheet_records_cache("users")
+            hydrate_users(conn)
+            hydrate_golfers(conn)
+            hydrate_picks(conn)
+            hydrate_results(conn)
+            st.success("Reloaded golfers/picks/results/users from Google Sheets.")
+            st.rerun()
+
+        st.markdown("#### Standings")
+        st.caption("The leaderboard reads a standings table that triggers keep in sync with picks and results.")
+        col_check, col_rebuild = st.columns([1, 1])
+        if col_check.button("Check Standings", key="admin_check_standings"):
+            problems = check_standings(conn)
+            if problems:
+                st.warning(f"{len(problems)} standings row(s) out of sync.")
+                st.code("\n".join(problems))
+            else:
+                st.success("Standings match the computed leaderboard.")
+        if col_rebuild.button("Rebuild Standings", key="admin_rebuild_standings", type="primary"):
+            rebuild_standings(conn)
+            conn.commit()
+            st.success("Standings rebuilt from picks and results.")
+
+        st.markdown("#### Diagnostics")
+        st.caption("Per-phase timings for recent reruns in this process. Add ?profile=1 to the URL for a per-run overlay.")
+        profile_summary = summarize_profile_runs()
+        if profile_summary:
+            st.dataframe(profile_summary, use_container_width=True, hide_index=True)
+        else:
+            st.info("No runs recorded yet.")
+        cold_start = get_last_cold_start()
+        if cold_start:
+            st.markdown(
+                f"**Last cold start** ({cold_start['started_at']} UTC, {cold_start['total_ms']:.0f} ms)"
+            )
+            render_profile_table(cold_start["phases"])
+        http_summary = summarize_http_calls()
+        if http_summary:
+            st.markdown("**API requests** (pooled per host; retries honour Retry-After)")
+            st.dataframe(http_summary, use_container_width=True, hide_index=True)
+        http_cache = get_http_cache_status()
+        st.caption(
+            f"API response cache: {http_cache['hits']} hit(s), {http_cache['misses']} miss(es), "
+            f"{http_cache['revalidated']} revalidated (304), {http_cache['evicted']} evicted; "
+            f"{http_cache['entries']} response(s), {http_cache['bytes'] / 1024:.1f} KB on disk."
+        )
 
-                st.markdown("#### Pick Management")
-                users = conn.execute("SELECT id, name FROM users ORDER BY name").fetchall()
-                tournaments = conn.execute(
-                    "SELECT id, name, start_date, end_date, is_major FROM tournaments ORDER BY start_date"
-                ).fetchall()
-                golfers = conn.execute(
-                    "SELECT id, name FROM golfers WHERE active = 1 ORDER BY name"
-                ).fetchall()
-                admin_next_idx = get_current_or_next_tournament_index(tournaments)
-                col_pick_left, col_pick_right = st.columns([2, 3])
-                with col_pick_left:
-                    user_name = st.selectbox("User", [u["name"] for u in users], key="admin_pick_user")
-                    tournament_name = st.selectbox(
-                        "Tournament",
-                        [f"{t['name']} ({format_short_date(t['start_date'])}–{format_short_date(t['end_date'])})" for t in tournaments],
-                        index=admin_next_idx,
-                        key="admin_pick_tournament",
+        st.markdown("#### Pick Management")
+        users = conn.execute("SELECT id, name FROM users ORDER BY name").fetchall()
+        tournaments = conn.execute(
+            "SELECT id, name, start_date, end_date, is_major FROM tournaments ORDER BY start_date"
+        ).fetchall()
+        golfers = conn.execute(ACTIVE_GOLFERS_SQL).fetchall()
+        admin_next_idx = get_current_or_next_tournament_index(tournaments)
+        col_pick_left, col_pick_right = st.columns([2, 3])
+        with col_pick_left:
+            user_name = st.selectbox("User", [u["name"] for u in users], key="admin_pick_user")
+            tournament_name = st.selectbox(
+                "Tournament",
+                [f"{t['name']} ({format_short_date(t['start_date'])}–{format_short_date(t['end_date'])})" for t in tournaments],
+                index=admin_next_idx,
+                key="admin_pick_tournament",
+            )
+            golfer_name = st.selectbox("Golfer", [g["name"] for g in golfers], key="admin_pick_golfer")
+            selected_tournament = tournaments[
+                [f"{t['name']} ({format_short_date(t['start_date'])}–{format_short_date(t['end_date'])})" for t in tournaments].index(tournament_name)
+            ]
+            is_major = bool(selected_tournament["is_major"])
+            is_free_double = is_free_double_pick_event(selected_tournament)
+            st.caption("Major event" if is_major else "Regular event")
+            use_double_pick = False
+            if not is_major and not is_free_double:
+                use_double_pick = st.checkbox("Use season double-pick (non-major)", key="admin_use_double")
+            second_golfer_name = None
+            if is_major or is_free_double or use_double_pick:
+                second_golfer_name = st.selectbox(
+                    "Second Golfer",
+                    [g["name"] for g in golfers],
+                    key="admin_pick_second",
+                )
+            replace_existing = st.checkbox(
+                "Replace existing picks for this tournament",
+                value=True,
+                key="admin_replace_existing",
+            )
+            if st.button("Save Pick (Admin)", type="primary"):
+                user_id = next(u["id"] for u in users if u["name"] == user_name)
+                tournament_id = selected_tournament["id"]
+                golfer_id = next(g["id"] for g in golfers if g["name"] == golfer_name)
+                second_golfer_id = None
+                if second_golfer_name:
+                    second_golfer_id = next(g["id"] for g in golfers if g["name"] == second_golfer_name)
+                if replace_existing:
+                    conn.execute(
+                        "DELETE FROM picks WHERE user_id = ? AND tournament_id = ?",
+                        (user_id, tournament_id),
                     )
-                    golfer_name = st.selectbox("Golfer", [g["name"] for g in golfers], key="admin_pick_golfer")
-                    selected_tournament = tournaments[
-                        [f"{t['name']} ({format_short_date(t['start_date'])}–{format_short_date(t['end_date'])})" for t in tournaments].index(tournament_name)
-                    ]
-                    is_major = bool(selected_tournament["is_major"])
-                    is_free_double = is_free_double_pick_event(selected_tournament)
-                    st.caption("Major event" if is_major else "Regular event")
-                    use_double_pick = False
-                    if not is_major and not is_free_double:
-                        use_double_pick = st.checkbox("Use season double-pick (non-major)", key="admin_use_double")
-                    second_golfer_name = None
-                    if is_major or is_free_double or use_double_pick:
-                        second_golfer_name = st.selectbox(
-                            "Second Golfer",
-                            [g["name"] for g in golfers],
-                            key="admin_pick_second",
-                        )
-                    replace_existing = st.checkbox(
-                        "Replace existing picks for this tournament",
-                        value=True,
-                        key="admin_replace_existing",
+                if conn.execute(
+                    GOLFER_ALREADY_PICKED_SQL,
+                    (user_id, golfer_id),
+                ).fetchone():
+                    st.error("User already used this golfer.")
+                elif second_golfer_id and conn.execute(
+                    GOLFER_ALREADY_PICKED_SQL,
+                    (user_id, second_golfer_id),
+                ).fetchone():
+                    st.error("User already used the second golfer.")
+                elif second_golfer_id and second_golfer_id == golfer_id:
+                    st.error("Choose two different golfers.")
+                elif (
+                    use_double_pick
+                    and not is_free_double
+                    and conn.execute(
+                    "SELECT double_pick_used FROM users WHERE id = ?",
+                    (user_id,),
+                ).fetchone()[0] == 1
+                ):
+                    st.error("User already used the season double-pick.")
+                else:
+                    users_changed = False
+                    conn.execute(
+                        "INSERT INTO picks (user_id, tournament_id, golfer_id, created_at) VALUES (?, ?, ?, ?)",
+                        (user_id, tournament_id, golfer_id, datetime.utcnow().isoformat()),
                     )
-                    if st.button("Save Pick (Admin)", type="primary"):
-                        user_id = next(u["id"] for u in users if u["name"] == user_name)
-                        tournament_id = selected_tournament["id"]
-                        golfer_id = next(g["id"] for g in golfers if g["name"] == golfer_name)
-                        second_golfer_id = None
-                        if second_golfer_name:
-                            second_golfer_id = next(g["id"] for g in golfers if g["name"] == second_golfer_name)
-                        if replace_existing:
-                            conn.execute(
-                                "DELETE FROM picks WHERE user_id = ? AND tournament_id = ?",
-                                (user_id, tournament_id),
-                            )
-                        if conn.execute(
-                            "SELECT 1 FROM picks WHERE user_id = ? AND golfer_id = ?",
-                            (user_id, golfer_id),
-                        ).fetchone():
-                            st.error("User already used this golfer.")
-                        elif second_golfer_id and conn.execute(
-                            "SELECT 1 FROM picks WHERE user_id = ? AND golfer_id = ?",
-                            (user_id, second_golfer_id),
-                        ).fetchone():
-                            st.error("User already used the second golfer.")
-                        elif second_golfer_id and second_golfer_id == golfer_id:
-                            st.error("Choose two different golfers.")
-                        elif (
-                            use_double_pick
-                            and not is_free_double
-                            and conn.execute(
-                            "SELECT double_pick_used FROM users WHERE id = ?",
-                            (user_id,),
-                        ).fetchone()[0] == 1
-                        ):
-                            st.error("User already used the season double-pick.")
-                        else:
-                            conn.execute(
-                                "INSERT INTO picks (user_id, tournament_id, golfer_id, created_at) VALUES (?, ?, ?, ?)",
-                                (user_id, tournament_id, golfer_id, datetime.utcnow().isoformat()),
-                            )
-                            if second_golfer_id:
-                                conn.execute(
-                                    "INSERT INTO picks (user_id, tournament_id, golfer_id, created_at) VALUES (?, ?, ?, ?)",
-                                    (user_id, tournament_id, second_golfer_id, datetime.utcnow().isoformat()),
-                                )
-                                if (not is_major) and (not is_free_double) and use_double_pick:
-                                    conn.execute(
-                                        "UPDATE users SET double_pick_used = 1 WHERE id = ?",
-                                        (user_id,),
-                                    )
-                                    persist_users(conn)
-                            conn.commit()
-                            backup_ok = persist_picks(conn)
-                            if backup_ok:
-                                st.success("Pick saved.")
-                            else:
-                                st.warning("Pick saved locally, but Sheets backup failed. Do not reboot until this is fixed.")
-                            st.rerun()
-                    if st.button("Delete Picks (Admin)", key="admin_delete_picks", type="secondary"):
-                        user_id = next(u["id"] for u in users if u["name"] == user_name)
-                        tournament_id = selected_tournament["id"]
+                    if second_golfer_id:
                         conn.execute(
-                            "DELETE FROM picks WHERE user_id = ? AND tournament_id = ?",
-                            (user_id, tournament_id),
+                            "INSERT INTO picks (user_id, tournament_id, golfer_id, created_at) VALUES (?, ?, ?, ?)",
+                            (user_id, tournament_id, second_golfer_id, datetime.utcnow().isoformat()),
                         )
-                        conn.commit()
-                        backup_ok = persist_picks(conn)
-                        if backup_ok:
-                            st.success("Picks deleted.")
-                        else:
-                            st.warning("Picks deleted locally, but Sheets backup failed. Do not reboot until this is fixed.")
-                        st.rerun()
-                with col_pick_right:
-                    st.markdown("**Admin Notes**")
-                    st.caption("Use this panel to edit picks for any player, even after lock.")
-
-                st.markdown("#### Results Entry")
-            tournaments = conn.execute("SELECT id, name, start_date, end_date FROM tournaments ORDER BY start_date").fetchall()
-            golfers = conn.execute("SELECT id, name FROM golfers WHERE active = 1 ORDER BY name").fetchall()
-            admin_default_idx = get_current_or_next_tournament_index(tournaments)
-
-            col_a, col_b = st.columns([2, 3])
-            with col_a:
-                st.markdown("**Single Result**")
-                t_name = st.selectbox(
-                    "Tournament",
-                    [t["name"] for t in tournaments],
-                    index=admin_default_idx,
-                    key="admin_res_t",
-                )
-                g_name = st.selectbox("Golfer", [g["name"] for g in golfers], key="admin_res_g")
-                purse = st.number_input("Purse (USD)", min_value=0, step=1000, key="admin_res_purse")
-                position = st.number_input("Finish position", min_value=1, step=1, key="admin_res_pos")
-                if st.button("Save Result", key="admin_res_save", type="primary"):
-                    t_id = next(t["id"] for t in tournaments if t["name"] == t_name)
-                    g_id = next(g["id"] for g in golfers if g["name"] == g_name)
-                    conn.execute(
-                        "INSERT INTO results (tournament_id, golfer_id, purse, position) VALUES (?, ?, ?, ?)"
-                        " ON CONFLICT(tournament_id, golfer_id) DO UPDATE SET purse = excluded.purse, position = excluded.position",
-                        (t_id, g_id, int(purse), int(position)),
-                    )
-                    conn.commit()
-                    if persist_results(conn):
-                        st.success("Result saved.")
-                    else:
-                        st.warning("Result saved locally, but Sheets backup failed. Avoid rebooting until backup is healthy.")
-
-            with col_b:
-                st.markdown("**Paste From Clipboard**")
-                st.caption("Paste results: \"3 Jake Knapp $400,987\" (position, name, purse). One per line.")
-                tournament_for_clip = st.selectbox(
-                    "Tournament (for clipboard import)",
-                    [t["name"] for t in tournaments],
-                    index=admin_default_idx,
-                    key="admin_clip_tournament",
+                        if (not is_major) and (not is_free_double) and use_double_pick:
+                            conn.execute(
+                                "UPDATE users SET double_pick_used = 1 WHERE id = ?",
+                                (user_id,),
+                            )
+                            users_changed = True
+                    persist_picks(conn, include_users=users_changed)
+                    st.success("Pick saved.")
+                    st.rerun()
+            if st.button("Delete Picks (Admin)", key="admin_delete_picks", type="secondary"):
+                user_id = next(u["id"] for u in users if u["name"] == user_name)
+                tournament_id = selected_tournament["id"]
+                conn.execute(
+                    "DELETE FROM picks WHERE user_id = ? AND tournament_id = ?",
+                    (user_id, tournament_id),
                 )
-                clipboard_text = st.text_area("Paste results text", height=180, key="admin_clip_text")
-                if st.button("Preview Clipboard Parse", key="admin_clip_preview", type="primary"):
-                    rows, errors = parse_clipboard_results(clipboard_text)
-                    st.session_state["admin_clip_rows"] = rows
-                    st.session_state["admin_clip_errors"] = errors
-
-                rows = st.session_state.get("admin_clip_rows", [])
-                errors = st.session_state.get("admin_clip_errors", [])
-                if rows:
-                    st.markdown("**Parsed rows preview**")
-                    st.dataframe(
+                persist_picks(conn)
+                st.success("Picks deleted.")
+                st.rerun()
+        with col_pick_right:
+            st.markdown("**Admin Notes**")
+            st.caption("Use this panel to edit picks for any player, even after lock.")
+
+        st.markdown("#### Results Entry")
+    tournaments = conn.execute("SELECT id, name, start_date, end_date FROM tournaments ORDER BY start_date").fetchall()
+    golfers = conn.execute(ACTIVE_GOLFERS_SQL).fetchall()
+    admin_default_idx = get_current_or_next_tournament_index(tournaments)
+
+    col_a, col_b = st.columns([2, 3])
+    with col_a:
+        st.markdown("**Single Result**")
+        t_name = st.selectbox(
+            "Tournament",
+            [t["name"] for t in tournaments],
+            index=admin_default_idx,
+            key="admin_res_t",
+        )
+        g_name = st.selectbox("Golfer", [g["name"] for g in golfers], key="admin_res_g")
+        purse = st.number_input("Purse (USD)", min_value=0, step=1000, key="admin_res_purse")
+        position = st.number_input("Finish position", min_value=1, step=1, key="admin_res_pos")
+        if st.button("Save Result", key="admin_res_save", type="primary"):
+            t_id = next(t["id"] for t in tournaments if t["name"] == t_name)
+            g_id = next(g["id"] for g in golfers if g["name"] == g_name)
+            conn.execute(
+                "INSERT INTO results (tournament_id, golfer_id, purse, position) VALUES (?, ?, ?, ?)"
+                " ON CONFLICT(tournament_id, golfer_id) DO UPDATE SET purse = excluded.purse, position = excluded.position",
+                (t_id, g_id, int(purse), int(position)),
+            )
+            persist_results(conn)
+            st.success("Result saved.")
+
+    with col_b:
+        st.markdown("**Paste From Clipboard**")
+        st.caption("Paste results: \"3 Jake Knapp $400,987\" (position, name, purse). One per line.")
+        tournament_for_clip = st.selectbox(
+            "Tournament (for clipboard import)",
+            [t["name"] for t in tournaments],
+            index=admin_default_idx,
+            key="admin_clip_tournament",
+        )
+        clipboard_text = st.text_area("Paste results text", height=180, key="admin_clip_text")
+        if st.button("Preview Clipboard Parse", key="admin_clip_preview", type="primary"):
+            rows, errors = parse_clipboard_results(clipboard_text)
+            st.session_state["admin_clip_rows"] = rows
+            st.session_state["admin_clip_errors"] = errors
+
+        rows = st.session_state.get("admin_clip_rows", [])
+        errors = st.session_state.get("admin_clip_errors", [])
+        if rows:
+            st.markdown("**Parsed rows preview**")
+            st.dataframe(
+                [
+                    {"Golfer": r[0], "Position": r[1] or "—", "Purse": r[2]}
+                    for r in rows
+                ],
+                use_container_width=True,
+            )
+        if errors:
+            st.warning(f"Skipped {len(errors)} lines (could not parse).")
+
+        if st.button("Import Clipboard Results", key="admin_clip_import", type="primary"):
+            if not rows:
+                st.error("No parsed rows. Click Preview Clipboard Parse first.")
+            else:
+                t = conn.execute(
+                    "SELECT id FROM tournaments WHERE name = ?",
+                    (tournament_for_clip,),
+                ).fetchone()
+                if not t:
+                    st.error("Tournament not found.")
+                else:
+                    report = import_results(
+                        conn,
                         [
-                            {"Golfer": r[0], "Position": r[1] or "—", "Purse": r[2]}
-                            for r in rows
+                            {"tournament": tournament_for_clip, "golfer": name, "purse": purse_value, "position": pos}
+                            for name, pos, purse_value in rows
                         ],
-                        use_container_width=True,
+                        create_golfers=False,
                     )
-                if errors:
-                    st.warning(f"Skipped {len(errors)} lines (could not parse).")
-
-                if st.button("Import Clipboard Results", key="admin_clip_import", type="primary"):
-                    if not rows:
-                        st.error("No parsed rows. Click Preview Clipboard Parse first.")
-                    else:
-                        t = conn.execute(
-                            "SELECT id FROM tournaments WHERE name = ?",
-                            (tournament_for_clip,),
-                        ).fetchone()
-                        if not t:
-                            st.error("Tournament not found.")
-                        else:
-                            imported = 0
-                            for name, pos, purse_value in rows:
-                                golfer = conn.execute(
-                                    "SELECT id FROM golfers WHERE name = ?",
-                                    (name,),
-                                ).fetchone()
-                                if not golfer:
-                                    continue
-                                purse_clean = int(float(str(purse_value).replace("$", "").replace(",", "")))
-                                position_value = int(pos) if pos and str(pos).isdigit() else None
-                                conn.execute(
-                                    "INSERT INTO results (tournament_id, golfer_id, purse, position) VALUES (?, ?, ?, ?)"
-                                    " ON CONFLICT(tournament_id, golfer_id) DO UPDATE SET purse = excluded.purse, position = excluded.position",
-                                    (t["id"], golfer["id"], purse_clean, position_value),
-                                )
-                                imported += 1
-                            conn.commit()
-                            if persist_results(conn):
-                                st.success(f"Imported {imported} results from clipboard.")
-                            else:
-                                st.warning(
-                                    f"Imported {imported} results locally, but Sheets backup failed. Avoid rebooting until backup is healthy."
-                                )
+                    imported = report["imported"]
+                    if report["unresolved"]:
+                        st.warning(f"Skipped {len(report['unresolved'])} row(s): {describe_unresolved(report)}")
+                    persist_results(conn)
+                    st.success(f"Imported {imported} results from clipboard.")
+
+
+def get_nav_mode() -> str:
+    return os.getenv("GOLF_NAV_MODE", "lazy").strip().lower()
+
+
+def main():
+    start_profile_run()
+    with profile_phase("env_load"):
+        ensure_env_loaded()
+    st.set_page_config(page_title="SplatStack Sports", layout="wide")
+    admin_gate()
+
+    with profile_phase("connect"):
+        conn = get_conn()
+    bootstrap_app(conn)
+    ensure_outbox_worker()
+
+    with profile_phase("login_gate"):
+        login_gate(conn)
+
+    # Sign out removed from UI (keep login flow only)
+
+    theme_css = get_text_asset("theme.css", minify=minify_css)
+    st.markdown(f"<style data-asset=\"{theme_css['hash']}\">{theme_css['text']}</style>", unsafe_allow_html=True)
+
+    st.markdown(
+        f"""
+        <div class="brand-header">
+          <img src="{get_asset_url("splatstack_logo.png")}" class="brand-logo" alt="SplatStack Sports" />
+        </div>
+        """,
+        unsafe_allow_html=True,
+    )
+    # Subtitle removed per user preference.
+
+    maybe_run_scheduled_sync(conn)
+
+    sections = {
+        "Dashboard": render_dashboard,
+        "Picks": render_picks,
+        "Schedule": render_schedule,
+    }
+    if is_admin(conn):
+        sections["Players"] = render_players
+        sections["Admin"] = render_admin
+
+    if get_nav_mode() == "tabs":
+        # Eager mode: every section runs on every rerun, as st.tabs requires.
+        for tab, (name, render) in zip(st.tabs(list(sections)), sections.items()):
+            with tab, profile_phase(f"section:{name}"):
+                render()
+    else:
+        if st.session_state.get("nav_section") not in sections:
+            st.session_state["nav_section"] = "Dashboard"
+        section = st.radio(
+            "Section",
+            list(sections),
+            horizontal=True,
+            key="nav_section",
+            label_visibility="collapsed",
+        )
+        with profile_phase(f"section:{section}"):
+            sections[section]()
+
+    if st.query_params.get("profile") == "1" and is_admin(conn):
+        run = get_current_profile_run()
+        with st.expander("Profile (this run)", expanded=True):
+            if run:
+                render_profile_table(run["phases"])
 
     st.markdown(
         "<div style='margin-top: 32px; color: #8c939c; font-size: 12px;'>© 2026 SplatStack</div>",
@@ -2725,4 +5718,8 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    try:
+        main()
+    finally:
+        finish_profile_run()
+        release_thread_connections()